@@ -7,10 +7,12 @@ from collections import OrderedDict
 from collections.abc import Mapping
 from datetime import datetime, timedelta
 from functools import partial
+import hashlib
 import time
 from typing import Any, cast
 
 import jwt
+from lru import LRU
 
 from homeassistant.core import (
     CALLBACK_TYPE,
@@ -24,7 +26,12 @@ from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.util import dt as dt_util
 
 from . import auth_store, jwt_wrapper, models
-from .const import ACCESS_TOKEN_EXPIRATION, GROUP_ID_ADMIN, REFRESH_TOKEN_EXPIRATION
+from .const import (
+    ACCESS_TOKEN_CACHE_SIZE,
+    ACCESS_TOKEN_EXPIRATION,
+    GROUP_ID_ADMIN,
+    REFRESH_TOKEN_EXPIRATION,
+)
 from .mfa_modules import MultiFactorAuthModule, auth_mfa_module_from_config
 from .models import AuthFlowContext, AuthFlowResult
 from .providers import AuthProvider, LoginFlow, auth_provider_from_config
@@ -188,6 +195,10 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, set[CALLBACK_TYPE]] = {}
+        # Hash of verified access tokens -> refresh token id and expiration
+        self._access_token_cache: LRU[bytes, tuple[str, float]] = LRU(
+            ACCESS_TOKEN_CACHE_SIZE
+        )
         self._expire_callback: CALLBACK_TYPE | None = None
         self._remove_expired_job = HassJob(
             self._async_remove_expired_refresh_tokens, job_type=HassJobType.Callback
@@ -650,7 +661,23 @@ class AuthManager:
 
     @callback
     def async_validate_access_token(self, token: str) -> models.RefreshToken | None:
-        """Return refresh token if an access token is valid."""
+        """Return refresh token if an access token is valid.
+
+        Verified tokens are cached until they expire, so only the refresh
+        token still has to be looked up for tokens which are used repeatedly.
+        """
+        token_hash = hashlib.sha256(token.encode()).digest()
+        if (cached := self._access_token_cache.get(token_hash)) is not None:
+            refresh_token_id, expire_at = cached
+            if (
+                time.time() < expire_at
+                and (refresh_token := self.async_get_refresh_token(refresh_token_id))
+                and refresh_token.user.is_active
+            ):
+                return refresh_token
+            # Expired or revoked, verify it again to keep the same result
+            del self._access_token_cache[token_hash]
+
         try:
             unverif_claims = jwt_wrapper.unverified_hs256_token_decode(token)
         except jwt.InvalidTokenError:
@@ -668,7 +695,7 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt_wrapper.verify_and_decode(
+            claims = jwt_wrapper.verify_and_decode(
                 token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
             )
         except jwt.InvalidTokenError:
@@ -677,6 +704,7 @@ class AuthManager:
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        self._access_token_cache[token_hash] = (refresh_token.id, claims["exp"])
         return refresh_token
 
     @callback
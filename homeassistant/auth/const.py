@@ -5,6 +5,8 @@ from datetime import timedelta
 ACCESS_TOKEN_EXPIRATION = timedelta(minutes=30)
 MFA_SESSION_EXPIRATION = timedelta(minutes=5)
 REFRESH_TOKEN_EXPIRATION = timedelta(days=90).total_seconds()
+# Number of verified access tokens to remember
+ACCESS_TOKEN_CACHE_SIZE = 1024
 
 GROUP_ID_ADMIN = "system-admin"
 GROUP_ID_USER = "system-users"
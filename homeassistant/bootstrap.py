@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections import defaultdict
+from collections.abc import Iterable
 import contextlib
 from functools import partial
 from itertools import chain
@@ -84,11 +85,12 @@ from .helpers import (
     label_registry,
     recorder,
     restore_state,
+    startup_trace,
     template,
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
-from .helpers.storage import get_internal_store_manager
+from .helpers.storage import Store, get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
 from .setup import (
@@ -254,6 +256,11 @@ PRELOAD_STORAGE = [
     "auth_module.totp",
 ]
 
+# The integration modules imported during the last startup are stored
+# to preload them in the background during the next startup
+IMPORTED_MODULES_STORAGE_KEY = "core.imported_modules"
+IMPORTED_MODULES_STORAGE_VERSION = 1
+
 
 async def async_setup_hass(
     runtime_config: RuntimeConfig,
@@ -966,10 +973,22 @@ async def _async_resolve_domains_to_setup(
     return domains_to_setup, integration_cache
 
 
+async def _async_preload_imported_modules(
+    hass: core.HomeAssistant,
+    store: Store[list[str]],
+    integrations: Iterable[loader.Integration],
+) -> None:
+    """Preload the integration modules imported during the last startup."""
+    if module_names := await store.async_load():
+        await loader.async_preload_modules(hass, integrations, module_names)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
     """Set up all the integrations."""
+    trace = startup_trace.async_start_trace(hass)
+    loader.async_record_imported_modules(hass)
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
@@ -977,6 +996,21 @@ async def _async_set_up_integrations(
         hass, config
     )
 
+    # Preload the modules imported during the last startup in the background
+    imported_modules_store = Store[list[str]](
+        hass,
+        IMPORTED_MODULES_STORAGE_VERSION,
+        IMPORTED_MODULES_STORAGE_KEY,
+        private=True,
+    )
+    hass.async_create_background_task(
+        _async_preload_imported_modules(
+            hass, imported_modules_store, integration_cache.values()
+        ),
+        "preload imported modules",
+        eager_start=True,
+    )
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -1068,6 +1102,11 @@ async def _async_set_up_integrations(
         )
 
     watcher.async_stop()
+    trace.async_finish()
+
+    imported_modules = loader.async_stop_recording_imported_modules(hass)
+    if not hass.config.recovery_mode:
+        imported_modules_store.async_delay_save(lambda: imported_modules)
 
     if _LOGGER.isEnabledFor(logging.DEBUG):
         setup_time = async_get_setup_timings(hass)
@@ -1075,3 +1114,4 @@ async def _async_set_up_integrations(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
         )
+        _LOGGER.debug("Startup critical path: %s", trace.async_critical_path())
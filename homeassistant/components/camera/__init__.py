@@ -6,11 +6,12 @@ import asyncio
 import collections
 from collections.abc import Awaitable, Callable
 from contextlib import suppress
-from dataclasses import asdict
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from enum import IntFlag
 from functools import partial
 import logging
+import math
 import os
 from random import SystemRandom
 import time
@@ -110,6 +111,9 @@ ATTR_FILENAME: Final = "filename"
 ATTR_MEDIA_PLAYER: Final = "media_player"
 ATTR_FORMAT: Final = "format"
 
+# Number of still image sizes which are fetched and kept at the same time
+MAX_STILL_FETCHES: Final = 8
+
 # These constants are deprecated as of Home Assistant 2024.10
 # Please use the StreamType enum instead.
 _DEPRECATED_STATE_RECORDING = DeprecatedConstantEnum(CameraState.RECORDING, "2025.10")
@@ -168,6 +172,14 @@ class Image:
     content: bytes = attr.ib()
 
 
+@dataclass(slots=True)
+class _StillFetch:
+    """A fetch of a still image which is shared between requests."""
+
+    task: asyncio.Task[Image | None] = field(init=False)
+    expires: float = math.inf
+
+
 @bind_hass
 async def async_request_stream(hass: HomeAssistant, entity_id: str, fmt: str) -> str:
     """Request a stream for a camera entity."""
@@ -191,32 +203,40 @@ async def _async_get_image(
     """
     with suppress(asyncio.CancelledError, TimeoutError):
         async with asyncio.timeout(timeout):
-            image_bytes = (
-                await _async_get_stream_image(
-                    camera, width=width, height=height, wait_for_next_keyframe=False
-                )
-                if camera.use_stream_for_stills
-                else await camera.async_camera_image(width=width, height=height)
-            )
-            if image_bytes:
-                content_type = camera.content_type
-                image = Image(content_type, image_bytes)
-                if (
-                    width is not None
-                    and height is not None
-                    and ("jpeg" in content_type or "jpg" in content_type)
-                ):
-                    assert width is not None
-                    assert height is not None
-                    return Image(
-                        content_type, scale_jpeg_camera_image(image, width, height)
-                    )
-
+            if image := await camera.async_get_still(timeout, width, height):
                 return image
 
     raise HomeAssistantError("Unable to get image")
 
 
+async def _async_fetch_image(
+    camera: Camera,
+    timeout: float,
+    width: int | None = None,
+    height: int | None = None,
+) -> Image | None:
+    """Fetch a snapshot image from a camera and scale it on a best effort basis."""
+    async with asyncio.timeout(timeout):
+        image_bytes = (
+            await _async_get_stream_image(
+                camera, width=width, height=height, wait_for_next_keyframe=False
+            )
+            if camera.use_stream_for_stills
+            else await camera.async_camera_image(width=width, height=height)
+        )
+    if not image_bytes:
+        return None
+    content_type = camera.content_type
+    image = Image(content_type, image_bytes)
+    if (
+        width is not None
+        and height is not None
+        and ("jpeg" in content_type or "jpg" in content_type)
+    ):
+        return Image(content_type, scale_jpeg_camera_image(image, width, height))
+    return image
+
+
 @bind_hass
 async def async_get_image(
     hass: HomeAssistant,
@@ -452,6 +472,8 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
     _attr_should_poll: bool = False  # No need to poll cameras
     _attr_state: None = None  # State is determined by is_on
     _attr_supported_features: CameraEntityFeature = CameraEntityFeature(0)
+    # Seconds a fetched still image is reused, None to use the frame interval
+    _still_image_ttl: float | None = None
 
     def __init__(self) -> None:
         """Initialize a camera."""
@@ -462,6 +484,7 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
         self._warned_old_signature = False
         self.async_update_token()
         self._create_stream_lock: asyncio.Lock | None = None
+        self._still_fetches: dict[tuple[int | None, int | None], _StillFetch] = {}
         self._webrtc_providers: list[CameraWebRTCProvider] = []
 
     @cached_property
@@ -607,12 +630,70 @@ class Camera(Entity, cached_properties=CACHED_PROPERTIES_WITH_ATTR_):
             partial(self.camera_image, width=width, height=height)
         )
 
+    @final
+    async def async_get_still(
+        self, timeout: float, width: int | None = None, height: int | None = None
+    ) -> Image | None:
+        """Return a still image, sharing the fetches between requests.
+
+        Concurrent requests for the same size wait for the same fetch, and the
+        fetched image is reused for frame_interval seconds, unless the camera
+        sets another time to live. Failed fetches are not reused. At most
+        MAX_STILL_FETCHES sizes are kept, the oldest size is dropped first.
+        """
+        key = (width, height)
+        now = self.hass.loop.time()
+        fetches = self._still_fetches
+        if (fetch := fetches.get(key)) is None or fetch.expires <= now:
+            for expired_key in [
+                cached_key
+                for cached_key, cached in fetches.items()
+                if cached.expires <= now
+            ]:
+                del fetches[expired_key]
+            if len(fetches) >= MAX_STILL_FETCHES:
+                del fetches[next(iter(fetches))]
+            fetch = fetches[key] = _StillFetch()
+            fetch.task = self.hass.async_create_task(
+                self._async_fetch_still(key, fetch, timeout),
+                f"camera {self.entity_id} still",
+            )
+        return await asyncio.shield(fetch.task)
+
+    async def _async_fetch_still(
+        self,
+        key: tuple[int | None, int | None],
+        fetch: _StillFetch,
+        timeout: float,
+    ) -> Image | None:
+        """Fetch a still image and keep it while it is fresh."""
+        image: Image | None = None
+        try:
+            image = await _async_fetch_image(self, timeout, *key)
+        finally:
+            if image is not None:
+                ttl = self._still_image_ttl
+                fetch.expires = self.hass.loop.time() + (
+                    self.frame_interval if ttl is None else ttl
+                )
+            elif self._still_fetches.get(key) is fetch:
+                del self._still_fetches[key]
+        return image
+
+    async def _async_still_stream_image(self) -> bytes | None:
+        """Return the bytes of a shared still image for a still stream."""
+        try:
+            image = await self.async_get_still(CAMERA_IMAGE_TIMEOUT)
+        except TimeoutError:
+            return None
+        return image.content if image else None
+
     async def handle_async_still_stream(
         self, request: web.Request, interval: float
     ) -> web.StreamResponse:
         """Generate an HTTP MJPEG stream from camera images."""
         return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+            request, self._async_still_stream_image, self.content_type, interval
         )
 
     async def handle_async_mjpeg_stream(
@@ -74,6 +74,8 @@ class GenericCamera(Camera):
     _last_image: bytes | None
     _last_update: datetime
     _update_lock: asyncio.Lock
+    # The camera keeps the last image itself and refetches on url changes
+    _still_image_ttl = 0
 
     def __init__(
         self,
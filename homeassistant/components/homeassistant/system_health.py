@@ -7,6 +7,7 @@ from typing import Any
 from homeassistant.components import system_health
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import system_info
+from homeassistant.helpers.poll_scheduler import async_get_poll_scheduler
 
 
 @callback
@@ -20,6 +21,7 @@ def async_register(
 async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     """Get info for the info page."""
     info = await system_info.async_get_system_info(hass)
+    poll_stats = async_get_poll_scheduler(hass).async_get_stats()
 
     return {
         "version": f"core-{info.get('version')}",
@@ -35,4 +37,9 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         "arch": info.get("arch"),
         "timezone": info.get("timezone"),
         "config_dir": hass.config.config_dir,
+        "polls": poll_stats["polls"],
+        "scheduled_polls": poll_stats["scheduled"],
+        "missed_poll_deadlines": poll_stats["missed_deadlines"],
+        "max_poll_lag": poll_stats["max_lag"],
+        "stretched_poll_intervals": poll_stats["stretched_intervals"],
     }
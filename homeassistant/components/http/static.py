@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Mapping
+from dataclasses import dataclass
+import gzip
+import hashlib
+import os
 from pathlib import Path
+from stat import S_ISREG
 from typing import Final
 
-from aiohttp.hdrs import CACHE_CONTROL, CONTENT_TYPE
-from aiohttp.web import FileResponse, Request, StreamResponse
+from aiohttp.hdrs import (
+    ACCEPT_ENCODING,
+    CACHE_CONTROL,
+    CONTENT_ENCODING,
+    CONTENT_TYPE,
+    RANGE,
+    VARY,
+)
+from aiohttp.helpers import ETag
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_fileresponse import CONTENT_TYPES, FALLBACK_CONTENT_TYPE
 from aiohttp.web_urldispatcher import StaticResource
 from lru import LRU
@@ -17,6 +31,88 @@ CACHE_HEADER = f"public, max-age={CACHE_TIME}"
 CACHE_HEADERS: Mapping[str, str] = {CACHE_CONTROL: CACHE_HEADER}
 RESPONSE_CACHE: LRU[tuple[str, Path], tuple[Path, str]] = LRU(512)
 
+# Files up to this size are kept in memory with their compressed variants,
+# larger files are sent with sendfile
+MAX_CACHED_ASSET_SIZE: Final = 64 * 1024
+ASSET_CACHE: LRU[Path, CachedAsset] = LRU(128)
+# Smaller files are not worth compressing
+MIN_COMPRESS_SIZE: Final = 1024
+COMPRESSIBLE_CONTENT_TYPES: Final = {
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/xml",
+    "image/svg+xml",
+}
+# Precompressed variants shipped next to the files, in order of preference
+PRECOMPRESSED_ENCODINGS: Final = {"br": ".br", "gzip": ".gz"}
+
+
+@dataclass(slots=True, frozen=True)
+class CachedAsset:
+    """A small static file kept in memory with its compressed variants."""
+
+    mtime_ns: int
+    size: int
+    etag: str
+    bodies: dict[str | None, bytes]
+
+
+def _is_compressible(content_type: str) -> bool:
+    """Return if a content type benefits from compression."""
+    return content_type.startswith("text/") or (
+        content_type.partition(";")[0] in COMPRESSIBLE_CONTENT_TYPES
+    )
+
+
+def _accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    """Return the quality values of the codings in an Accept-Encoding header."""
+    qualities: dict[str, float] = {}
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        if not (name := name.strip()):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    return qualities
+
+
+def _load_asset(file_path: Path, content_type: str) -> CachedAsset:
+    """Read a small file and its compressed variants.
+
+    Files which are too large to be kept in memory are returned without bodies.
+    This method should be called from a thread executor.
+    """
+    with file_path.open("rb") as file:
+        st = os.fstat(file.fileno())
+        if not S_ISREG(st.st_mode) or st.st_size > MAX_CACHED_ASSET_SIZE:
+            return CachedAsset(st.st_mtime_ns, st.st_size, "", {})
+        body = file.read()
+    bodies: dict[str | None, bytes] = {None: body}
+    for encoding, extension in PRECOMPRESSED_ENCODINGS.items():
+        compressed_path = file_path.with_suffix(file_path.suffix + extension)
+        try:
+            bodies[encoding] = compressed_path.read_bytes()
+        except OSError:
+            continue
+    if (
+        "gzip" not in bodies
+        and len(body) >= MIN_COMPRESS_SIZE
+        and _is_compressible(content_type)
+        and len(compressed := gzip.compress(body, mtime=0)) < len(body)
+    ):
+        bodies["gzip"] = compressed
+    return CachedAsset(
+        st.st_mtime_ns, st.st_size, hashlib.sha256(body).hexdigest()[:32], bodies
+    )
+
 
 class CachingStaticResource(StaticResource):
     """Static Resource handler that will add cache headers."""
@@ -29,8 +125,6 @@ class CachingStaticResource(StaticResource):
 
         if key in RESPONSE_CACHE:
             file_path, content_type = RESPONSE_CACHE[key]
-            response = FileResponse(file_path, chunk_size=self._chunk_size)
-            response.headers[CONTENT_TYPE] = content_type
         else:
             response = await super()._handle(request)
             if not isinstance(response, FileResponse):
@@ -44,5 +138,74 @@ class CachingStaticResource(StaticResource):
             content_type = response.headers[CONTENT_TYPE]
             RESPONSE_CACHE[key] = (file_path, content_type)
 
-        response.headers[CACHE_CONTROL] = CACHE_HEADER
+        if RANGE in request.headers or not (
+            asset := await self._async_get_asset(file_path, content_type)
+        ):
+            response = FileResponse(file_path, chunk_size=self._chunk_size)
+            response.headers[CONTENT_TYPE] = content_type
+            response.headers[CACHE_CONTROL] = CACHE_HEADER
+            return response
+
+        return self._asset_response(request, asset, content_type)
+
+    async def _async_get_asset(
+        self, file_path: Path, content_type: str
+    ) -> CachedAsset | None:
+        """Return the file from the memory cache, if it is small enough.
+
+        The file is checked for modifications on every request as the
+        directory may be edited by the user, e.g. /local.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            if asset := ASSET_CACHE.get(file_path):
+                if not asset.bodies:
+                    # Too large, sent with sendfile which checks the file itself
+                    return None
+                st = await loop.run_in_executor(None, file_path.stat)
+                if st.st_mtime_ns == asset.mtime_ns and st.st_size == asset.size:
+                    return asset
+            asset = await loop.run_in_executor(
+                None, _load_asset, file_path, content_type
+            )
+        except OSError:
+            # Let the file response handle the error
+            ASSET_CACHE.pop(file_path, None)
+            return None
+        ASSET_CACHE[file_path] = asset
+        return asset if asset.bodies else None
+
+    @staticmethod
+    def _asset_response(
+        request: Request, asset: CachedAsset, content_type: str
+    ) -> Response:
+        """Return the response for a file from the memory cache."""
+        qualities = _accepted_encodings(request.headers.get(ACCEPT_ENCODING, ""))
+        default_quality = qualities.get("*", 0.0)
+        encoding: str | None = None
+        best_quality = 0.0
+        # The client preference wins, ties keep the order of PRECOMPRESSED_ENCODINGS
+        for candidate in PRECOMPRESSED_ENCODINGS:
+            if (
+                candidate in asset.bodies
+                and (quality := qualities.get(candidate, default_quality))
+                > best_quality
+            ):
+                encoding = candidate
+                best_quality = quality
+        # Each encoding is a different representation with its own ETag
+        etag = f"{asset.etag}-{encoding}" if encoding else asset.etag
+        response = Response(headers={CACHE_CONTROL: CACHE_HEADER})
+        if len(asset.bodies) > 1:
+            response.headers[VARY] = ACCEPT_ENCODING
+        response.etag = ETag(value=etag)
+        if (if_none_match := request.if_none_match) is not None and any(
+            match.value in (etag, "*") for match in if_none_match
+        ):
+            response.set_status(304)
+            return response
+        response.headers[CONTENT_TYPE] = content_type
+        if encoding:
+            response.headers[CONTENT_ENCODING] = encoding
+        response.body = asset.bodies[encoding]
         return response
@@ -41,6 +41,7 @@ from homeassistant.util.async_ import create_eager_task
 from . import debug_info, discovery
 from .client import (  # noqa: F401
     MQTT,
+    TOP_SUBSCRIPTIONS,
     async_publish,
     async_subscribe,
     async_subscribe_internal,
@@ -248,6 +249,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
             # Initial setup
             websocket_api.async_register_command(hass, websocket_subscribe)
             websocket_api.async_register_command(hass, websocket_mqtt_info)
+            websocket_api.async_register_command(hass, websocket_subscription_stats)
             hass.data[DATA_MQTT] = mqtt_data = MqttData(config=mqtt_yaml, client=client)
         await client.async_start(mqtt_data)
 
@@ -475,6 +477,28 @@ def websocket_mqtt_info(
     connection.send_result(msg["id"], mqtt_info)
 
 
+@websocket_api.require_admin
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "mqtt/subscription_stats",
+        vol.Optional("limit", default=TOP_SUBSCRIPTIONS): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional("reset", default=False): bool,
+    }
+)
+@callback
+def websocket_subscription_stats(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Get the message statistics of the busiest MQTT subscriptions."""
+    mqtt_data = hass.data[DATA_MQTT]
+    connection.send_result(
+        msg["id"],
+        mqtt_data.client.async_get_subscription_stats(msg["limit"], msg["reset"]),
+    )
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "mqtt/subscribe",
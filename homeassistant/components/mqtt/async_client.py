@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
+from collections import deque
 from functools import lru_cache
 from types import TracebackType
-from typing import Self
+from typing import Any, Self
 
 from paho.mqtt.client import Client as MQTTClient
 
@@ -44,6 +45,9 @@ class AsyncMQTTClient(MQTTClient):
     that is not needed since we are running in an async event loop.
     """
 
+    # The queue of outgoing packets of paho, which is not in its type stubs
+    _out_packet: deque[dict[str, Any]]
+
     def setup(self) -> None:
         """Set up the client.
 
@@ -58,3 +62,8 @@ class AsyncMQTTClient(MQTTClient):
         self._in_message_mutex = NullLock()
         self._reconnect_delay_mutex = NullLock()
         self._mid_generate_mutex = NullLock()
+
+    @property
+    def pending_writes(self) -> int:
+        """Return the number of packets waiting to be written to the socket."""
+        return len(self._out_packet)
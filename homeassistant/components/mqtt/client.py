@@ -6,7 +6,7 @@ import asyncio
 from collections import defaultdict
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 import contextlib
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import lru_cache, partial
 from itertools import chain, groupby
 import logging
@@ -14,7 +14,7 @@ from operator import attrgetter
 import socket
 import ssl
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 import uuid
 
 import certifi
@@ -109,6 +109,8 @@ INITIAL_SUBSCRIBE_COOLDOWN = 0.5
 SUBSCRIBE_COOLDOWN = 0.1
 UNSUBSCRIBE_COOLDOWN = 0.1
 TIMEOUT_ACK = 10
+# Messages which are published without waiting for an ACK of the broker
+MAX_INFLIGHT_PUBLISHES = 100
 RECONNECT_INTERVAL_SECONDS = 10
 
 MAX_WILDCARD_SUBSCRIBES_PER_CALL = 1
@@ -117,11 +119,40 @@ MAX_UNSUBSCRIBES_PER_CALL = 500
 
 MAX_PACKETS_TO_READ = 500
 
+# Number of subscriptions with the most messages shown in the statistics
+TOP_SUBSCRIPTIONS = 10
+
+# TCP_CORK is only available on Linux
+TCP_CORK: int | None = getattr(socket, "TCP_CORK", None)
+
 type SocketType = socket.socket | ssl.SSLSocket | mqtt.WebsocketWrapper | Any
 
 type SubscribePayloadType = str | bytes  # Only bytes if encoding is None
 
 
+def _raise_on_error(result_code: int) -> None:
+    """Raise an error if a paho result code is not successful."""
+    if result_code != 0:
+        # pylint: disable-next=import-outside-toplevel
+        import paho.mqtt.client as mqtt
+
+        raise HomeAssistantError(
+            f"Error talking to MQTT: {mqtt.error_string(result_code)}"
+        )
+
+
+def _raw_socket(sock: SocketType) -> socket.socket:
+    """Return the socket wrapped by a websocket wrapper."""
+    if not hasattr(sock, "setsockopt") and hasattr(sock, "_socket"):
+        # The WebsocketWrapper does not wrap setsockopt
+        # so we need to get the underlying socket
+        # Remove this once
+        # https://github.com/eclipse/paho.mqtt.python/pull/843
+        # is available.
+        return cast(socket.socket, sock._socket)  # noqa: SLF001
+    return cast(socket.socket, sock)
+
+
 def publish(
     hass: HomeAssistant,
     topic: str,
@@ -261,16 +292,121 @@ def subscribe(
     return remove
 
 
+@dataclass(slots=True)
+class SubscriptionStats:
+    """Message statistics of a subscription."""
+
+    started: float = field(default_factory=time.monotonic)
+    messages: int = 0
+    bytes: int = 0
+    callback_time: float = 0.0
+
+    def reset(self) -> None:
+        """Reset the statistics."""
+        self.started = time.monotonic()
+        self.messages = self.bytes = 0
+        self.callback_time = 0.0
+
+
 @dataclass(slots=True, frozen=True)
 class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
     is_simple_match: bool
-    complex_matcher: Callable[[str], bool] | None
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
+    stats: SubscriptionStats = field(default_factory=SubscriptionStats, compare=False)
+
+
+def _callback_description(
+    msg_callback: Callable[[ReceiveMessage], Coroutine[Any, Any, None] | None],
+) -> tuple[str, str | None]:
+    """Return the name of a message callback and the entity it belongs to."""
+    target: Any = msg_callback
+    if isinstance(target, partial):
+        # Entities wrap their message callbacks in a partial
+        target = target.args[0] if target.args else target.func
+    name: str = getattr(target, "__qualname__", None) or repr(target)
+    entity_id: str | None = getattr(
+        getattr(target, "__self__", None), "entity_id", None
+    )
+    return name, entity_id
+
+
+class _TopicTrieNode:
+    """A level of a topic filter in the subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode] = {}
+        self.subscriptions: set[Subscription] = set()
+
+
+class SubscriptionTrie:
+    """Match topics against the topic filters of wildcard subscriptions.
+
+    The topic filters are stored as a trie with a node for each level, so a
+    topic is matched by following its levels instead of matching it against
+    every subscription. The `+` wildcard matches a single level and `#` the
+    parent level and any number of child levels. As required by the MQTT
+    specification, wildcards in the first level do not match topics starting
+    with `$`.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _TopicTrieNode()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        node.subscriptions.add(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription, raises KeyError if it was not added."""
+        path = [self._root]
+        levels = subscription.topic.split("/")
+        for level in levels:
+            path.append(path[-1].children[level])
+        path[-1].subscriptions.remove(subscription)
+        # Prune the nodes which are no longer used
+        for idx in range(len(levels), 0, -1):
+            node = path[idx]
+            if node.subscriptions or node.children:
+                break
+            del path[idx - 1].children[levels[idx - 1]]
+
+    def matches(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching the topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        wildcard_first_level = not topic.startswith("$")
+        matches: list[Subscription] = []
+        nodes: list[tuple[_TopicTrieNode, int]] = [(self._root, 0)]
+        while nodes:
+            node, idx = nodes.pop()
+            children = node.children
+            wildcards = idx > 0 or wildcard_first_level
+            if wildcards and (multi_level := children.get("#")) is not None:
+                matches.extend(multi_level.subscriptions)
+            if idx == depth:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[idx])) is not None:
+                nodes.append((child, idx + 1))
+            if wildcards and (single_level := children.get("+")) is not None:
+                nodes.append((single_level, idx + 1))
+        return matches
 
 
 class MqttClientSetup:
@@ -319,6 +455,7 @@ class MqttClientSetup:
             reconnect_on_failure=False,
         )
         self._client.setup()
+        self._client.max_inflight_messages_set(MAX_INFLIGHT_PUBLISHES)
 
         # Enable logging
         self._client.enable_logger()
@@ -357,6 +494,20 @@ class MqttClientSetup:
         return self._client
 
 
+@dataclass(slots=True)
+class PublishStats:
+    """Statistics of the published messages."""
+
+    published: int = 0
+    acked: int = 0
+    timeouts: int = 0
+    in_flight: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+
 class MQTT:
     """Home Assistant MQTT client."""
 
@@ -377,6 +528,7 @@ class MQTT:
             set
         )
         self._wildcard_subscriptions: set[Subscription] = set()
+        self._wildcard_subscriptions_trie = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -388,6 +540,10 @@ class MQTT:
 
         self._connection_lock = asyncio.Lock()
         self._pending_operations: dict[int, asyncio.Future[None]] = {}
+        self._publish_window = asyncio.Semaphore(MAX_INFLIGHT_PUBLISHES)
+        # Mid futures of published messages waiting for an ACK
+        self._pending_publishes: set[asyncio.Future[None]] = set()
+        self._publish_stats = PublishStats()
         self._subscribe_debouncer = EnsureJobAfterCooldown(
             INITIAL_SUBSCRIBE_COOLDOWN, self._async_perform_subscriptions
         )
@@ -519,14 +675,7 @@ class MQTT:
 
     def _increase_socket_buffer_size(self, sock: SocketType) -> None:
         """Increase the socket buffer size."""
-        if not hasattr(sock, "setsockopt") and hasattr(sock, "_socket"):
-            # The WebsocketWrapper does not wrap setsockopt
-            # so we need to get the underlying socket
-            # Remove this once
-            # https://github.com/eclipse/paho.mqtt.python/pull/843
-            # is available.
-            sock = sock._socket  # noqa: SLF001
-
+        sock = _raw_socket(sock)
         new_buffer_size = PREFERRED_BUFFER_SIZE
         while True:
             try:
@@ -589,11 +738,43 @@ class MQTT:
             self._misc_timer = None
 
     @callback
-    def _async_writer_callback(self, client: mqtt.Client) -> None:
-        """Handle writing data to the socket."""
-        if (status := client.loop_write()) != 0:
+    def _async_writer_callback(
+        self, client: mqtt.Client, cork_sock: socket.socket | None
+    ) -> None:
+        """Handle writing data to the socket.
+
+        The packets queued since the socket was last writable are written in
+        one go. When there is more than one, the TCP socket is corked while
+        writing so the packets are coalesced into as few segments as possible.
+        """
+        if cork_sock is None or self._mqttc.pending_writes < 2:
+            status = client.loop_write()
+        else:
+            self._async_set_cork(cork_sock, True)
+            try:
+                status = client.loop_write()
+            finally:
+                self._async_set_cork(cork_sock, False)
+        if status != 0:
             self._async_on_disconnect(status)
 
+    @callback
+    def _async_set_cork(self, sock: socket.socket, cork: bool) -> None:
+        """Cork or uncork a TCP socket."""
+        assert TCP_CORK is not None
+        with contextlib.suppress(OSError):
+            sock.setsockopt(socket.IPPROTO_TCP, TCP_CORK, cork)
+
+    @staticmethod
+    def _cork_socket(sock: SocketType) -> socket.socket | None:
+        """Return the TCP socket to cork while writing, if it can be corked."""
+        if TCP_CORK is None:
+            return None
+        sock = _raw_socket(sock)
+        if getattr(sock, "family", None) not in (socket.AF_INET, socket.AF_INET6):
+            return None
+        return sock
+
     def _on_socket_register_write(
         self, client: mqtt.Client, userdata: Any, sock: SocketType
     ) -> None:
@@ -610,7 +791,10 @@ class MQTT:
         fileno = sock.fileno()
         _LOGGER.debug("%s: register write %s", self.config_entry.title, fileno)
         if fileno > -1:
-            self.loop.add_writer(sock, partial(self._async_writer_callback, client))
+            self.loop.add_writer(
+                sock,
+                partial(self._async_writer_callback, client, self._cork_socket(sock)),
+            )
 
     @callback
     def _async_on_socket_unregister_write(
@@ -631,8 +815,30 @@ class MQTT:
     async def async_publish(
         self, topic: str, payload: PublishPayloadType, qos: int, retain: bool
     ) -> None:
-        """Publish a MQTT message."""
-        msg_info = self._mqttc.publish(topic, payload, qos, retain)
+        """Publish a MQTT message.
+
+        The publish does not wait for the ACK of the broker, so a burst of
+        messages, for example from a scene, is pipelined and takes about one
+        round trip. At most MAX_INFLIGHT_PUBLISHES messages wait for an ACK,
+        further publishes wait until an ACK is received or times out.
+        """
+        stats = self._publish_stats
+        publish_window = self._publish_window
+        if publish_window.locked():
+            stats.queued += 1
+            stats.max_queued = max(stats.max_queued, stats.queued)
+            try:
+                await publish_window.acquire()
+            finally:
+                stats.queued -= 1
+        else:
+            await publish_window.acquire()
+        try:
+            msg_info = self._mqttc.publish(topic, payload, qos, retain)
+        except (TypeError, ValueError):
+            # Invalid topic or payload
+            publish_window.release()
+            raise
         _LOGGER.debug(
             "Transmitting%s message on %s: '%s', mid: %s, qos: %s",
             " retained" if retain else "",
@@ -641,7 +847,118 @@ class MQTT:
             msg_info.mid,
             qos,
         )
-        await self._async_wait_for_mid_or_raise(msg_info.mid, msg_info.rc)
+        if msg_info.rc != 0:
+            publish_window.release()
+            _raise_on_error(msg_info.rc)
+        stats.published += 1
+        stats.in_flight += 1
+        # Create the mid future if not created, either _mqtt_handle_mid or
+        # async_publish may be executed first.
+        future = self._async_get_mid_future(msg_info.mid)
+        self._pending_publishes.add(future)
+        timer_handle = self.loop.call_later(
+            TIMEOUT_ACK, self._async_timeout_mid, future
+        )
+        future.add_done_callback(
+            partial(
+                self._async_publish_done, msg_info.mid, self.loop.time(), timer_handle
+            )
+        )
+
+    @callback
+    def _async_publish_done(
+        self,
+        mid: int,
+        published: float,
+        timer_handle: asyncio.TimerHandle,
+        future: asyncio.Future[None],
+    ) -> None:
+        """Handle the ACK, the timeout or the cancellation of a published message."""
+        timer_handle.cancel()
+        self._pending_publishes.discard(future)
+        if self._pending_operations.get(mid) is future:
+            del self._pending_operations[mid]
+        self._publish_window.release()
+        stats = self._publish_stats
+        stats.in_flight -= 1
+        if future.cancelled():
+            return
+        if future.exception() is not None:
+            stats.timeouts += 1
+            _LOGGER.warning(
+                "No ACK from MQTT server in %s seconds (mid: %s)", TIMEOUT_ACK, mid
+            )
+            return
+        latency = self.loop.time() - published
+        stats.acked += 1
+        stats.total_latency += latency
+        stats.max_latency = max(stats.max_latency, latency)
+
+    @callback
+    def _async_cancel_pending_publishes(self) -> None:
+        """Stop waiting for the ACKs of published messages.
+
+        The ACKs will not be received after a disconnect, cancelling frees the
+        publish window and stops the timeout timers right away.
+        """
+        for future in self._pending_publishes:
+            future.cancel()
+        self._pending_publishes.clear()
+
+    @callback
+    def async_get_subscription_stats(
+        self, limit: int = TOP_SUBSCRIPTIONS, reset: bool = False
+    ) -> list[dict[str, Any]]:
+        """Return the statistics of the subscriptions with the most messages.
+
+        The rates are averaged since the subscription was made or since the
+        statistics were last reset. Callback time is spent on the event loop,
+        for coroutine callbacks only the time to schedule them is included.
+        """
+        now = time.monotonic()
+        subscriptions = sorted(
+            self.subscriptions,
+            key=lambda subscription: subscription.stats.messages
+            / max(now - subscription.stats.started, 1),
+            reverse=True,
+        )
+        result: list[dict[str, Any]] = []
+        for subscription in subscriptions[:limit]:
+            stats = subscription.stats
+            elapsed = max(now - stats.started, 1)
+            name, entity_id = _callback_description(subscription.job.target)
+            result.append(
+                {
+                    "topic": subscription.topic,
+                    "callback": name,
+                    "entity_id": entity_id,
+                    "messages": stats.messages,
+                    "messages_per_second": round(stats.messages / elapsed, 3),
+                    "bytes_per_second": round(stats.bytes / elapsed, 3),
+                    "callback_time": round(stats.callback_time, 3),
+                }
+            )
+        if reset:
+            for subscription in subscriptions:
+                subscription.stats.reset()
+        return result
+
+    @callback
+    def async_get_publish_stats(self) -> dict[str, Any]:
+        """Return statistics about the published messages."""
+        stats = self._publish_stats
+        return {
+            "published": stats.published,
+            "acked": stats.acked,
+            "timeouts": stats.timeouts,
+            "in_flight": stats.in_flight,
+            "queued": stats.queued,
+            "max_queued": stats.max_queued,
+            "average_latency": round(stats.total_latency / stats.acked, 3)
+            if stats.acked
+            else 0.0,
+            "max_latency": round(stats.max_latency, 3),
+        }
 
     async def async_connect(self, client_available: asyncio.Future[bool]) -> None:
         """Connect to the host. Does not process messages yet."""
@@ -721,7 +1038,9 @@ class MQTT:
         # make sure the unsubscribes are processed
         await self._async_perform_unsubscribes()
 
-        # wait for ACKs to be processed
+        # stop waiting for the ACKs of published messages
+        self._async_cancel_pending_publishes()
+        # wait for ACKs of subscribes and unsubscribes to be processed
         if pending := self._pending_operations.values():
             await asyncio.wait(pending)
 
@@ -755,6 +1074,7 @@ class MQTT:
             self._simple_subscriptions[subscription.topic].add(subscription)
         else:
             self._wildcard_subscriptions.add(subscription)
+            self._wildcard_subscriptions_trie.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
@@ -773,6 +1093,7 @@ class MQTT:
                     del simple_subscriptions[topic]
             else:
                 self._wildcard_subscriptions.remove(subscription)
+                self._wildcard_subscriptions_trie.remove(subscription)
         except (KeyError, ValueError) as exc:
             raise HomeAssistantError("Can't remove subscription twice") from exc
 
@@ -835,9 +1156,8 @@ class MQTT:
 
         job = HassJob(msg_callback, job_type=job_type)
         is_simple_match = not ("+" in topic or "#" in topic)
-        matcher = None if is_simple_match else _matcher_for_topic(topic)
 
-        subscription = Subscription(topic, is_simple_match, matcher, job, qos, encoding)
+        subscription = Subscription(topic, is_simple_match, job, qos, encoding)
         self._async_track_subscription(subscription)
         self._matching_subscriptions.cache_clear()
 
@@ -1049,13 +1369,7 @@ class MQTT:
         subscriptions: list[Subscription] = []
         if topic in self._simple_subscriptions:
             subscriptions.extend(self._simple_subscriptions[topic])
-        subscriptions.extend(
-            subscription
-            for subscription in self._wildcard_subscriptions
-            # mypy doesn't know that complex_matcher is always set when
-            # is_simple_match is False
-            if subscription.complex_matcher(topic)  # type: ignore[misc]
-        )
+        subscriptions.extend(self._wildcard_subscriptions_trie.matches(topic))
         return subscriptions
 
     @callback
@@ -1096,6 +1410,9 @@ class MQTT:
                 # Remember the subscription had an initial retained message
                 self._retained_topics[subscription].add(topic)
 
+            stats = subscription.stats
+            stats.messages += 1
+            stats.bytes += len(msg.payload)
             payload: SubscribePayloadType = msg.payload
             if subscription.encoding is not None:
                 try:
@@ -1127,6 +1444,7 @@ class MQTT:
             else:
                 receive_msg = msg_cache_by_subscription_topic[subscription_topic]
             job = subscription.job
+            start = time.perf_counter()
             if job.job_type is HassJobType.Callback:
                 # We do not wrap Callback jobs in catch_log_exception since
                 # its expensive and we have to do it 2x for every entity
@@ -1138,6 +1456,7 @@ class MQTT:
                     )
             else:
                 self.hass.async_run_hass_job(job, receive_msg)
+            stats.callback_time += time.perf_counter() - start
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
     @callback
@@ -1189,6 +1508,7 @@ class MQTT:
         # result is set make sure the first connection result is set
         self._async_connection_result(False)
         self.connected = False
+        self._async_cancel_pending_publishes()
         async_dispatcher_send(self.hass, MQTT_CONNECTION_STATE, False)
         _LOGGER.log(
             logging.INFO if result_code == 0 else logging.DEBUG,
@@ -1206,13 +1526,7 @@ class MQTT:
 
     async def _async_wait_for_mid_or_raise(self, mid: int, result_code: int) -> None:
         """Wait for ACK from broker or raise on error."""
-        if result_code != 0:
-            # pylint: disable-next=import-outside-toplevel
-            import paho.mqtt.client as mqtt
-
-            raise HomeAssistantError(
-                f"Error talking to MQTT: {mqtt.error_string(result_code)}"
-            )
+        _raise_on_error(result_code)
 
         # Create the mid event if not created, either _mqtt_handle_mid or
         # _async_wait_for_mid_or_raise may be executed first.
@@ -1247,13 +1561,3 @@ class MQTT:
                 now if self._pending_subscriptions else self._last_subscribe
             )
             wait_until = max(last_discovery, last_subscribe) + DISCOVERY_COOLDOWN
-
-
-def _matcher_for_topic(subscription: str) -> Callable[[str], bool]:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
@@ -54,6 +54,8 @@ def _async_get_diagnostics(
     data = {
         "connected": is_connected(hass),
         "mqtt_config": redacted_config,
+        "publish_stats": mqtt_instance.async_get_publish_stats(),
+        "subscription_stats": mqtt_instance.async_get_subscription_stats(),
     }
 
     if device:
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+import asyncio
 from collections.abc import Callable, Coroutine
 from functools import partial
 import logging
@@ -242,13 +243,42 @@ def async_setup_entity_entry_helper(
 ) -> None:
     """Set up entity creation dynamically through MQTT discovery."""
     mqtt_data = hass.data[DATA_MQTT]
+    discovered_entities: list[Entity] = []
+    add_discovered_task: asyncio.Task[None] | None = None
+
+    async def _async_add_discovered_entities() -> None:
+        """Add the entities discovered since the task was created in bulk."""
+        nonlocal add_discovered_task
+        # Keep yielding to the event loop while the burst is still adding
+        # entities, this does not depend on the loop time
+        collected = 0
+        while len(discovered_entities) != collected:
+            collected = len(discovered_entities)
+            await asyncio.sleep(0)
+        add_discovered_task = None
+        entities = discovered_entities.copy()
+        discovered_entities.clear()
+        async_add_entities(entities)
+
+    @callback
+    def _async_cancel_add_discovered_entities() -> None:
+        """Cancel adding discovered entities when the entry is unloaded."""
+        if add_discovered_task is not None:
+            add_discovered_task.cancel()
+        discovered_entities.clear()
 
     @callback
     def _async_setup_entity_entry_from_discovery(
         discovery_payload: MQTTDiscoveryPayload,
     ) -> None:
-        """Set up an MQTT entity from discovery."""
-        nonlocal entity_class
+        """Set up an MQTT entity from discovery.
+
+        Retained discovery messages arrive in bursts that can span several
+        socket reads, and payloads for a platform that is still loading are
+        dispatched after it is set up. The entities are collected until an
+        event loop iteration passes without new ones and added together.
+        """
+        nonlocal entity_class, add_discovered_task
         if not _verify_mqtt_config_entry_enabled_for_discovery(
             hass, domain, discovery_payload
         ):
@@ -259,8 +289,8 @@ def async_setup_entity_entry_helper(
                 entity_class = schema_class_mapping[config[CONF_SCHEMA]]
             if TYPE_CHECKING:
                 assert entity_class is not None
-            async_add_entities(
-                [entity_class(hass, config, entry, discovery_payload.discovery_data)]
+            discovered_entities.append(
+                entity_class(hass, config, entry, discovery_payload.discovery_data)
             )
         except vol.Invalid as err:
             _handle_discovery_failure(hass, discovery_payload)
@@ -268,12 +298,24 @@ def async_setup_entity_entry_helper(
         except Exception:
             _handle_discovery_failure(hass, discovery_payload)
             raise
+        if add_discovered_task is None:
+            # Not started eagerly, the entities discovered by messages
+            # received while the task waits are added by the same task
+            add_discovered_task = entry.async_create_task(
+                hass,
+                _async_add_discovered_entities(),
+                f"mqtt add discovered {domain} entities",
+                eager_start=False,
+            )
 
-    mqtt_data.reload_dispatchers.append(
-        async_dispatcher_connect(
-            hass,
-            MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
-            _async_setup_entity_entry_from_discovery,
+    mqtt_data.reload_dispatchers.extend(
+        (
+            async_dispatcher_connect(
+                hass,
+                MQTT_DISCOVERY_NEW.format(domain, "mqtt"),
+                _async_setup_entity_entry_from_discovery,
+            ),
+            _async_cancel_add_discovered_entities,
         )
     )
 
@@ -8,7 +8,9 @@ from collections import deque
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import StrEnum
+from functools import lru_cache
 import logging
+import re
 from typing import TYPE_CHECKING, Any, TypedDict
 
 from homeassistant.const import ATTR_ENTITY_ID, ATTR_NAME, Platform
@@ -24,6 +26,7 @@ from homeassistant.helpers.typing import (
     VolSchemaType,
 )
 from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.json import JsonValueType, json_loads
 
 if TYPE_CHECKING:
     from paho.mqtt.client import MQTTMessage
@@ -50,6 +53,18 @@ ATTR_THIS = "this"
 
 type PublishPayloadType = str | bytes | int | float | None
 
+# Number of recently received payloads of which the decoded JSON is cached
+JSON_PAYLOAD_CACHE_SIZE = 32
+
+# Value templates which only get a key of the JSON payload, like
+# {{ value_json.temperature }} or {{ value_json['temperature'] }}
+_JSON_KEY_TEMPLATE = re.compile(
+    r"\{\{\s*value_json(?:\.(?P<attr>[A-Za-z_][A-Za-z0-9_]*)"
+    r"|\[\s*(?P<quote>['\"])(?P<key>[^'\"]*)(?P=quote)\s*\])\s*\}\}"
+)
+# Types of JSON values which render the same as str() in a template
+_PLAIN_TYPES = {str, int, float}
+
 
 def convert_outgoing_mqtt_payload(
     payload: PublishPayloadType,
@@ -91,6 +106,26 @@ class ReceiveMessage:
     subscribed_topic: str
     timestamp: float
 
+    @property
+    def payload_json(self) -> JsonValueType:
+        """Return the payload decoded as JSON.
+
+        The decoded payload is cached and shared by all subscribers of the
+        topic, it must not be modified. Raises ValueError if the payload
+        is not valid JSON.
+        """
+        return _decode_json_payload(self.payload)
+
+
+@lru_cache(maxsize=JSON_PAYLOAD_CACHE_SIZE)
+def _decode_json_payload(payload: str | bytes) -> JsonValueType:
+    """Decode a JSON payload.
+
+    Subscribers to the same topic receive the same payload, so the decoded
+    payload is cached to decode it only once for all of them.
+    """
+    return json_loads(payload)
+
 
 type MessageCallbackType = Callable[[ReceiveMessage], None]
 
@@ -269,6 +304,14 @@ class MqttValueTemplate:
         self._value_template = value_template
         self._config_attributes = config_attributes
         self._entity = entity
+        self._json_key: str | None = None
+        if (
+            value_template is not None
+            and (match := _JSON_KEY_TEMPLATE.fullmatch(value_template.template.strip()))
+            # Attributes of a dict take precedence over its keys in templates
+            and not (match["attr"] and hasattr(dict, match["attr"]))
+        ):
+            self._json_key = match["attr"] or match["key"]
 
     @callback
     def async_render_with_possible_json_value(
@@ -283,6 +326,21 @@ class MqttValueTemplate:
         if self._value_template is None:
             return payload
 
+        if self._json_key is not None and isinstance(payload, (str, bytes)):
+            # Fast path for templates which only get a key of the JSON
+            # payload, values which do not render to a plain string and
+            # missing keys are left to the template for the same result
+            try:
+                value = _decode_json_payload(payload)
+            except ValueError:
+                pass
+            else:
+                if (
+                    isinstance(value, dict)
+                    and type(key_value := value.get(self._json_key)) in _PLAIN_TYPES
+                ):
+                    return str(key_value).strip()
+
         values: dict[str, Any] = {}
 
         if variables is not None:
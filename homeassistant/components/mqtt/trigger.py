@@ -22,7 +22,6 @@ from homeassistant.helpers.service_info.mqtt import ReceivePayloadType
 from homeassistant.helpers.template import Template
 from homeassistant.helpers.trigger import TriggerActionType, TriggerData, TriggerInfo
 from homeassistant.helpers.typing import ConfigType, TemplateVarsType
-from homeassistant.util.json import json_loads
 
 from .client import async_subscribe_internal
 from .const import (
@@ -104,7 +103,7 @@ async def async_attach_trigger(
             }
 
             with suppress(ValueError):
-                data["payload_json"] = json_loads(mqttmsg.payload)
+                data["payload_json"] = mqttmsg.payload_json
 
             hass.async_run_hass_job(job, {"trigger": data})
 
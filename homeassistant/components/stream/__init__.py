@@ -19,7 +19,9 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
 import copy
+from functools import partial
 import logging
 import secrets
 import threading
@@ -40,6 +42,7 @@ from homeassistant.util.async_ import create_eager_task
 
 from .const import (
     ATTR_ENDPOINTS,
+    ATTR_KEYFRAME_EXECUTOR,
     ATTR_SETTINGS,
     ATTR_STREAMS,
     CONF_EXTRA_PART_WAIT_TIME,
@@ -51,6 +54,7 @@ from .const import (
     DOMAIN,
     FORMAT_CONTENT_TYPE,
     HLS_PROVIDER,
+    KEYFRAME_CONVERTER_MAX_WORKERS,
     MAX_SEGMENTS,
     OUTPUT_FORMATS,
     OUTPUT_IDLE_TIMEOUT,
@@ -232,6 +236,11 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     hass.data[DOMAIN] = {}
     hass.data[DOMAIN][ATTR_ENDPOINTS] = {}
     hass.data[DOMAIN][ATTR_STREAMS] = []
+    # Decoding keyframes for stills is CPU heavy, bound the threads doing it
+    hass.data[DOMAIN][ATTR_KEYFRAME_EXECUTOR] = keyframe_executor = ThreadPoolExecutor(
+        max_workers=KEYFRAME_CONVERTER_MAX_WORKERS,
+        thread_name_prefix="StreamKeyFrame",
+    )
     conf = DOMAIN_SCHEMA(config.get(DOMAIN, {}))
     if conf[CONF_LL_HLS]:
         assert isinstance(conf[CONF_SEGMENT_DURATION], float)
@@ -263,6 +272,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             for stream in hass.data[DOMAIN][ATTR_STREAMS]
         ]:
             await asyncio.wait(awaitables)
+        await hass.async_add_executor_job(
+            partial(keyframe_executor.shutdown, cancel_futures=True)
+        )
         _LOGGER.debug("Stopped stream workers")
         cancel_logging_listener()
 
@@ -557,7 +569,7 @@ class Stream:
 
         Calls async_get_image from KeyFrameConverter. async_get_image should only be
         called directly from the main loop and not from an executor thread as it uses
-        hass.add_executor_job underneath the hood.
+        the keyframe executor underneath the hood.
         """
 
         self.add_provider(HLS_PROVIDER)
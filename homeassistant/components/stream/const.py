@@ -5,6 +5,7 @@ DOMAIN = "stream"
 ATTR_ENDPOINTS = "endpoints"
 ATTR_SETTINGS = "settings"
 ATTR_STREAMS = "streams"
+ATTR_KEYFRAME_EXECUTOR = "keyframe_executor"
 
 HLS_PROVIDER = "hls"
 RECORDER_PROVIDER = "recorder"
@@ -21,6 +22,24 @@ OUTPUT_IDLE_TIMEOUT = 300  # Idle timeout due to inactivity
 
 NUM_PLAYLIST_SEGMENTS = 3  # Number of segments to use in HLS playlist
 MAX_SEGMENTS = 5  # Max number of segments to keep around
+# Max bytes of segment data to keep around for a stream, segments which are
+# still in the playlist are kept even if they exceed it
+HLS_MEMORY_BUDGET = 64 * 1024 * 1024
+# Max number of threads shared by all streams to decode keyframes for stills
+KEYFRAME_CONVERTER_MAX_WORKERS = 2
+# Max power of 2 to reduce the resolution by when decoding a keyframe for a
+# smaller still, only supported by some decoders (e.g. mjpeg)
+KEYFRAME_MAX_LOWRES = 3
+# The max_lowres of the FFmpeg decoders which support decoding at a reduced
+# resolution, which is not exposed by PyAV. Other decoders such as h264 and
+# hevc decode at the full resolution.
+KEYFRAME_CODEC_MAX_LOWRES = {
+    "h263": 3,
+    "mjpeg": 3,
+    "mpeg1video": 3,
+    "mpeg2video": 3,
+    "mpeg4": 3,
+}
 TARGET_SEGMENT_DURATION_NON_LL_HLS = 2.0  # Each segment is about this many seconds
 SEGMENT_DURATION_ADJUSTER = 0.1  # Used to avoid missing keyframe boundaries
 # Number of target durations to start before the end of the playlist.
@@ -20,8 +20,12 @@ from homeassistant.helpers.event import async_call_later
 from homeassistant.util.decorator import Registry
 
 from .const import (
+    ATTR_KEYFRAME_EXECUTOR,
     ATTR_STREAMS,
     DOMAIN,
+    HLS_MEMORY_BUDGET,
+    KEYFRAME_CODEC_MAX_LOWRES,
+    KEYFRAME_MAX_LOWRES,
     SEGMENT_DURATION_ADJUSTER,
     TARGET_SEGMENT_DURATION_NON_LL_HLS,
 )
@@ -60,6 +64,7 @@ class StreamSettings:
     part_target_duration: float
     hls_advance_part_limit: int
     hls_part_timeout: float
+    hls_memory_budget: int = HLS_MEMORY_BUDGET
 
 
 STREAM_SETTINGS_NON_LL_HLS = StreamSettings(
@@ -422,9 +427,11 @@ class KeyFrameConverter:
     An overview of the thread and state interaction:
         the worker thread sets a packet
         get_image is called from the main asyncio loop
-        get_image schedules _generate_image in an executor thread
+        get_image schedules _generate_image in the keyframe executor, a small
+        thread pool shared by all streams
         _generate_image will try to create an image from the packet
-        _generate_image will clear the packet, so there will only be one attempt per packet
+        _generate_image caches the result per size until the next packet, so
+        there will only be one attempt per packet and size
     If successful, self._image will be updated and returned by get_image
     If unsuccessful, get_image will return the previous image
     """
@@ -446,9 +453,14 @@ class KeyFrameConverter:
         self._event: asyncio.Event = asyncio.Event()
         self._hass = hass
         self._image: bytes | None = None
+        self._images: dict[tuple[int | None, int | None, int], bytes | None] = {}
+        self._images_packet: Packet = None
         self._turbojpeg = TurboJPEGSingleton.instance()
         self._lock = asyncio.Lock()
-        self._codec_context: CodecContext | None = None
+        self._codec_name: str | None = None
+        self._codec_extradata: bytes | None = None
+        self._codec_size: tuple[int, int] = (0, 0)
+        self._codec_contexts: dict[int, CodecContext] = {}
         self._stream_settings = stream_settings
         self._dynamic_stream_settings = dynamic_stream_settings
 
@@ -461,23 +473,72 @@ class KeyFrameConverter:
         self._hass.loop.call_soon_threadsafe(self._event.set)
 
     def create_codec_context(self, codec_context: CodecContext) -> None:
-        """Create a codec context to be used for decoding the keyframes.
+        """Store the codec parameters to be used for decoding the keyframes.
 
         This is run by the worker thread and will only be called once per worker.
+        The codec contexts are created when the first keyframe is decoded.
         """
 
-        if self._codec_context:
+        if self._codec_name:
             return
 
+        self._codec_name = codec_context.name
+        self._codec_extradata = codec_context.extradata
+        self._codec_size = (codec_context.width or 0, codec_context.height or 0)
+
+    def _get_codec_context(self, lowres: int) -> CodecContext:
+        """Return the codec context decoding keyframes at a reduced resolution.
+
+        The resolution is reduced by 2^lowres.
+        """
+        if codec_context := self._codec_contexts.get(lowres):
+            return codec_context
+
         # Keep import here so that we can import stream integration without
         # installing reqs
         # pylint: disable-next=import-outside-toplevel
         from av import CodecContext
 
-        self._codec_context = CodecContext.create(codec_context.name, "r")
-        self._codec_context.extradata = codec_context.extradata
-        self._codec_context.skip_frame = "NONKEY"
-        self._codec_context.thread_type = "NONE"
+        codec_context = CodecContext.create(self._codec_name, "r")
+        codec_context.extradata = self._codec_extradata
+        codec_context.skip_frame = "NONKEY"
+        codec_context.thread_type = "NONE"
+        if lowres:
+            # The deblocking is not noticeable once the image is scaled down
+            codec_context.options = {
+                "lowres": str(lowres),
+                "skip_loop_filter": "all",
+            }
+        self._codec_contexts[lowres] = codec_context
+        return codec_context
+
+    def _get_lowres(self, width: int | None, height: int | None) -> int:
+        """Return how often the resolution can be halved for the requested size.
+
+        The result is limited to the max_lowres of the decoder, so decoders which
+        don't support it share the full resolution codec context.
+        """
+        codec_width, codec_height = self._codec_size
+        max_lowres = min(
+            KEYFRAME_MAX_LOWRES,
+            KEYFRAME_CODEC_MAX_LOWRES.get(self._codec_name or "", 0),
+        )
+        if not (max_lowres and width and height and codec_width and codec_height):
+            return 0
+        lowres = 0
+        while (
+            lowres < max_lowres
+            and codec_width >> (lowres + 1) >= width
+            and codec_height >> (lowres + 1) >= height
+        ):
+            lowres += 1
+        return lowres
+
+    def _image_key(
+        self, width: int | None, height: int | None
+    ) -> tuple[int | None, int | None, int]:
+        """Return the key of the image cache."""
+        return (width, height, self._dynamic_stream_settings.orientation)
 
     @staticmethod
     def transform_image(image: np.ndarray, orientation: int) -> np.ndarray:
@@ -487,43 +548,50 @@ class KeyFrameConverter:
     def _generate_image(self, width: int | None, height: int | None) -> None:
         """Generate the keyframe image.
 
-        This is run in an executor thread, but since it is called within an
+        This is run in the keyframe executor, but since it is called within
         the asyncio lock from the main thread, there will only be one entry
         at a time per instance.
         """
 
-        if not (self._turbojpeg and self._packet and self._codec_context):
+        if not (self._turbojpeg and self._codec_name):
+            return
+        if (packet := self._packet) is not self._images_packet:
+            self._images.clear()
+            self._images_packet = packet
+        if packet is None:
             return
-        packet = self._packet
-        self._packet = None
+        key = self._image_key(width, height)
+        if key in self._images:
+            return
+        self._images[key] = None
+        orientation = self._dynamic_stream_settings.orientation
+        if width and height and orientation >= 5:
+            width, height = height, width
+        codec_context = self._get_codec_context(self._get_lowres(width, height))
         for _ in range(2):  # Retry once if codec context needs to be flushed
             try:
                 # decode packet (flush afterwards)
-                frames = self._codec_context.decode(packet)
+                frames = codec_context.decode(packet)
                 for _i in range(2):
                     if frames:
                         break
-                    frames = self._codec_context.decode(None)
+                    frames = codec_context.decode(None)
                 break
             except EOFError:
                 _LOGGER.debug("Codec context needs flushing, attempting to reopen")
-                self._codec_context.close()
-                self._codec_context.open()
+                codec_context.close()
+                codec_context.open()
         else:
             _LOGGER.debug("Unable to decode keyframe")
             return
         if frames:
             frame = frames[0]
             if width and height:
-                if self._dynamic_stream_settings.orientation >= 5:
-                    frame = frame.reformat(width=height, height=width)
-                else:
-                    frame = frame.reformat(width=width, height=height)
+                frame = frame.reformat(width=width, height=height)
             bgr_array = self.transform_image(
-                frame.to_ndarray(format="bgr24"),
-                self._dynamic_stream_settings.orientation,
+                frame.to_ndarray(format="bgr24"), orientation
             )
-            self._image = bytes(self._turbojpeg.encode(bgr_array))
+            self._images[key] = bytes(self._turbojpeg.encode(bgr_array))
 
     async def async_get_image(
         self,
@@ -537,6 +605,15 @@ class KeyFrameConverter:
         if wait_for_next_keyframe:
             self._event.clear()
             await self._event.wait()
+        key = self._image_key(width, height)
         async with self._lock:
-            await self._hass.async_add_executor_job(self._generate_image, width, height)
+            if self._packet is not self._images_packet or key not in self._images:
+                await self._hass.loop.run_in_executor(
+                    self._hass.data[DOMAIN][ATTR_KEYFRAME_EXECUTOR],
+                    self._generate_image,
+                    width,
+                    height,
+                )
+            if image := self._images.get(key):
+                self._image = image
         return self._image
@@ -89,6 +89,15 @@ class HlsStreamOutput(StreamOutput):
         their GOPs periodically so we need to account for this change.
         """
         super()._async_put(segment)
+        # Drop the oldest segments which are not in the playlist
+        # when the segments exceed the memory budget
+        segments = self._segments
+        size = sum(s.data_size for s in segments)
+        while (
+            size > self.stream_settings.hls_memory_budget
+            and len(segments) > NUM_PLAYLIST_SEGMENTS + 1
+        ):
+            size -= segments.popleft().data_size
         self._target_duration = (
             max((s.duration for s in self._segments), default=segment.duration)
             or self.stream_settings.min_segment_duration
@@ -425,9 +434,17 @@ class HlsSegmentView(StreamView):
                 body=None,
                 status=HTTPStatus.NOT_FOUND,
             )
-        return web.Response(
-            body=segment.get_data(),
+        # Write the parts one by one instead of joining them into a new buffer.
+        # A copy of the list is used as parts may be added while writing.
+        parts = segment.parts.copy()
+        response = web.StreamResponse(
             headers={
                 "Content-Type": "video/iso.segment",
             },
         )
+        response.content_length = sum(len(part.data) for part in parts)
+        await response.prepare(request)
+        for part in parts:
+            await response.write(part.data)
+        await response.write_eof()
+        return response
@@ -12,17 +12,22 @@ from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.json import ExtendedJSONEncoder
 from homeassistant.helpers.storage import Store
+from homeassistant.helpers.trace import TRACE_LEVEL_FULL, TRACE_LEVELS
 from homeassistant.helpers.typing import ConfigType
 
 from . import websocket_api
 from .const import (
+    CONF_ERROR_ONLY,
+    CONF_SAMPLE_RATE,
     CONF_STORED_TRACES,
+    CONF_TRACE_LEVEL,
     DATA_TRACE,
     DATA_TRACE_STORE,
+    DEFAULT_SAMPLE_RATE,
     DEFAULT_STORED_TRACES,
 )
 from .models import ActionTrace
-from .util import async_store_trace
+from .util import async_finish_trace, async_start_trace, async_store_trace
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -32,7 +37,12 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_LEVEL, default=TRACE_LEVEL_FULL): vol.In(TRACE_LEVELS),
+    vol.Optional(CONF_SAMPLE_RATE, default=DEFAULT_SAMPLE_RATE): vol.All(
+        vol.Coerce(float), vol.Range(min=0, max=1)
+    ),
+    vol.Optional(CONF_ERROR_ONLY, default=False): cv.boolean,
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -41,6 +51,8 @@ __all__ = [
     "CONF_STORED_TRACES",
     "TRACE_CONFIG_SCHEMA",
     "ActionTrace",
+    "async_finish_trace",
+    "async_start_trace",
     "async_store_trace",
 ]
 
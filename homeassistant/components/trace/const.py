@@ -12,8 +12,12 @@ if TYPE_CHECKING:
     from .models import TraceData
 
 
+CONF_ERROR_ONLY = "error_only"
+CONF_SAMPLE_RATE = "sample_rate"
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_LEVEL = "level"
 DATA_TRACE: HassKey[TraceData] = HassKey("trace")
 DATA_TRACE_STORE: HassKey[Store[dict[str, list]]] = HassKey("trace_store")
 DATA_TRACES_RESTORED: HassKey[bool] = HassKey("trace_traces_restored")
+DEFAULT_SAMPLE_RATE = 1.0  # Fraction of runs traced at the configured level
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
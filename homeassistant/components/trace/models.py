@@ -69,6 +69,7 @@ class ActionTrace(BaseTrace):
         self._timestamp_finish: dt.datetime | None = None
         self._timestamp_start: dt.datetime = dt_util.utcnow()
         self.key = f"{self._domain}.{item_id}"
+        self.store_on_error = False
         self._dict: dict[str, Any] | None = None
         self._short_dict: dict[str, Any] | None = None
         if trace_id_get():
@@ -83,6 +84,20 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    @property
+    def failed(self) -> bool:
+        """Return True if the traced run ended with an error.
+
+        Runs are also aborted by a failing condition action, those are only
+        failed if the last step has an error, e.g. a stop action with error.
+        """
+        if self._error is not None or self._script_execution == "error":
+            return True
+        if self._script_execution != "aborted" or not self._trace:
+            return False
+        last_step = self._trace[list(self._trace)[-1]]
+        return bool(last_step) and last_step[-1].error is not None
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
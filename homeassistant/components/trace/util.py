@@ -3,14 +3,30 @@
 from __future__ import annotations
 
 from collections.abc import Mapping
+from contextvars import Token
 import logging
+import random
 from typing import Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.trace import (
+    TRACE_LEVEL_OFF,
+    TRACE_LEVEL_SUMMARY,
+    trace_level_reset,
+    trace_level_set,
+)
 from homeassistant.util.limited_size_dict import LimitedSizeDict
 
-from .const import DATA_TRACE, DATA_TRACE_STORE, DATA_TRACES_RESTORED
+from .const import (
+    CONF_ERROR_ONLY,
+    CONF_SAMPLE_RATE,
+    CONF_STORED_TRACES,
+    CONF_TRACE_LEVEL,
+    DATA_TRACE,
+    DATA_TRACE_STORE,
+    DATA_TRACES_RESTORED,
+)
 from .models import ActionTrace, BaseTrace, RestoredTrace, TraceData
 
 _LOGGER = logging.getLogger(__name__)
@@ -91,6 +107,44 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: dict[str, Any]
+) -> Token[str]:
+    """Select the trace level of a run and store its trace unless deferred.
+
+    Runs which are not sampled are traced without variables and, like runs of
+    scripts or automations configured with error_only, only kept if they fail.
+    """
+    level: str = trace_config[CONF_TRACE_LEVEL]
+    error_only: bool = trace_config[CONF_ERROR_ONLY]
+    if (
+        level != TRACE_LEVEL_OFF
+        and (sample_rate := trace_config[CONF_SAMPLE_RATE]) < 1
+        and random.random() >= sample_rate
+    ):
+        level = TRACE_LEVEL_SUMMARY
+        error_only = True
+
+    if level != TRACE_LEVEL_OFF:
+        if error_only:
+            trace.store_on_error = True
+        else:
+            async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    return trace_level_set(level)
+
+
+def async_finish_trace(
+    hass: HomeAssistant,
+    trace: ActionTrace,
+    trace_config: dict[str, Any],
+    token: Token[str],
+) -> None:
+    """Restore the previous trace level and store a deferred trace if it failed."""
+    trace_level_reset(token)
+    if trace.store_on_error and trace.failed:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
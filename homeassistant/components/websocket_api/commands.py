@@ -53,6 +53,7 @@ from homeassistant.helpers.json import (
     json_fragment,
 )
 from homeassistant.helpers.service import async_get_all_descriptions
+from homeassistant.helpers.startup_trace import async_get_trace
 from homeassistant.loader import (
     IntegrationNotFound,
     async_get_integration,
@@ -86,6 +87,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_startup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -570,6 +572,26 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/startup_trace"})
+def handle_integration_startup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle startup trace command."""
+    if (trace := async_get_trace(hass)) is None:
+        connection.send_error(
+            msg["id"], const.ERR_NOT_FOUND, "No startup trace was recorded"
+        )
+        return
+    connection.send_result(
+        msg["id"],
+        {
+            "critical_path": trace.async_critical_path(),
+            "trace": trace.async_chrome_trace(),
+        },
+    )
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
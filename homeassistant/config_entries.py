@@ -59,6 +59,7 @@ from .helpers.event import (
 )
 from .helpers.frame import report
 from .helpers.json import json_bytes, json_bytes_sorted, json_fragment
+from .helpers.startup_trace import StartupPhases, async_trace_span
 from .helpers.typing import UNDEFINED, ConfigType, DiscoveryInfoType, UndefinedType
 from .loader import async_suggest_report_issue
 from .setup import (
@@ -620,8 +621,16 @@ class ConfigEntry(Generic[_DataT]):
         error_reason_translation_placeholders = None
 
         try:
-            with async_start_setup(
-                hass, integration=self.domain, group=self.entry_id, phase=setup_phase
+            with (
+                async_start_setup(
+                    hass,
+                    integration=self.domain,
+                    group=self.entry_id,
+                    phase=setup_phase,
+                ),
+                async_trace_span(
+                    hass, self.domain, StartupPhases.CONFIG_ENTRY_SETUP, self.entry_id
+                ),
             ):
                 result = await component.async_setup_entry(hass, self)
 
@@ -2194,6 +2203,14 @@ class ConfigEntries:
         it can load multiple platforms at once and does not require a separate
         import executor job for each platform.
         """
+        with async_trace_span(
+            self.hass, entry.domain, StartupPhases.PLATFORM_FORWARD, entry.entry_id
+        ):
+            await self._async_forward_entry_setups(entry, platforms)
+
+    async def _async_forward_entry_setups(
+        self, entry: ConfigEntry, platforms: Iterable[Platform | str]
+    ) -> None:
         integration = await loader.async_get_integration(self.hass, entry.domain)
         if not integration.platforms_are_loaded(platforms):
             with async_pause_setup(self.hass, SetupPhases.WAIT_IMPORT_PLATFORMS):
@@ -1845,6 +1845,14 @@ class State:
             "_", " "
         )
 
+    @under_cached_property
+    def numeric_state(self) -> float | None:
+        """Return the state as a float or None if the state is not numeric."""
+        try:
+            return float(self.state)
+        except ValueError:
+            return None
+
     @under_cached_property
     def last_changed_timestamp(self) -> float:
         """Timestamp of last change."""
@@ -2318,7 +2326,9 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            same_attr = (
+                attributes is old_state.attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         # It is much faster to convert a timestamp to a utc datetime object
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Iterable
 import dataclasses
 from dataclasses import dataclass, field
@@ -20,7 +19,7 @@ from .normalized_name_base_registry import (
     NormalizedNameBaseRegistryEntry,
     NormalizedNameBaseRegistryItems,
 )
-from .registry import BaseRegistry, RegistryIndexType
+from .registry import BaseRegistry, index_value, index_values
 from .singleton import singleton
 from .storage import Store
 from .typing import UNDEFINED, UndefinedType
@@ -151,41 +150,18 @@ class AreaRegistryStore(Store[AreasRegistryStoreData]):
 class AreaRegistryItems(NormalizedNameBaseRegistryItems[AreaEntry]):
     """Class to hold area registry items."""
 
-    def __init__(self) -> None:
-        """Initialize the area registry items."""
-        super().__init__()
-        self._labels_index: RegistryIndexType = defaultdict(dict)
-        self._floors_index: RegistryIndexType = defaultdict(dict)
-
-    def _index_entry(self, key: str, entry: AreaEntry) -> None:
-        """Index an entry."""
-        super()._index_entry(key, entry)
-        if entry.floor_id is not None:
-            self._floors_index[entry.floor_id][key] = True
-        for label in entry.labels:
-            self._labels_index[label][key] = True
-
-    def _unindex_entry(
-        self, key: str, replacement_entry: AreaEntry | None = None
-    ) -> None:
-        # always call base class before other indices
-        super()._unindex_entry(key, replacement_entry)
-        entry = self.data[key]
-        if labels := entry.labels:
-            for label in labels:
-                self._unindex_entry_value(key, label, self._labels_index)
-        if floor_id := entry.floor_id:
-            self._unindex_entry_value(key, floor_id, self._floors_index)
+    _indexed_values = {
+        "floor_id": index_value("floor_id"),
+        "labels": index_values("labels"),
+    }
 
     def get_areas_for_label(self, label: str) -> list[AreaEntry]:
         """Get areas for label."""
-        data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return self.get_entries_for_index("labels", label)
 
     def get_areas_for_floor(self, floor: str) -> list[AreaEntry]:
         """Get areas for floor."""
-        data = self.data
-        return [data[key] for key in self._floors_index.get(floor, ())]
+        return self.get_entries_for_index("floor_id", floor)
 
 
 class AreaRegistry(BaseRegistry[AreasRegistryStoreData]):
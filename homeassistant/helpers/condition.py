@@ -67,6 +67,7 @@ from .trace import (
     trace_append_element,
     trace_path,
     trace_path_get,
+    trace_recording,
     trace_stack_cv,
     trace_stack_pop,
     trace_stack_push,
@@ -185,6 +186,234 @@ def trace_condition_function(condition: ConditionCheckerType) -> ConditionChecke
     return wrapper
 
 
+class _CompiledNumericState:
+    """Compiled numeric_state condition with constant limits."""
+
+    __slots__ = ("above", "below", "entity_ids")
+
+    def __init__(
+        self, entity_ids: tuple[str, ...], below: float | None, above: float | None
+    ) -> None:
+        """Initialize the compiled condition."""
+        self.entity_ids = entity_ids
+        self.below = below
+        self.above = above
+
+    def async_evaluate(self, hass: HomeAssistant) -> bool | None:
+        """Evaluate the condition, return None if it can't be decided cleanly."""
+        below = self.below
+        above = self.above
+        for entity_id in self.entity_ids:
+            if (entity := hass.states.get(entity_id)) is None:
+                return None
+            if entity.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                return False
+            if (value := entity.numeric_state) is None:
+                return None
+            if (below is not None and value >= below) or (
+                above is not None and value <= above
+            ):
+                return False
+        return True
+
+    def async_trace(self, hass: HomeAssistant, variables: TemplateVarsType) -> bool:
+        """Evaluate the condition and record the trace of the checker."""
+        below = self.below
+        above = self.above
+        for index, entity_id in enumerate(self.entity_ids):
+            with trace_path(["entity_id", str(index)]), trace_condition(variables):
+                entity = cast(State, hass.states.get(entity_id))
+                if entity.state in (STATE_UNAVAILABLE, STATE_UNKNOWN):
+                    condition_trace_set_result(
+                        False,
+                        message=(
+                            f"value '{entity.state}' is non-numeric and treated"
+                            " as False"
+                        ),
+                    )
+                    return False
+                value = cast(float, entity.numeric_state)
+                if below is not None and value >= below:
+                    condition_trace_set_result(
+                        False, state=value, wanted_state_below=below
+                    )
+                    return False
+                if above is not None and value <= above:
+                    condition_trace_set_result(
+                        False, state=value, wanted_state_above=above
+                    )
+                    return False
+                condition_trace_set_result(True, state=value)
+        return True
+
+
+class _CompiledState:
+    """Compiled state condition matching constant states."""
+
+    __slots__ = ("entity_ids", "last_state", "match_any", "states")
+
+    def __init__(
+        self, entity_ids: tuple[str, ...], states: list[str], match_any: bool
+    ) -> None:
+        """Initialize the compiled condition."""
+        self.entity_ids = entity_ids
+        self.states = frozenset(states)
+        # Reported as the wanted state when no state matches
+        self.last_state = states[-1]
+        self.match_any = match_any
+
+    def async_evaluate(self, hass: HomeAssistant) -> bool | None:
+        """Evaluate the condition, return None if it can't be decided cleanly."""
+        result = not self.match_any
+        for entity_id in self.entity_ids:
+            if (entity := hass.states.get(entity_id)) is None:
+                return None
+            if entity.state in self.states:
+                result = True
+            elif not self.match_any:
+                return False
+        return result
+
+    def async_trace(self, hass: HomeAssistant, variables: TemplateVarsType) -> bool:
+        """Evaluate the condition and record the trace of the checker."""
+        result = not self.match_any
+        for index, entity_id in enumerate(self.entity_ids):
+            with trace_path(["entity_id", str(index)]), trace_condition(variables):
+                value = cast(State, hass.states.get(entity_id)).state
+                if value in self.states:
+                    condition_trace_set_result(True, state=value, wanted_state=value)
+                    result = True
+                    continue
+                condition_trace_set_result(
+                    False, state=value, wanted_state=self.last_state
+                )
+                if not self.match_any:
+                    return False
+        return result
+
+
+class _CompiledGroup:
+    """Compiled AND or OR of compiled conditions."""
+
+    __slots__ = ("checks", "is_and")
+
+    def __init__(self, checks: tuple[_CompiledCheck, ...], is_and: bool) -> None:
+        """Initialize the compiled condition."""
+        self.checks = checks
+        self.is_and = is_and
+
+    def async_evaluate(self, hass: HomeAssistant) -> bool | None:
+        """Evaluate the condition, return None if it can't be decided cleanly."""
+        is_and = self.is_and
+        for check in self.checks:
+            if (result := check.async_evaluate(hass)) is None:
+                return None
+            if result is not is_and:
+                return result
+        return is_and
+
+    def async_trace(self, hass: HomeAssistant, variables: TemplateVarsType) -> bool:
+        """Evaluate the condition and record the trace of the checker."""
+        is_and = self.is_and
+        for index, check in enumerate(self.checks):
+            with trace_path(["conditions", str(index)]):
+                result = _async_trace_compiled(check, hass, variables)
+            if result is not is_and:
+                return result
+        return is_and
+
+
+type _CompiledCheck = _CompiledNumericState | _CompiledState | _CompiledGroup
+
+
+def _async_trace_compiled(
+    check: _CompiledCheck, hass: HomeAssistant, variables: TemplateVarsType
+) -> bool:
+    """Evaluate a compiled condition like trace_condition_function does."""
+    with trace_condition(variables):
+        result = check.async_trace(hass, variables)
+        condition_trace_update_result(result=result)
+        return result
+
+
+def _async_compile_condition(config: ConfigType | Template) -> _CompiledCheck | None:
+    """Compile an AND/OR tree of state and numeric_state conditions.
+
+    Returns None if the condition uses anything which depends on variables,
+    templates or other entities, those are only evaluated by the checker.
+    """
+    if not isinstance(config, dict) or config.get(CONF_ENABLED, True) is not True:
+        return None
+
+    condition = config[CONF_CONDITION]
+    if condition in ("and", "or"):
+        checks = []
+        for sub_config in config["conditions"]:
+            if (check := _async_compile_condition(sub_config)) is None:
+                return None
+            checks.append(check)
+        return _CompiledGroup(tuple(checks), condition == "and")
+
+    if condition not in ("numeric_state", "state") or CONF_ATTRIBUTE in config:
+        return None
+
+    entity_ids = config.get(CONF_ENTITY_ID, [])
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+
+    if condition == "numeric_state":
+        if CONF_VALUE_TEMPLATE in config:
+            return None
+        below = config.get(CONF_BELOW)
+        above = config.get(CONF_ABOVE)
+        if isinstance(below, str) or isinstance(above, str):
+            return None
+        return _CompiledNumericState(tuple(entity_ids), below, above)
+
+    if config.get(CONF_FOR) is not None:
+        return None
+    req_states = config.get(CONF_STATE, [])
+    if not isinstance(req_states, list):
+        req_states = [req_states]
+    if not req_states or any(
+        not isinstance(req_state, str) or INPUT_ENTITY_ID.match(req_state)
+        for req_state in req_states
+    ):
+        return None
+    return _CompiledState(
+        tuple(entity_ids),
+        req_states,
+        config.get(CONF_MATCH, ENTITY_MATCH_ALL) == ENTITY_MATCH_ANY,
+    )
+
+
+def _with_compiled_fast_path(
+    config: ConfigType, checker: ConditionCheckerType
+) -> ConditionCheckerType:
+    """Evaluate a condition in a single pass.
+
+    The checker is used when the compiled condition can't be decided, for
+    example because an entity does not exist, to get the same errors as before.
+    When trace elements are recorded, the decided condition is evaluated again
+    to record the same trace as the checker.
+    """
+    if (compiled := _async_compile_condition(config)) is None:
+        return checker
+
+    @ft.wraps(checker)
+    def compiled_condition(
+        hass: HomeAssistant, variables: TemplateVarsType = None
+    ) -> bool | None:
+        """Test compiled condition."""
+        if (result := compiled.async_evaluate(hass)) is None:
+            return checker(hass, variables)
+        if trace_recording():
+            return _async_trace_compiled(compiled, hass, variables)
+        return result
+
+    return compiled_condition
+
+
 async def _async_get_condition_platform(
     hass: HomeAssistant, config: ConfigType
 ) -> ConditionProtocol | None:
@@ -286,7 +515,7 @@ async def async_and_from_config(
 
         return True
 
-    return if_and_condition
+    return _with_compiled_fast_path(config, if_and_condition)
 
 
 async def async_or_from_config(
@@ -317,7 +546,7 @@ async def async_or_from_config(
 
         return False
 
-    return if_or_condition
+    return _with_compiled_fast_path(config, if_or_condition)
 
 
 async def async_not_from_config(
@@ -401,9 +630,12 @@ def async_numeric_state(
         return False
 
     value: Any = None
+    fvalue: float | None = None
     if value_template is None:
         if attribute is None:
             value = entity.state
+            # Parsing the state is cached on the state object
+            fvalue = entity.numeric_state
         else:
             value = entity.attributes.get(attribute)
     else:
@@ -424,13 +656,14 @@ def async_numeric_state(
         )
         return False
 
-    try:
-        fvalue = float(value)
-    except (ValueError, TypeError) as ex:
-        raise ConditionErrorMessage(
-            "numeric_state",
-            f"entity {entity_id} state '{value}' cannot be processed as a number",
-        ) from ex
+    if fvalue is None:
+        try:
+            fvalue = float(value)
+        except (ValueError, TypeError) as ex:
+            raise ConditionErrorMessage(
+                "numeric_state",
+                f"entity {entity_id} state '{value}' cannot be processed as a number",
+            ) from ex
 
     if below is not None:
         if isinstance(below, str):
@@ -443,22 +676,19 @@ def async_numeric_state(
                 STATE_UNKNOWN,
             ):
                 return False
-            try:
-                if fvalue >= float(below_entity.state):
-                    condition_trace_set_result(
-                        False,
-                        state=fvalue,
-                        wanted_state_below=float(below_entity.state),
-                    )
-                    return False
-            except (ValueError, TypeError) as ex:
+            if (wanted_state_below := below_entity.numeric_state) is None:
                 raise ConditionErrorMessage(
                     "numeric_state",
                     (
                         f"the 'below' entity {below} state '{below_entity.state}'"
                         " cannot be processed as a number"
                     ),
-                ) from ex
+                )
+            if fvalue >= wanted_state_below:
+                condition_trace_set_result(
+                    False, state=fvalue, wanted_state_below=wanted_state_below
+                )
+                return False
         elif fvalue >= below:
             condition_trace_set_result(False, state=fvalue, wanted_state_below=below)
             return False
@@ -474,22 +704,19 @@ def async_numeric_state(
                 STATE_UNKNOWN,
             ):
                 return False
-            try:
-                if fvalue <= float(above_entity.state):
-                    condition_trace_set_result(
-                        False,
-                        state=fvalue,
-                        wanted_state_above=float(above_entity.state),
-                    )
-                    return False
-            except (ValueError, TypeError) as ex:
+            if (wanted_state_above := above_entity.numeric_state) is None:
                 raise ConditionErrorMessage(
                     "numeric_state",
                     (
                         f"the 'above' entity {above} state '{above_entity.state}'"
                         " cannot be processed as a number"
                     ),
-                ) from ex
+                )
+            if fvalue <= wanted_state_above:
+                condition_trace_set_result(
+                    False, state=fvalue, wanted_state_above=wanted_state_above
+                )
+                return False
         elif fvalue <= above:
             condition_trace_set_result(False, state=fvalue, wanted_state_above=above)
             return False
@@ -538,7 +765,7 @@ def async_numeric_state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return True
 
-    return if_numeric_state
+    return _with_compiled_fast_path(config, if_numeric_state)
 
 
 def state(
@@ -652,7 +879,7 @@ def state_from_config(config: ConfigType) -> ConditionCheckerType:
 
         return result
 
-    return if_state
+    return _with_compiled_fast_path(config, if_state)
 
 
 def sun(
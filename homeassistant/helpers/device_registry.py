@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Mapping
 from datetime import datetime
 from enum import StrEnum
@@ -40,7 +39,7 @@ from .deprecation import (
 )
 from .frame import report
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import BaseRegistryItems, JournaledRegistry, index_value, index_values
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -579,67 +578,42 @@ class DeviceRegistryItems[_EntryTypeT: (DeviceEntry, DeletedDeviceEntry)](
 
 
 class ActiveDeviceRegistryItems(DeviceRegistryItems[DeviceEntry]):
-    """Container for active (non-deleted) device registry entries."""
+    """Container for active (non-deleted) device registry entries.
 
-    def __init__(self) -> None:
-        """Initialize the container.
-
-        Maintains three additional indexes:
-
-        - area_id -> dict[key, True]
-        - config_entry_id -> dict[key, True]
-        - label -> dict[key, True]
-        """
-        super().__init__()
-        self._area_id_index: RegistryIndexType = defaultdict(dict)
-        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
-        self._labels_index: RegistryIndexType = defaultdict(dict)
-
-    def _index_entry(self, key: str, entry: DeviceEntry) -> None:
-        """Index an entry."""
-        super()._index_entry(key, entry)
-        if (area_id := entry.area_id) is not None:
-            self._area_id_index[area_id][key] = True
-        for label in entry.labels:
-            self._labels_index[label][key] = True
-        for config_entry_id in entry.config_entries:
-            self._config_entry_id_index[config_entry_id][key] = True
+    Maintains the declared indexes:
+    - area_id -> dict[key, True]
+    - config_entry_id -> dict[key, True]
+    - label -> dict[key, True]
+    - via_device_id -> dict[key, True]
+    """
 
-    def _unindex_entry(
-        self, key: str, replacement_entry: DeviceEntry | None = None
-    ) -> None:
-        """Unindex an entry."""
-        entry = self.data[key]
-        if area_id := entry.area_id:
-            self._unindex_entry_value(key, area_id, self._area_id_index)
-        if labels := entry.labels:
-            for label in labels:
-                self._unindex_entry_value(key, label, self._labels_index)
-        for config_entry_id in entry.config_entries:
-            self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
-        super()._unindex_entry(key, replacement_entry)
+    _indexed_values = {
+        "area_id": index_value("area_id"),
+        "config_entries": index_values("config_entries"),
+        "labels": index_values("labels"),
+        "via_device_id": index_value("via_device_id"),
+    }
 
     def get_devices_for_area_id(self, area_id: str) -> list[DeviceEntry]:
         """Get devices for area."""
-        data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        return self.get_entries_for_index("area_id", area_id)
 
     def get_devices_for_label(self, label: str) -> list[DeviceEntry]:
         """Get devices for label."""
-        data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return self.get_entries_for_index("labels", label)
 
     def get_devices_for_config_entry_id(
         self, config_entry_id: str
     ) -> list[DeviceEntry]:
         """Get devices for config entry."""
-        data = self.data
-        return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
-        ]
+        return self.get_entries_for_index("config_entries", config_entry_id)
+
+    def get_devices_for_via_device_id(self, via_device_id: str) -> list[DeviceEntry]:
+        """Get devices connected through a device."""
+        return self.get_entries_for_index("via_device_id", via_device_id)
 
 
-class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
+class DeviceRegistry(JournaledRegistry[dict[str, list[dict[str, Any]]]]):
     """Class to hold a registry of devices."""
 
     devices: ActiveDeviceRegistryItems
@@ -654,6 +628,7 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             STORAGE_VERSION_MAJOR,
             STORAGE_KEY,
             atomic_writes=True,
+            journal=True,
             minor_version=STORAGE_VERSION_MINOR,
         )
 
@@ -1150,9 +1125,8 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
             id=device.id,
             orphaned_timestamp=None,
         )
-        for other_device in list(self.devices.values()):
-            if other_device.via_device_id == device_id:
-                self.async_update_device(other_device.id, via_device_id=None)
+        for other_device in self.devices.get_devices_for_via_device_id(device_id):
+            self.async_update_device(other_device.id, via_device_id=None)
         self.hass.bus.async_fire_internal(
             EVENT_DEVICE_REGISTRY_UPDATED,
             _EventDeviceRegistryUpdatedData_CreateRemove(
@@ -1225,6 +1199,15 @@ class DeviceRegistry(BaseRegistry[dict[str, list[dict[str, Any]]]]):
         self.devices = devices
         self.deleted_devices = deleted_devices
         self._device_data = devices.data
+        self._async_start_journal()
+
+    @callback
+    def _journaled_entries(self) -> dict[str, dict[str, Any]]:
+        """Return the entries to journal by collection and id."""
+        return {
+            "devices": dict(self.devices.data),
+            "deleted_devices": dict(self.deleted_devices.data),
+        }
 
     @callback
     def _data_to_save(self) -> dict[str, Any]:
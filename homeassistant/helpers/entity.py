@@ -57,6 +57,7 @@ from homeassistant.exceptions import (
 from homeassistant.loader import async_suggest_report_issue, bind_hass
 from homeassistant.util import ensure_unique_string, slugify
 from homeassistant.util.frozen_dataclass_compat import FrozenOrThawed
+from homeassistant.util.read_only_dict import ReadOnlyDict
 
 from . import device_registry as dr, entity_registry as er, singleton
 from .device_registry import DeviceInfo, EventDeviceRegistryUpdatedData
@@ -278,6 +279,10 @@ class CachedProperties(type):
       data, which will be stored in an attribute prefixed with __attr_
     - The _attr_-property setter will invalidate the @cached_property by calling
       delattr on it
+    - The _attr_-property setter and deleter set _cached_property_changed to True
+      on the instance, which allows it to track if any cached property changed.
+      Setting the same mutable object again also sets it, since the object may
+      have been changed in place
     """
 
     def __new__(
@@ -322,6 +327,7 @@ class CachedProperties(type):
                 """
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                o.__dict__["_cached_property_changed"] = True
                 # Delete the __attr_ attribute
                 delattr(o, private_attr_name)
 
@@ -340,10 +346,15 @@ class CachedProperties(type):
                 if (
                     old_val := getattr(o, private_attr_name, _SENTINEL)
                 ) == val and type(old_val) is type(val):
+                    if old_val is val and val.__hash__ is None:
+                        # The same mutable object is set again, which may
+                        # have been changed in place
+                        o.__dict__["_cached_property_changed"] = True
                     return
                 setattr(o, private_attr_name, val)
                 # Invalidate the cache of the cached property
                 o.__dict__.pop(name, None)
+                o.__dict__["_cached_property_changed"] = True
 
             return _setter
 
@@ -521,6 +532,29 @@ class Entity(
 
     __capabilities_updated_at: deque[float]
     __capabilities_updated_at_reported: bool = False
+
+    # Entities which only change their state and attributes by setting cached
+    # _attr_ properties, or by overriding available, can set this to True. The
+    # written state is then reused until a cached _attr_ property, available,
+    # the registry entry, the device entry or the customizations change, instead
+    # of being calculated on every write. Mutable _attr_ values which are changed
+    # in place must be set again.
+    _cache_calculated_state: bool = False
+    # Set to True by CachedProperties when a cached _attr_ property is changed
+    _cached_property_changed: bool = True
+    # Registry entry, device entry, customizations, availability, state and
+    # attributes of the last calculated state, if it can be reused
+    __written_state: (
+        tuple[
+            er.RegistryEntry | None,
+            dr.DeviceEntry | None,
+            Any,
+            bool,
+            str,
+            Mapping[str, Any],
+        ]
+        | None
+    ) = None
     __remove_future: asyncio.Future[None] | None = None
 
     # Entity Properties
@@ -1104,28 +1138,15 @@ class Entity(
 
         return (state, attr, capability_attr, original_device_class, supported_features)
 
-    @callback
-    def _async_write_ha_state(self) -> None:
-        """Write the state to the state machine."""
-        if self._platform_state is EntityPlatformState.REMOVED:
-            # Polling returned after the entity has already been removed
-            return
+    def __async_calculate_and_check_state(self) -> tuple[str, dict[str, Any], float]:
+        """Calculate the state, update capabilities and apply customizations.
 
+        Returns a tuple with the state, the attributes and the time the state was
+        calculated.
+        """
         hass = self.hass
         entity_id = self.entity_id
-
-        if (entry := self.registry_entry) and entry.disabled_by:
-            if not self._disabled_reported:
-                self._disabled_reported = True
-                _LOGGER.warning(
-                    (
-                        "Entity %s is incorrectly being triggered for updates while it"
-                        " is disabled. This is a bug in the %s integration"
-                    ),
-                    entity_id,
-                    self.platform.platform_name,
-                )
-            return
+        entry = self.registry_entry
 
         state_calculate_start = timer()
         state, attr, capabilities, original_device_class, supported_features = (
@@ -1200,6 +1221,60 @@ class Entity(
             if custom := customize.get(entity_id):
                 attr.update(custom)
 
+        return (state, attr, time_now)
+
+    @callback
+    def _async_write_ha_state(self) -> None:
+        """Write the state to the state machine."""
+        if self._platform_state is EntityPlatformState.REMOVED:
+            # Polling returned after the entity has already been removed
+            return
+
+        hass = self.hass
+        entity_id = self.entity_id
+
+        if (entry := self.registry_entry) and entry.disabled_by:
+            if not self._disabled_reported:
+                self._disabled_reported = True
+                _LOGGER.warning(
+                    (
+                        "Entity %s is incorrectly being triggered for updates while it"
+                        " is disabled. This is a bug in the %s integration"
+                    ),
+                    entity_id,
+                    self.platform.platform_name,
+                )
+            return
+
+        if (
+            (written_state := self.__written_state) is not None
+            and not self._cached_property_changed
+            and written_state[0] is entry
+            and written_state[1] is self.device_entry
+            and written_state[2] is hass.data.get(DATA_CUSTOMIZE)
+            and written_state[3] == self.available
+        ):
+            # Nothing which affects the state was changed since it was last written
+            state, attr = written_state[4], written_state[5]
+            time_now = timer()
+        else:
+            if self._cache_calculated_state:
+                self._cached_property_changed = False
+                available = self.available
+            state, attr, time_now = self.__async_calculate_and_check_state()
+            if self._cache_calculated_state:
+                # The state machine keeps a ReadOnlyDict as is, which allows it to
+                # compare the attributes by identity when they are reused
+                attr = ReadOnlyDict(attr)
+                self.__written_state = (
+                    self.registry_entry,
+                    self.device_entry,
+                    hass.data.get(DATA_CUSTOMIZE),
+                    available,
+                    state,
+                    attr,
+                )
+
         if (
             self._context_set is not None
             and time_now - self._context_set > CONTEXT_RECENT_TIME_SECONDS
@@ -1218,6 +1293,7 @@ class Entity(
                 time_now,
             )
         except InvalidStateError:
+            self.__written_state = None
             _LOGGER.exception(
                 "Failed to set state for %s, fall back to %s", entity_id, STATE_UNKNOWN
             )
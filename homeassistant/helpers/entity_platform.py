@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from contextlib import nullcontext
 from contextvars import ContextVar
 from datetime import timedelta
 from logging import Logger, getLogger
@@ -47,16 +48,22 @@ from . import (
 from .entity_registry import EntityRegistry, RegistryEntryDisabler, RegistryEntryHider
 from .event import async_call_later
 from .issue_registry import IssueSeverity, async_create_issue
+from .poll_scheduler import PollScheduler, ScheduledPoll, async_get_poll_scheduler
 from .typing import UNDEFINED, ConfigType, DiscoveryInfoType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
+    from .device_registry import DeviceInfo
     from .entity import Entity
 
+type _DeviceCacheKey = tuple[frozenset[tuple[str, str]], frozenset[tuple[str, str]]]
+
 
 SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 60
 SLOW_ADD_ENTITY_MAX_WAIT = 15  # Per Entity
 SLOW_ADD_MIN_TIMEOUT = 500
+# Yield to the event loop after adding this many entities
+ADD_ENTITIES_CHUNK_SIZE = 250
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM: HassKey[dict[str, list[EntityPlatform]]] = HassKey(
@@ -149,7 +156,8 @@ class EntityPlatform:
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
         # Method to cancel the state change listener
-        self._async_polling_timer: asyncio.TimerHandle | None = None
+        self._async_polling_timer: ScheduledPoll | None = None
+        self._last_poll_duration = 0.0
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
         self._process_updates: asyncio.Lock | None = None
@@ -157,6 +165,16 @@ class EntityPlatform:
         self.parallel_updates: asyncio.Semaphore | None = None
         self._update_in_sequence: bool = False
 
+        # Limit the number of entity service calls which are handled at the
+        # same time for a service call targeting many entities of this platform
+        self.parallel_service_calls: asyncio.Semaphore | None = None
+        if parallel_service_calls := getattr(platform, "PARALLEL_SERVICE_CALLS", 0):
+            self.parallel_service_calls = asyncio.Semaphore(parallel_service_calls)
+        # Seconds an entity of this platform may take to handle a service call
+        self.service_call_timeout: float | None = getattr(
+            platform, "SERVICE_CALL_TIMEOUT", None
+        )
+
         # Platform is None for the EntityComponent "catch-all" EntityPlatform
         # which powers entity_component.add_entities
         self.parallel_updates_created = platform is None
@@ -551,9 +569,13 @@ class EntityPlatform:
         event loop and will finish faster if we run them concurrently.
         """
         results: list[BaseException | None] | None = None
-        tasks = [create_eager_task(coro, loop=self.hass.loop) for coro in coros]
+        tasks: list[asyncio.Task[None]] = []
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
+                for idx, coro in enumerate(coros):
+                    if idx and not idx % ADD_ENTITIES_CHUNK_SIZE:
+                        await asyncio.sleep(0)
+                    tasks.append(create_eager_task(coro, loop=self.hass.loop))
                 results = await asyncio.gather(*tasks, return_exceptions=True)
         except TimeoutError:
             self.logger.warning(
@@ -595,6 +617,8 @@ class EntityPlatform:
         try:
             async with self.hass.timeout.async_timeout(timeout, self.domain):
                 for idx, coro in enumerate(coros):
+                    if idx and not idx % ADD_ENTITIES_CHUNK_SIZE:
+                        await asyncio.sleep(0)
                     try:
                         await coro
                     except Exception as ex:
@@ -627,11 +651,16 @@ class EntityPlatform:
 
         hass = self.hass
         entity_registry = ent_reg.async_get(hass)
+        # Entities of the same device usually have the same device info,
+        # which only has to be merged into the device registry once
+        device_cache: dict[_DeviceCacheKey, tuple[DeviceInfo, str]] = {}
         coros: list[Coroutine[Any, Any, None]] = []
         entities: list[Entity] = []
         for entity in new_entities:
             coros.append(
-                self._async_add_entity(entity, update_before_add, entity_registry)
+                self._async_add_entity(
+                    entity, update_before_add, entity_registry, device_cache
+                )
             )
             entities.append(entity)
 
@@ -663,7 +692,9 @@ class EntityPlatform:
         ):
             return
 
-        self._async_polling_timer = self.hass.loop.call_later(
+        self._async_polling_timer = async_get_poll_scheduler(
+            self.hass
+        ).async_call_later(
             self.scan_interval_seconds,
             self._async_handle_interval_callback,
         )
@@ -671,8 +702,11 @@ class EntityPlatform:
     @callback
     def _async_handle_interval_callback(self) -> None:
         """Update all the entity states in a single platform."""
-        self._async_polling_timer = self.hass.loop.call_later(
-            self.scan_interval_seconds,
+        poll_scheduler = async_get_poll_scheduler(self.hass)
+        self._async_polling_timer = poll_scheduler.async_call_later(
+            poll_scheduler.async_adapt_interval(
+                self.scan_interval_seconds, self._last_poll_duration
+            ),
             self._async_handle_interval_callback,
         )
         if self.config_entry:
@@ -710,6 +744,7 @@ class EntityPlatform:
         entity: Entity,
         update_before_add: bool,
         entity_registry: EntityRegistry,
+        device_cache: dict[_DeviceCacheKey, tuple[DeviceInfo, str]],
     ) -> None:
         """Add an entity to the platform."""
         if entity is None:
@@ -767,9 +802,8 @@ class EntityPlatform:
 
             if self.config_entry and (device_info := entity.device_info):
                 try:
-                    device = dev_reg.async_get(self.hass).async_get_or_create(
-                        config_entry_id=self.config_entry.entry_id,
-                        **device_info,
+                    device = self._async_get_or_create_device(
+                        self.config_entry, device_info, device_cache
                     )
                 except dev_reg.DeviceInfoError as exc:
                     self.logger.error(
@@ -917,6 +951,35 @@ class EntityPlatform:
 
         await entity.add_to_platform_finish()
 
+    @callback
+    def _async_get_or_create_device(
+        self,
+        config_entry: config_entries.ConfigEntry,
+        device_info: DeviceInfo,
+        device_cache: dict[_DeviceCacheKey, tuple[DeviceInfo, str]],
+    ) -> dev_reg.DeviceEntry:
+        """Get or create the device of an entity which is added.
+
+        Devices are cached by their identifiers and connections for entities
+        added in the same call which have the same device info.
+        """
+        device_registry = dev_reg.async_get(self.hass)
+        key = (
+            frozenset(device_info.get("identifiers") or ()),
+            frozenset(device_info.get("connections") or ()),
+        )
+        if (
+            (cached := device_cache.get(key)) is not None
+            and cached[0] == device_info
+            and (device := device_registry.async_get(cached[1])) is not None
+        ):
+            return device
+        device = device_registry.async_get_or_create(
+            config_entry_id=config_entry.entry_id, **device_info
+        )
+        device_cache[key] = (device_info, device.id)
+        return device
+
     async def async_reset(self) -> None:
         """Remove all entities and reset data.
 
@@ -1025,35 +1088,58 @@ class EntityPlatform:
         """
         if self._process_updates is None:
             self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
+        poll_scheduler = async_get_poll_scheduler(self.hass)
+        if self._async_previous_update_running(poll_scheduler):
             return
 
-        async with self._process_updates:
-            if self._update_in_sequence or len(self.entities) <= 1:
-                # If we know we will update sequentially, we want to avoid scheduling
-                # the coroutines as tasks that will wait on the semaphore lock.
-                for entity in list(self.entities.values()):
-                    # If the entity is removed from hass during the previous
-                    # entity being updated, we need to skip updating the
-                    # entity.
-                    if entity.should_poll and entity.hass:
-                        await entity.async_update_ha_state(True)
+        # The host is acquired first, so a poll waiting for the host does not
+        # hold the lock and is not reported as taking too long
+        host_semaphore = poll_scheduler.async_host_semaphore(self.config_entry)
+        async with host_semaphore or nullcontext():
+            # Another poll may have started while waiting for the host
+            if self._async_previous_update_running(poll_scheduler):
                 return
+            async with self._process_updates:
+                start = self.hass.loop.time()
+                try:
+                    await self._async_update_polling_entities()
+                finally:
+                    self._last_poll_duration = self.hass.loop.time() - start
 
-            if tasks := [
-                create_eager_task(
-                    entity.async_update_ha_state(True), loop=self.hass.loop
-                )
-                for entity in self.entities.values()
-                if entity.should_poll
-            ]:
-                await asyncio.gather(*tasks)
+    @callback
+    def _async_previous_update_running(self, poll_scheduler: PollScheduler) -> bool:
+        """Return True and warn if the previous update is still running."""
+        assert self._process_updates is not None
+        if not self._process_updates.locked():
+            return False
+        poll_scheduler.async_record_missed_deadline()
+        self.logger.warning(
+            "Updating %s %s took longer than the scheduled update interval %s",
+            self.platform_name,
+            self.domain,
+            self.scan_interval,
+        )
+        return True
+
+    async def _async_update_polling_entities(self) -> None:
+        """Update the polling entities in sequence or in parallel."""
+        if self._update_in_sequence or len(self.entities) <= 1:
+            # If we know we will update sequentially, we want to avoid scheduling
+            # the coroutines as tasks that will wait on the semaphore lock.
+            for entity in list(self.entities.values()):
+                # If the entity is removed from hass during the previous
+                # entity being updated, we need to skip updating the
+                # entity.
+                if entity.should_poll and entity.hass:
+                    await entity.async_update_ha_state(True)
+            return
+
+        if tasks := [
+            create_eager_task(entity.async_update_ha_state(True), loop=self.hass.loop)
+            for entity in self.entities.values()
+            if entity.should_poll
+        ]:
+            await asyncio.gather(*tasks)
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -10,7 +10,6 @@ timer.
 
 from __future__ import annotations
 
-from collections import defaultdict
 from collections.abc import Callable, Container, Hashable, KeysView, Mapping
 from datetime import datetime, timedelta
 from enum import StrEnum
@@ -59,7 +58,13 @@ from .device_registry import (
     EventDeviceRegistryUpdatedData,
 )
 from .json import JSON_DUMP, find_paths_unserializable_data, json_bytes, json_fragment
-from .registry import BaseRegistry, BaseRegistryItems, RegistryIndexType
+from .registry import (
+    BaseRegistryItems,
+    JournaledRegistry,
+    index_items,
+    index_value,
+    index_values,
+)
 from .singleton import singleton
 from .typing import UNDEFINED, UndefinedType
 
@@ -549,39 +554,36 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
 class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
-    Maintains six additional indexes:
+    Maintains two additional indexes:
     - id -> entry
     - (domain, platform, unique_id) -> entity_id
+
+    And the declared indexes:
+    - area_id -> dict[key, True]
+    - (scope, category_id) -> dict[key, True]
     - config_entry_id -> dict[key, True]
     - device_id -> dict[key, True]
-    - area_id -> dict[key, True]
     - label -> dict[key, True]
     """
 
+    _indexed_values = {
+        "area_id": index_value("area_id"),
+        "categories": index_items("categories"),
+        "config_entry_id": index_value("config_entry_id"),
+        "device_id": index_value("device_id"),
+        "labels": index_values("labels"),
+    }
+
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._entry_ids: dict[str, RegistryEntry] = {}
         self._index: dict[tuple[str, str, str], str] = {}
-        self._config_entry_id_index: RegistryIndexType = defaultdict(dict)
-        self._device_id_index: RegistryIndexType = defaultdict(dict)
-        self._area_id_index: RegistryIndexType = defaultdict(dict)
-        self._labels_index: RegistryIndexType = defaultdict(dict)
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
         self._entry_ids[entry.id] = entry
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
-        # python has no ordered set, so we use a dict with True values
-        # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
-        if (config_entry_id := entry.config_entry_id) is not None:
-            self._config_entry_id_index[config_entry_id][key] = True
-        if (device_id := entry.device_id) is not None:
-            self._device_id_index[device_id][key] = True
-        if (area_id := entry.area_id) is not None:
-            self._area_id_index[area_id][key] = True
-        for label in entry.labels:
-            self._labels_index[label][key] = True
 
     def _unindex_entry(
         self, key: str, replacement_entry: RegistryEntry | None = None
@@ -590,19 +592,10 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         entry = self.data[key]
         del self._entry_ids[entry.id]
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
-        if config_entry_id := entry.config_entry_id:
-            self._unindex_entry_value(key, config_entry_id, self._config_entry_id_index)
-        if device_id := entry.device_id:
-            self._unindex_entry_value(key, device_id, self._device_id_index)
-        if area_id := entry.area_id:
-            self._unindex_entry_value(key, area_id, self._area_id_index)
-        if labels := entry.labels:
-            for label in labels:
-                self._unindex_entry_value(key, label, self._labels_index)
 
     def get_device_ids(self) -> KeysView[str]:
         """Return device ids."""
-        return self._device_id_index.keys()
+        return self.get_index_values("device_id")
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
@@ -619,7 +612,7 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         data = self.data
         return [
             entry
-            for key in self._device_id_index.get(device_id, ())
+            for key in self.get_keys_for_index("device_id", device_id)
             if not (entry := data[key]).disabled_by or include_disabled_entities
         ]
 
@@ -627,20 +620,21 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self, config_entry_id: str
     ) -> list[RegistryEntry]:
         """Get entries for config entry."""
-        data = self.data
-        return [
-            data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
-        ]
+        return self.get_entries_for_index("config_entry_id", config_entry_id)
 
     def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
         """Get entries for area."""
-        data = self.data
-        return [data[key] for key in self._area_id_index.get(area_id, ())]
+        return self.get_entries_for_index("area_id", area_id)
 
     def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
         """Get entries for label."""
-        data = self.data
-        return [data[key] for key in self._labels_index.get(label, ())]
+        return self.get_entries_for_index("labels", label)
+
+    def get_entries_for_category(
+        self, scope: str, category_id: str
+    ) -> list[RegistryEntry]:
+        """Get entries for category in a scope."""
+        return self.get_entries_for_index("categories", (scope, category_id))
 
 
 def _validate_item(
@@ -697,7 +691,7 @@ def _validate_item(
         )
 
 
-class EntityRegistry(BaseRegistry):
+class EntityRegistry(JournaledRegistry):
     """Class to hold a registry of entities."""
 
     deleted_entities: dict[tuple[str, str, str], DeletedRegistryEntry]
@@ -712,6 +706,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_VERSION_MAJOR,
             STORAGE_KEY,
             atomic_writes=True,
+            journal=True,
             minor_version=STORAGE_VERSION_MINOR,
         )
         self.hass.bus.async_listen(
@@ -1356,6 +1351,17 @@ class EntityRegistry(BaseRegistry):
         self.deleted_entities = deleted_entities
         self.entities = entities
         self._entities_data = entities.data
+        self._async_start_journal()
+
+    @callback
+    def _journaled_entries(self) -> dict[str, dict[str, Any]]:
+        """Return the entries to journal by collection and id."""
+        return {
+            "entities": {entry.id: entry for entry in self.entities.values()},
+            "deleted_entities": {
+                entry.id: entry for entry in self.deleted_entities.values()
+            },
+        }
 
     @callback
     def _data_to_save(self) -> dict[str, Any]:
@@ -1469,14 +1475,7 @@ def async_entries_for_category(
     registry: EntityRegistry, scope: str, category_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a category in a scope."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if (
-            (existing_category_id := entry.categories.get(scope))
-            and category_id == existing_category_id
-        )
-    ]
+    return registry.entities.get_entries_for_category(scope, category_id)
 
 
 @callback
@@ -0,0 +1,191 @@
+"""Helper to spread the polls of entity platforms and coordinators over time."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .singleton import singleton
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+
+DATA_POLL_SCHEDULER: HassKey[PollScheduler] = HassKey("poll_scheduler")
+
+# Polls which are due in the same second before later ones are moved earlier
+MAX_POLLS_PER_SECOND = 4
+# Polls are moved at most this fraction of their interval earlier
+MAX_SPREAD_FRACTION = 0.5
+# Number of scheduled polls of an integration which run at the same time for
+# a single host
+MAX_POLLS_PER_HOST = 4
+# Polls which start this many seconds late are counted as missed deadlines
+MISSED_DEADLINE_SECONDS = 1.0
+# Intervals are stretched when a poll takes longer than this fraction of it
+BUSY_FRACTION = 0.5
+# Intervals are stretched up to this factor
+MAX_INTERVAL_FACTOR = 2.0
+
+
+class ScheduledPoll:
+    """A poll scheduled by the poll scheduler."""
+
+    __slots__ = ("_bucket", "_handle", "_scheduler", "_target", "when")
+
+    def __init__(
+        self,
+        scheduler: PollScheduler,
+        when: float,
+        target: Callable[[], None],
+    ) -> None:
+        """Initialize the scheduled poll."""
+        self._scheduler = scheduler
+        self._bucket = int(when)
+        self._target = target
+        self.when = when
+        self._handle: asyncio.TimerHandle | None = scheduler.hass.loop.call_at(
+            when, self._run
+        )
+
+    @callback
+    def cancel(self) -> None:
+        """Cancel the poll."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+            self._scheduler.async_release_bucket(self._bucket)
+
+    @callback
+    def _run(self) -> None:
+        """Run the poll."""
+        self._handle = None
+        scheduler = self._scheduler
+        scheduler.async_release_bucket(self._bucket)
+        scheduler.async_record_lag(scheduler.hass.loop.time() - self.when)
+        self._target()
+
+
+class PollScheduler:
+    """Spread polls over time and limit the polls running for a single host.
+
+    Hosts are limited per integration, as integrations polling the same host
+    usually talk to different services on it.
+
+    Polls with the same interval which are set up at the same time would all
+    run in the same second. When MAX_POLLS_PER_SECOND polls are already due in
+    the same second, a poll is moved to the least busy second at most half of
+    its interval earlier. As the next poll is scheduled relative to the last
+    one, the polls stay spread out.
+
+    When a poll takes more than half of its interval, for example because the
+    polled device is busy, the following interval is stretched.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the poll scheduler."""
+        self.hass = hass
+        self.polls = 0
+        self.missed_deadlines = 0
+        self.max_lag = 0.0
+        self.stretched_intervals = 0
+        self._buckets: dict[int, int] = {}
+        self._host_semaphores: dict[tuple[str, str], asyncio.Semaphore] = {}
+
+    @callback
+    def async_call_at(
+        self, when: float, interval: float, target: Callable[[], None]
+    ) -> ScheduledPoll:
+        """Schedule a poll with an interval to run at or before when."""
+        now = self.hass.loop.time()
+        buckets = self._buckets
+        bucket = int(when)
+        if buckets.get(bucket, 0) >= MAX_POLLS_PER_SECOND:
+            earliest = max(int(now) + 1, int(when - interval * MAX_SPREAD_FRACTION))
+            best = bucket
+            for candidate in range(bucket - 1, earliest - 1, -1):
+                if buckets.get(candidate, 0) < buckets.get(best, 0):
+                    best = candidate
+                    if not buckets.get(candidate):
+                        break
+            when -= bucket - best
+            bucket = best
+        buckets[bucket] = buckets.get(bucket, 0) + 1
+        return ScheduledPoll(self, when, target)
+
+    @callback
+    def async_call_later(
+        self, delay: float, target: Callable[[], None]
+    ) -> ScheduledPoll:
+        """Schedule a poll with an interval of delay seconds."""
+        return self.async_call_at(self.hass.loop.time() + delay, delay, target)
+
+    @callback
+    def async_release_bucket(self, bucket: int) -> None:
+        """Release a second after a poll ran or was cancelled."""
+        if (count := self._buckets[bucket] - 1) > 0:
+            self._buckets[bucket] = count
+        else:
+            del self._buckets[bucket]
+
+    @callback
+    def async_record_lag(self, lag: float) -> None:
+        """Record how late a poll started."""
+        self.polls += 1
+        self.max_lag = max(self.max_lag, lag)
+        if lag > MISSED_DEADLINE_SECONDS:
+            self.missed_deadlines += 1
+
+    @callback
+    def async_adapt_interval(self, interval: float, duration: float) -> float:
+        """Return the interval after a poll which took duration seconds."""
+        if duration <= interval * BUSY_FRACTION:
+            return interval
+        self.stretched_intervals += 1
+        return min(interval * MAX_INTERVAL_FACTOR, duration / BUSY_FRACTION)
+
+    @callback
+    def async_record_missed_deadline(self) -> None:
+        """Record a poll which was skipped because the previous one still ran."""
+        self.missed_deadlines += 1
+
+    @callback
+    def async_host_semaphore(
+        self, config_entry: ConfigEntry | None
+    ) -> asyncio.Semaphore | None:
+        """Return the semaphore for the integration and host of a config entry.
+
+        Returns None if the config entry has no host.
+        """
+        if config_entry is None or not isinstance(
+            host := config_entry.data.get(CONF_HOST), str
+        ):
+            return None
+        key = (config_entry.domain, host)
+        if (semaphore := self._host_semaphores.get(key)) is None:
+            semaphore = self._host_semaphores[key] = asyncio.Semaphore(
+                MAX_POLLS_PER_HOST
+            )
+        return semaphore
+
+    @callback
+    def async_get_stats(self) -> dict[str, Any]:
+        """Return statistics about the scheduled polls."""
+        return {
+            "polls": self.polls,
+            "scheduled": sum(self._buckets.values()),
+            "missed_deadlines": self.missed_deadlines,
+            "max_lag": round(self.max_lag, 3),
+            "stretched_intervals": self.stretched_intervals,
+        }
+
+
+@singleton(DATA_POLL_SCHEDULER)
+@callback
+def async_get_poll_scheduler(hass: HomeAssistant) -> PollScheduler:
+    """Return the poll scheduler."""
+    return PollScheduler(hass)
@@ -4,24 +4,81 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections import UserDict, defaultdict
-from collections.abc import Mapping, Sequence, ValuesView
-from typing import TYPE_CHECKING, Any, Literal
+from collections.abc import (
+    Callable,
+    Hashable,
+    Iterable,
+    KeysView,
+    Mapping,
+    Sequence,
+    ValuesView,
+)
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, ClassVar, Literal
 
 from homeassistant.core import CoreState, HomeAssistant, callback
 
 if TYPE_CHECKING:
-    from .storage import Store
+    from .storage import JournalRecord, Store
 
 SAVE_DELAY = 10
 SAVE_DELAY_LONG = 180
 
-type RegistryIndexType = defaultdict[str, dict[str, Literal[True]]]
+type RegistryIndexValues = Callable[[Any], Iterable[Hashable]]
+
+
+def index_value(attribute: str) -> RegistryIndexValues:
+    """Return a function returning an attribute to index, unless it is None."""
+    get_value = attrgetter(attribute)
+
+    def _values(entry: Any) -> tuple[Hashable, ...]:
+        if (value := get_value(entry)) is None:
+            return ()
+        return (value,)
+
+    return _values
+
+
+def index_values(attribute: str) -> RegistryIndexValues:
+    """Return a function returning a collection attribute to index the items of."""
+    return attrgetter(attribute)
+
+
+def index_items(attribute: str) -> RegistryIndexValues:
+    """Return a function returning the (key, value) items of a mapping to index.
+
+    Nothing is indexed if the attribute is not a mapping.
+    """
+    get_mapping = attrgetter(attribute)
+
+    def _values(entry: Any) -> Iterable[tuple[Hashable, Any]]:
+        if not isinstance(mapping := get_mapping(entry), Mapping):
+            return ()
+        return mapping.items()
+
+    return _values
 
 
 class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
-    """Base class for registry items."""
+    """Base class for registry items.
+
+    Subclasses declare the values to index in _indexed_values, which maps the
+    name of an index to a function returning the values of an entry. The
+    indexes are maintained when entries are added, replaced or removed, and
+    get_keys_for_index / get_entries_for_index look up entries in O(1).
+    """
 
     data: dict[str, _DataT]
+    _indexed_values: ClassVar[Mapping[str, RegistryIndexValues]] = {}
+
+    def __init__(self) -> None:
+        """Initialize the container."""
+        super().__init__()
+        # python has no ordered set, so we use a dict with True values
+        # https://discuss.python.org/t/add-orderedset-to-stdlib/12730
+        self._indexes: dict[str, defaultdict[Hashable, dict[str, Literal[True]]]] = {
+            name: defaultdict(dict) for name in self._indexed_values
+        }
 
     def values(self) -> ValuesView[_DataT]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -38,13 +95,34 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     def __setitem__(self, key: str, entry: _DataT) -> None:
         """Add an item."""
         data = self.data
+        # Get the values to index before changing anything, so the indexes
+        # stay consistent if getting them fails
+        values = [
+            (self._indexes[name], tuple(get_values(entry)))
+            for name, get_values in self._indexed_values.items()
+        ]
         if key in data:
             self._unindex_entry(key, entry)
+            self._unindex_values(key, data[key])
         data[key] = entry
         self._index_entry(key, entry)
+        for index, entry_values in values:
+            for value in entry_values:
+                index[value][key] = True
+
+    def _unindex_values(self, key: str, entry: _DataT) -> None:
+        """Remove an entry from the declared indexes."""
+        indexes = self._indexes
+        for name, get_values in self._indexed_values.items():
+            index = indexes[name]
+            for value in get_values(entry):
+                self._unindex_entry_value(key, value, index)
 
     def _unindex_entry_value(
-        self, key: str, value: str, index: RegistryIndexType
+        self,
+        key: str,
+        value: Hashable,
+        index: defaultdict[Hashable, dict[str, Literal[True]]],
     ) -> None:
         """Unindex an entry value.
 
@@ -60,8 +138,25 @@ class BaseRegistryItems[_DataT](UserDict[str, _DataT], ABC):
     def __delitem__(self, key: str) -> None:
         """Remove an item."""
         self._unindex_entry(key)
+        self._unindex_values(key, self.data[key])
         super().__delitem__(key)
 
+    def get_index_values(self, index: str) -> KeysView[Any]:
+        """Return the values in a declared index.
+
+        The type of the values depends on the index.
+        """
+        return self._indexes[index].keys()
+
+    def get_keys_for_index(self, index: str, value: Hashable) -> Iterable[str]:
+        """Return the keys of entries with a value in a declared index."""
+        return self._indexes[index].get(value, ())
+
+    def get_entries_for_index(self, index: str, value: Hashable) -> list[_DataT]:
+        """Return the entries with a value in a declared index."""
+        data = self.data
+        return [data[key] for key in self._indexes[index].get(value, ())]
+
 
 class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
     """Class to implement a registry."""
@@ -81,3 +176,57 @@ class BaseRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](ABC):
     @abstractmethod
     def _data_to_save(self) -> _StoreDataT:
         """Return data of registry to store in a file."""
+
+
+class JournaledRegistry[_StoreDataT: Mapping[str, Any] | Sequence[Any]](
+    BaseRegistry[_StoreDataT]
+):
+    """Registry which saves its changed entries to the journal of its store."""
+
+    # Entries by collection and id when they were last saved to the journal
+    _journal_entries: dict[str, dict[str, Any]] | None = None
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule saving the registry."""
+        if self._journal_entries is None:
+            super().async_schedule_save()
+            return
+        delay = SAVE_DELAY if self.hass.state is CoreState.running else SAVE_DELAY_LONG
+        self._store.async_delay_save_journal(
+            self._data_to_save, self._journal_records, delay
+        )
+
+    @callback
+    @abstractmethod
+    def _journaled_entries(self) -> dict[str, dict[str, Any]]:
+        """Return the entries to journal by collection and id.
+
+        The entries must have an as_storage_fragment property and be replaced
+        instead of modified when they change.
+        """
+
+    @callback
+    def _async_start_journal(self) -> None:
+        """Start saving changed entries to the journal of the store."""
+        self._journal_entries = self._journaled_entries()
+
+    @callback
+    def _journal_records(self) -> list[JournalRecord]:
+        """Return journal records of the entries changed since the last call."""
+        assert self._journal_entries is not None
+        previous = self._journal_entries
+        current = self._journal_entries = self._journaled_entries()
+        records: list[JournalRecord] = []
+        for collection, entries in current.items():
+            previous_entries = previous.get(collection, {})
+            records.extend(
+                (collection, "id", entry_id, entry.as_storage_fragment)
+                for entry_id, entry in entries.items()
+                if previous_entries.get(entry_id) is not entry
+            )
+            records.extend(
+                (collection, "id", entry_id, None)
+                for entry_id in previous_entries.keys() - entries.keys()
+            )
+        return records
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
+from functools import partial
 import logging
 from typing import Any, Self, cast
 
@@ -18,9 +19,9 @@ from . import start
 from .entity import Entity
 from .event import async_track_time_interval
 from .frame import report
-from .json import JSONEncoder
+from .json import JSONEncoder, json_bytes
 from .singleton import singleton
-from .storage import Store
+from .storage import JournalRecord, Store
 
 DATA_RESTORE_STATE: HassKey[RestoreStateData] = HassKey("restore_state")
 
@@ -32,6 +33,10 @@ STORAGE_VERSION = 1
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long between saving all states instead of only the changed ones. Only
+# changed states get a new last_seen, so this must be less than the expiration.
+STATE_FULL_DUMP_INTERVAL = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -59,6 +64,22 @@ class RestoredExtraData(ExtraStoredData):
         return self.json_dict
 
 
+class RestoreStateStore(Store[list[dict[str, Any]]]):
+    """Store of the states to restore with a journal of changed states."""
+
+    def _apply_journal(
+        self, data: list[dict[str, Any]], records: list[JournalRecord]
+    ) -> None:
+        """Apply journal records to the loaded stored states."""
+        stored_states = {item["state"]["entity_id"]: item for item in data}
+        for _, _, entity_id, item in records:
+            if item is None:
+                stored_states.pop(entity_id, None)
+            else:
+                stored_states[entity_id] = item
+        data[:] = stored_states.values()
+
+
 class StoredState:
     """Object to represent a stored state."""
 
@@ -96,6 +117,11 @@ class StoredState:
         )
 
 
+def _stored_states_as_dicts(stored_states: list[StoredState]) -> list[dict[str, Any]]:
+    """Return the dict representations of stored states."""
+    return [stored_state.as_dict() for stored_state in stored_states]
+
+
 async def async_load(hass: HomeAssistant) -> None:
     """Load the restore state task."""
     await async_get(hass).async_setup()
@@ -134,11 +160,14 @@ class RestoreStateData:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
-        self.store = Store[list[dict[str, Any]]](
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+        self.store = RestoreStateStore(
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, journal=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entities: dict[str, RestoreEntity] = {}
+        # States and serialized extra data by entity_id when they were last dumped
+        self._dumped_states: dict[str, tuple[State, bytes | None]] = {}
+        self._last_full_dump: datetime | None = None
 
     async def async_setup(self) -> None:
         """Set up up the instance of this data helper."""
@@ -214,19 +243,68 @@ class RestoreStateData:
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+    async def async_dump_states(self, *, full: bool = False) -> None:
+        """Save the current state machine to storage.
+
+        Only the states and extra data which changed since the last dump are
+        saved to the journal of the store, unless it is time for a full dump.
+        """
         _LOGGER.debug("Dumping states")
+        stored_states = self.async_get_stored_states()
+        now = dt_util.utcnow()
         try:
-            await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
-            )
+            if (
+                full
+                or self._last_full_dump is None
+                or now - self._last_full_dump >= STATE_FULL_DUMP_INTERVAL
+            ):
+                self._last_full_dump = now
+                self._async_journal_records(stored_states)
+                await self.store.async_save(_stored_states_as_dicts(stored_states))
+            else:
+                await self.store.async_save_journal(
+                    partial(_stored_states_as_dicts, stored_states),
+                    partial(self._async_journal_records, stored_states),
+                )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
 
+    @callback
+    def _async_journal_records(
+        self, stored_states: list[StoredState]
+    ) -> list[JournalRecord]:
+        """Return journal records of the states which changed since the last dump.
+
+        States are replaced instead of modified when they change, so they are
+        compared by identity. The extra data is compared serialized, since it
+        can change without a state change. Only the stored states of entities
+        with a new state object or changed extra data are serialized.
+        """
+        previous = self._dumped_states
+        current: dict[str, tuple[State, bytes | None]] = {}
+        records: list[JournalRecord] = []
+        for stored_state in stored_states:
+            state = stored_state.state
+            extra_data = stored_state.extra_data
+            dumped = current[state.entity_id] = (
+                state,
+                json_bytes(extra_data.as_dict()) if extra_data else None,
+            )
+            if (
+                (previous_dumped := previous.get(state.entity_id)) is None
+                or previous_dumped[0] is not state
+                or previous_dumped[1] != dumped[1]
+            ):
+                records.append(
+                    ("states", "entity_id", state.entity_id, stored_state.as_dict())
+                )
+        records.extend(
+            ("states", "entity_id", entity_id, None)
+            for entity_id in previous.keys() - current.keys()
+        )
+        self._dumped_states = current
+        return records
+
     @callback
     def async_setup_dump(self, *args: Any) -> None:
         """Set up the restore state listeners."""
@@ -3,10 +3,10 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager
 from contextvars import ContextVar
-from copy import copy
+from copy import copy, deepcopy
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from functools import partial
@@ -29,6 +29,7 @@ from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_FLOOR_ID,
     ATTR_LABEL_ID,
+    CONF_ACTION,
     CONF_ALIAS,
     CONF_CHOOSE,
     CONF_CONDITION,
@@ -57,6 +58,7 @@ from homeassistant.const import (
     CONF_SERVICE,
     CONF_SERVICE_DATA,
     CONF_SERVICE_DATA_TEMPLATE,
+    CONF_SERVICE_TEMPLATE,
     CONF_SET_CONVERSATION_RESPONSE,
     CONF_STOP,
     CONF_TARGET,
@@ -86,11 +88,18 @@ from homeassistant.util.dt import utcnow
 from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.signal_type import SignalType, SignalTypeFormat
 
-from . import condition, config_validation as cv, service, template
+from . import (
+    condition,
+    config_validation as cv,
+    entity_registry as er,
+    service,
+    template,
+)
 from .condition import ConditionCheckerType, trace_condition_function
 from .dispatcher import async_dispatcher_connect, async_dispatcher_send_internal
 from .event import async_call_later, async_track_template
 from .script_variables import ScriptVariables
+from .singleton import singleton
 from .template import Template
 from .trace import (
     TraceElement,
@@ -138,6 +147,9 @@ DATA_SCRIPT_BREAKPOINTS: HassKey[dict[str, dict[str, set[str]]]] = HassKey(
     "helpers.script_breakpoints"
 )
 DATA_NEW_SCRIPT_RUNS_NOT_ALLOWED: HassKey[None] = HassKey("helpers.script_not_allowed")
+DATA_SCRIPT_REGISTRY_VERSION: HassKey[_EntityRegistryVersion] = HassKey(
+    "helpers.script_registry_version"
+)
 RUN_ID_ANY = "*"
 NODE_ANY = "*"
 
@@ -177,6 +189,131 @@ def _set_result_unless_done(future: asyncio.Future[None]) -> None:
         future.set_result(None)
 
 
+class _EntityRegistryVersion:
+    """Count entity registry changes which affect resolved entity IDs."""
+
+    __slots__ = ("version",)
+
+    def __init__(self) -> None:
+        """Initialize the version."""
+        self.version = 0
+
+    @callback
+    def async_increment(self, event: Event[er.EventEntityRegistryUpdatedData]) -> None:
+        """Invalidate service calls prepared with the previous registry."""
+        self.version += 1
+
+
+@callback
+def _entity_id_changed_filter(event_data: er.EventEntityRegistryUpdatedData) -> bool:
+    """Filter entity registry updates which can change the result of a lookup."""
+    return event_data["action"] != "update" or "old_entity_id" in event_data
+
+
+@singleton(DATA_SCRIPT_REGISTRY_VERSION)
+@callback
+def _async_get_entity_registry_version(hass: HomeAssistant) -> _EntityRegistryVersion:
+    """Return the entity registry version, tracking it on first use."""
+    registry_version = _EntityRegistryVersion()
+    hass.bus.async_listen(
+        er.EVENT_ENTITY_REGISTRY_UPDATED,
+        registry_version.async_increment,
+        event_filter=_entity_id_changed_filter,
+    )
+    return registry_version
+
+
+def _is_static(value: Any) -> bool:
+    """Test if a data structure renders the same result on every run."""
+    if isinstance(value, Template):
+        return value.is_static
+    if isinstance(value, list):
+        return all(_is_static(val) for val in value)
+    if isinstance(value, Mapping):
+        return all(_is_static(val) for val in value) and all(
+            _is_static(val) for val in value.values()
+        )
+    return True
+
+
+@dataclass(slots=True)
+class _ScriptStep:
+    """A step of a script sequence, prepared once when the sequence is compiled."""
+
+    config: dict[str, Any]
+    action: str
+    handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]]
+    continue_on_error: bool
+    static_call: bool
+    _call_params: service.ServiceParams | None = None
+    _call_params_nested: bool = False
+    _call_params_version: int = -1
+
+    @callback
+    def async_prepare_call(
+        self, hass: HomeAssistant, variables: dict[str, Any]
+    ) -> service.ServiceParams:
+        """Return the parameters of a service call, reusing them if static."""
+        if not self.static_call:
+            return service.async_prepare_call_from_config(hass, self.config, variables)
+
+        # Targets may refer to entity registry IDs, prepared parameters are
+        # invalidated when an entity ID is changed or an entity is removed
+        version = _async_get_entity_registry_version(hass).version
+        if self._call_params is None or self._call_params_version != version:
+            params = service.async_prepare_call_from_config(
+                hass, self.config, variables
+            )
+            self._call_params = params
+            self._call_params_nested = any(
+                isinstance(value, (dict, list))
+                for data in (params["service_data"], params["target"] or {})
+                for value in data.values()
+            )
+            self._call_params_version = version
+
+        # The service call merges the target into the service data and service
+        # handlers may modify it, copy both to not leak data between runs
+        params = self._call_params
+        if self._call_params_nested:
+            return {
+                "domain": params["domain"],
+                "service": params["service"],
+                "service_data": deepcopy(params["service_data"]),
+                "target": deepcopy(params["target"]),
+            }
+        target = params["target"]
+        return {
+            "domain": params["domain"],
+            "service": params["service"],
+            "service_data": params["service_data"].copy(),
+            "target": None if target is None else target.copy(),
+        }
+
+
+def _compile_step(config: dict[str, Any]) -> _ScriptStep:
+    """Compile a script action into a prepared step."""
+    action = cv.determine_script_action(config)
+    return _ScriptStep(
+        config=config,
+        action=action,
+        handler=getattr(_ScriptRun, f"_async_{action}_step"),
+        continue_on_error=config.get(CONF_CONTINUE_ON_ERROR, False),
+        static_call=action == cv.SCRIPT_ACTION_CALL_SERVICE
+        and all(
+            _is_static(config[key])
+            for key in (
+                CONF_ACTION,
+                CONF_SERVICE_TEMPLATE,
+                CONF_TARGET,
+                CONF_SERVICE_DATA,
+                CONF_SERVICE_DATA_TEMPLATE,
+            )
+            if key in config
+        ),
+    )
+
+
 def action_trace_append(variables: dict[str, Any], path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
     trace_element = TraceElement(variables, path)
@@ -406,6 +543,7 @@ class _ScriptRun:
     """Manage Script sequence run."""
 
     _action: dict[str, Any]
+    _script_step: _ScriptStep
 
     def __init__(
         self,
@@ -457,11 +595,13 @@ class _ScriptRun:
 
         try:
             self._log("Running %s", self._script.running_description)
-            for self._step, self._action in enumerate(self._script.sequence):
+            for self._step, script_step in enumerate(self._script._steps):  # noqa: SLF001
                 if self._stop.done():
                     script_execution_set("cancelled")
                     break
-                await self._async_step(log_exceptions=False)
+                self._action = script_step.config
+                self._script_step = script_step
+                await self._async_step(script_step, log_exceptions=False)
             else:
                 script_execution_set("finished")
         except _AbortScript:
@@ -490,8 +630,8 @@ class _ScriptRun:
 
         return ScriptRunResult(self._conversation_response, response, self._variables)
 
-    async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
+    async def _async_step(self, script_step: _ScriptStep, log_exceptions: bool) -> None:
+        continue_on_error = script_step.continue_on_error
 
         with trace_path(str(self._step)):
             async with trace_action(
@@ -500,8 +640,6 @@ class _ScriptRun:
                 if self._stop.done():
                     return
 
-                action = cv.determine_script_action(self._action)
-
                 if CONF_ENABLED in self._action:
                     enabled = self._action[CONF_ENABLED]
                     if isinstance(enabled, Template):
@@ -516,14 +654,13 @@ class _ScriptRun:
                     if not enabled:
                         self._log(
                             "Skipped disabled step %s",
-                            self._action.get(CONF_ALIAS, action),
+                            self._action.get(CONF_ALIAS, script_step.action),
                         )
                         trace_set_result(enabled=False)
                         return
 
-                handler = f"_async_{action}_step"
                 try:
-                    await getattr(self, handler)()
+                    await script_step.handler(self)
                 except Exception as ex:  # noqa: BLE001
                     self._handle_exception(
                         ex, continue_on_error, self._log_exceptions or log_exceptions
@@ -581,7 +718,7 @@ class _ScriptRun:
             raise exception
 
     def _log_exception(self, exception: Exception) -> None:
-        action_type = cv.determine_script_action(self._action)
+        action_type = self._script_step.action
 
         error = str(exception)
         level = logging.ERROR
@@ -732,9 +869,7 @@ class _ScriptRun:
         """Call the service specified in the action."""
         self._step_log("call service")
 
-        params = service.async_prepare_call_from_config(
-            self._hass, self._action, self._variables
-        )
+        params = self._script_step.async_prepare_call(self._hass, self._variables)
 
         # Validate response data parameters. This check ignores services that do
         # not exist which will raise an appropriate error in the service call below.
@@ -1514,6 +1649,11 @@ class Script:
             self.last_action = sub_script.last_action
             self._changed()
 
+    @cached_property
+    def _steps(self) -> list[_ScriptStep]:
+        """Return the sequence compiled into prepared steps."""
+        return [_compile_step(action) for action in self.sequence]
+
     @property
     def is_running(self) -> bool:
         """Return true if script is on."""
@@ -32,6 +32,7 @@ from homeassistant.const import (
 from homeassistant.core import (
     Context,
     EntityServiceResponse,
+    Event,
     HassJob,
     HassJobType,
     HomeAssistant,
@@ -64,6 +65,7 @@ from . import (
 )
 from .group import expand_entity_ids
 from .selector import TargetSelector
+from .singleton import singleton
 from .typing import ConfigType, TemplateVarsType, VolDictType, VolSchemaType
 
 if TYPE_CHECKING:
@@ -79,6 +81,9 @@ SERVICE_DESCRIPTION_CACHE: HassKey[dict[tuple[str, str], dict[str, Any] | None]]
 ALL_SERVICE_DESCRIPTIONS_CACHE: HassKey[
     tuple[set[tuple[str, str]], dict[str, dict[str, Any]]]
 ] = HassKey("all_service_descriptions_cache")
+SERVICE_TARGET_CACHE: HassKey[_ServiceTargetCache] = HassKey("service_target_cache")
+
+_SERVICE_TARGET_CACHE_SIZE = 256
 
 
 @cache
@@ -501,8 +506,45 @@ def _has_match(ids: str | list[str] | None) -> TypeGuard[str | list[str]]:
     return ids not in (None, ENTITY_MATCH_NONE)
 
 
+type _ServiceTargetKey = tuple[
+    frozenset[str], frozenset[str], frozenset[str], frozenset[str]
+]
+
+
+class _ServiceTargetCache:
+    """Cache device, area, floor and label targets resolved from the registries."""
+
+    __slots__ = ("registries", "targets")
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self.registries: tuple[Any, ...] = ()
+        self.targets: dict[_ServiceTargetKey, SelectedEntities] = {}
+
+    @callback
+    def async_clear(self, event: Event[Any] | None = None) -> None:
+        """Clear the cache when a registry is updated."""
+        self.targets.clear()
+
+
+@singleton(SERVICE_TARGET_CACHE)
+@callback
+def _async_get_service_target_cache(hass: HomeAssistant) -> _ServiceTargetCache:
+    """Return the service target cache, clearing it on registry updates."""
+    target_cache = _ServiceTargetCache()
+    for event_type in (
+        area_registry.EVENT_AREA_REGISTRY_UPDATED,
+        device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+        entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        floor_registry.EVENT_FLOOR_REGISTRY_UPDATED,
+        label_registry.EVENT_LABEL_REGISTRY_UPDATED,
+    ):
+        hass.bus.async_listen(event_type, target_cache.async_clear)
+    return target_cache
+
+
 @bind_hass
-def async_extract_referenced_entity_ids(  # noqa: C901
+def async_extract_referenced_entity_ids(
     hass: HomeAssistant, service_call: ServiceCall, expand_group: bool = True
 ) -> SelectedEntities:
     """Extract referenced entity IDs from a service call."""
@@ -526,6 +568,48 @@ def async_extract_referenced_entity_ids(  # noqa: C901
     ):
         return selected
 
+    target_cache = _async_get_service_target_cache(hass)
+    registries = (
+        entity_registry.async_get(hass),
+        device_registry.async_get(hass),
+        area_registry.async_get(hass),
+        floor_registry.async_get(hass),
+        label_registry.async_get(hass),
+    )
+    if registries != target_cache.registries:
+        # The registries were replaced without firing update events
+        target_cache.async_clear()
+        target_cache.registries = registries
+
+    key = (
+        frozenset(selector.device_ids),
+        frozenset(selector.area_ids),
+        frozenset(selector.floor_ids),
+        frozenset(selector.label_ids),
+    )
+    if (resolved := target_cache.targets.get(key)) is None:
+        resolved = _async_resolve_registry_targets(hass, selector)
+        if len(target_cache.targets) >= _SERVICE_TARGET_CACHE_SIZE:
+            del target_cache.targets[next(iter(target_cache.targets))]
+        target_cache.targets[key] = resolved
+
+    # Copy the cached sets as callers may modify the returned selection
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.missing_floors.update(resolved.missing_floors)
+    selected.missing_labels.update(resolved.missing_labels)
+    selected.referenced_devices.update(resolved.referenced_devices)
+    selected.referenced_areas.update(resolved.referenced_areas)
+    return selected
+
+
+@callback
+def _async_resolve_registry_targets(  # noqa: C901
+    hass: HomeAssistant, selector: ServiceTargetSelector
+) -> SelectedEntities:
+    """Resolve the device, area, floor and label IDs of a target selector."""
+    selected = SelectedEntities()
     entities = entity_registry.async_get(hass).entities
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
@@ -993,8 +1077,8 @@ async def entity_service_call(
     if len(entities) == 1:
         # Single entity case avoids creating task
         entity = entities[0]
-        single_response = await _handle_entity_call(
-            hass, entity, func, data, call.context
+        single_response = await _async_entity_call_with_timeout(
+            entity, _handle_entity_call(hass, entity, func, data, call.context)
         )
         if entity.should_poll:
             # Context expires if the turn on commands took a long time.
@@ -1003,17 +1087,21 @@ async def entity_service_call(
             await entity.async_update_ha_state(True)
         return {entity.entity_id: single_response} if return_response else None
 
+    timings: dict[str, float] | None = (
+        {} if _LOGGER.isEnabledFor(logging.DEBUG) else None
+    )
+    start = hass.loop.time() if timings is not None else 0.0
     # Use asyncio.gather here to ensure the returned results
     # are in the same order as the entities list
     results: list[ServiceResponse | BaseException] = await asyncio.gather(
         *[
-            entity.async_request_call(
-                _handle_entity_call(hass, entity, func, data, call.context)
-            )
+            _handle_limited_entity_call(hass, entity, func, data, call.context, timings)
             for entity in entities
         ],
         return_exceptions=True,
     )
+    if timings:
+        _log_entity_call_timings(call, hass.loop.time() - start, timings)
 
     response_data: EntityServiceResponse = {}
     for entity, result in zip(entities, results, strict=False):
@@ -1041,6 +1129,94 @@ async def entity_service_call(
     return response_data if return_response and response_data else None
 
 
+async def _handle_limited_entity_call(
+    hass: HomeAssistant,
+    entity: Entity,
+    func: str | HassJob,
+    data: dict | ServiceCall,
+    context: Context,
+    timings: dict[str, float] | None,
+) -> ServiceResponse:
+    """Handle calling service method within the limits of the entity platform.
+
+    The number of calls is limited by the PARALLEL_SERVICE_CALLS of the
+    platform, and by its PARALLEL_UPDATES like any request of the entity.
+    """
+    semaphore = entity.platform.parallel_service_calls if entity.platform else None
+    if semaphore:
+        await semaphore.acquire()
+
+    try:
+        if timings is None:
+            return await entity.async_request_call(
+                _async_entity_call_with_timeout(
+                    entity, _handle_entity_call(hass, entity, func, data, context)
+                )
+            )
+        start = hass.loop.time()
+        result = await entity.async_request_call(
+            _async_entity_call_with_timeout(
+                entity, _handle_entity_call(hass, entity, func, data, context)
+            )
+        )
+        timings[entity.entity_id] = hass.loop.time() - start
+        return result
+    finally:
+        if semaphore:
+            semaphore.release()
+
+
+async def _async_entity_call_with_timeout(
+    entity: Entity, call: Coroutine[Any, Any, ServiceResponse]
+) -> ServiceResponse:
+    """Wait for the service call of an entity within the SERVICE_CALL_TIMEOUT.
+
+    The timeout is set by the platform of the entity, and starts when the
+    entity is called rather than when the service call is started, so time
+    spent waiting for PARALLEL_SERVICE_CALLS or PARALLEL_UPDATES is excluded.
+    """
+    if (
+        entity.platform is None
+        or (timeout := entity.platform.service_call_timeout) is None
+    ):
+        return await call
+
+    timeout_cm = asyncio.timeout(timeout)
+    try:
+        async with timeout_cm:
+            return await call
+    except TimeoutError as err:
+        if not timeout_cm.expired():
+            raise
+        _LOGGER.warning(
+            "Entity %s did not handle the service call within %s seconds",
+            entity.entity_id,
+            timeout,
+        )
+        raise HomeAssistantError(
+            f"Timeout after {timeout} seconds calling service for {entity.entity_id}"
+        ) from err
+
+
+def _log_entity_call_timings(
+    call: ServiceCall, duration: float, timings: dict[str, float]
+) -> None:
+    """Log how long each entity took to handle a service call."""
+    _LOGGER.debug(
+        "Service call %s.%s took %.3f seconds for %s entities: %s",
+        call.domain,
+        call.service,
+        duration,
+        len(timings),
+        ", ".join(
+            f"{entity_id} {timing:.3f}s"
+            for entity_id, timing in sorted(
+                timings.items(), key=lambda item: item[1], reverse=True
+            )
+        ),
+    )
+
+
 async def _handle_entity_call(
     hass: HomeAssistant,
     entity: Entity,
@@ -0,0 +1,236 @@
+"""Record a timeline of how the integrations are set up during startup."""
+
+from __future__ import annotations
+
+from collections.abc import Generator, Iterable
+import contextlib
+from dataclasses import dataclass
+from enum import StrEnum
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+DATA_STARTUP_TRACE: HassKey[StartupTrace] = HassKey("startup_trace")
+
+# Name of the instant event which marks the end of the startup in the trace
+STARTED_EVENT = "started"
+
+
+class StartupPhases(StrEnum):
+    """Phases of the setup of an integration which are recorded as spans."""
+
+    MANIFEST = "manifest"
+    """Resolving the manifest and the dependencies of the integration."""
+    DEPENDENCIES = "dependencies"
+    """Waiting for the dependencies to be set up."""
+    REQUIREMENTS = "requirements"
+    """Processing the requirements, this may install packages."""
+    IMPORT = "import"
+    """Importing the integration."""
+    SETUP = "setup"
+    """Running async_setup or setup of the integration."""
+    CONFIG_ENTRY_SETUP = "config_entry_setup"
+    """Running async_setup_entry of a config entry."""
+    PLATFORM_FORWARD = "platform_forward"
+    """Forwarding the setup of a config entry to its platforms."""
+    FIRST_REFRESH = "first_refresh"
+    """The first refresh of a data update coordinator of a config entry."""
+
+
+@dataclass(slots=True, frozen=True)
+class StartupSpan:
+    """A phase of the setup of an integration."""
+
+    integration: str
+    phase: StartupPhases
+    start: float
+    end: float
+    group: str | None = None
+
+
+class StartupTrace:
+    """Record the phases of the integration setups during startup as spans.
+
+    The spans can be exported as Chrome trace event JSON, which can be opened
+    in chrome://tracing or Perfetto. The critical path is the chain of
+    integrations which delayed the end of the startup: starting with the
+    integration which finished last, each integration on the path waited for
+    the dependency which finished last.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the startup trace."""
+        self.started = time.monotonic()
+        self.finished: float | None = None
+        self.spans: list[StartupSpan] = []
+        self.dependencies: dict[str, set[str]] = {}
+
+    @contextlib.contextmanager
+    def async_span(
+        self, integration: str, phase: StartupPhases, group: str | None = None
+    ) -> Generator[None]:
+        """Record a phase of the setup of an integration."""
+        if self.finished is not None:
+            yield
+            return
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.spans.append(
+                StartupSpan(integration, phase, start, time.monotonic(), group)
+            )
+
+    @callback
+    def async_add_dependencies(
+        self, integration: str, dependencies: Iterable[str]
+    ) -> None:
+        """Record the integrations an integration waits for."""
+        if self.finished is None:
+            self.dependencies.setdefault(integration, set()).update(dependencies)
+
+    @callback
+    def async_finish(self) -> None:
+        """Stop recording, the startup is finished."""
+        if self.finished is None:
+            self.finished = time.monotonic()
+
+    @callback
+    def async_integration_times(self) -> dict[str, tuple[float, float]]:
+        """Return the first start and the last end of each integration."""
+        times: dict[str, tuple[float, float]] = {}
+        for span in self.spans:
+            if (current := times.get(span.integration)) is None:
+                times[span.integration] = (span.start, span.end)
+            else:
+                times[span.integration] = (
+                    min(current[0], span.start),
+                    max(current[1], span.end),
+                )
+        return times
+
+    @callback
+    def async_critical_path(self) -> list[dict[str, Any]]:
+        """Return the integrations which delayed the startup, in setup order."""
+        times = self.async_integration_times()
+        if not times:
+            return []
+        path: list[str] = []
+        current = max(times, key=lambda domain: times[domain][1])
+        while current not in path:
+            path.append(current)
+            # Integrations without traced dependencies start the path
+            if not (
+                deps := [
+                    dep for dep in self.dependencies.get(current, ()) if dep in times
+                ]
+            ):
+                break
+            current = max(deps, key=lambda domain: times[domain][1])
+        path.reverse()
+        on_path = set(path)
+        phases: dict[str, dict[str, float]] = {domain: {} for domain in path}
+        for span in self.spans:
+            if span.integration in on_path:
+                domain_phases = phases[span.integration]
+                # Groups are set up in parallel, so only the longest one counts
+                domain_phases[span.phase] = max(
+                    domain_phases.get(span.phase, 0), span.end - span.start
+                )
+        return [
+            {
+                "domain": domain,
+                "start": round(times[domain][0] - self.started, 3),
+                "end": round(times[domain][1] - self.started, 3),
+                "phases": {
+                    phase: round(seconds, 3)
+                    for phase, seconds in phases[domain].items()
+                },
+            }
+            for domain in path
+        ]
+
+    @callback
+    def async_chrome_trace(self) -> dict[str, Any]:
+        """Return the spans in the Chrome trace event format.
+
+        Each integration gets its own track, timestamps are in microseconds
+        since the start of the trace.
+        """
+        started = self.started
+        tids: dict[str, int] = {}
+        events: list[dict[str, Any]] = [
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": 1,
+                "args": {"name": "Home Assistant startup"},
+            }
+        ]
+        for span in sorted(self.spans, key=lambda span: span.start):
+            if (tid := tids.get(span.integration)) is None:
+                tid = tids[span.integration] = len(tids) + 1
+                events.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": 1,
+                        "tid": tid,
+                        "args": {"name": span.integration},
+                    }
+                )
+            event: dict[str, Any] = {
+                "name": f"{span.integration} {span.phase}",
+                "cat": span.phase,
+                "ph": "X",
+                "pid": 1,
+                "tid": tid,
+                "ts": round((span.start - started) * 1_000_000),
+                "dur": round((span.end - span.start) * 1_000_000),
+            }
+            if span.group is not None:
+                event["args"] = {"group": span.group}
+            events.append(event)
+        if self.finished is not None:
+            events.append(
+                {
+                    "name": STARTED_EVENT,
+                    "ph": "i",
+                    "s": "g",
+                    "pid": 1,
+                    "ts": round((self.finished - started) * 1_000_000),
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+@callback
+def async_start_trace(hass: HomeAssistant) -> StartupTrace:
+    """Start recording the startup trace."""
+    hass.data[DATA_STARTUP_TRACE] = trace = StartupTrace()
+    return trace
+
+
+@callback
+def async_get_trace(hass: HomeAssistant) -> StartupTrace | None:
+    """Return the startup trace, if it was recorded."""
+    return hass.data.get(DATA_STARTUP_TRACE)
+
+
+@contextlib.contextmanager
+def async_trace_span(
+    hass: HomeAssistant,
+    integration: str,
+    phase: StartupPhases,
+    group: str | None = None,
+) -> Generator[None]:
+    """Record a phase of the setup of an integration while starting up."""
+    if (trace := hass.data.get(DATA_STARTUP_TRACE)) is None or (
+        trace.finished is not None
+    ):
+        yield
+        return
+    with trace.async_span(integration, phase, group):
+        yield
@@ -7,6 +7,7 @@ from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
+import json
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
@@ -49,6 +50,20 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# Larger files are not preloaded, they are only parsed when their store loads
+PRELOAD_MAX_SIZE = 512 * 1024
+
+# Records appended to a journal before the data is written in full again
+JOURNAL_MAX_RECORDS = 1000
+
+# A journal record is (collection, id key, id, item), the item is None
+# when the item with the id was removed from the collection
+type JournalRecord = tuple[str, str, str, Any]
+
+# Each full write increments the generation stored in the data file, a journal
+# starts with a header holding the generation of the data file it extends
+JOURNAL_GENERATION = "journal_generation"
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -216,7 +231,10 @@ class _StoreManager:
         for key in keys:
             storage_file: Path = storage_path.joinpath(key)
             try:
-                if storage_file.is_file():
+                if (
+                    storage_file.is_file()
+                    and storage_file.stat().st_size <= PRELOAD_MAX_SIZE
+                ):
                     data_preload[key] = json_util.load_json(storage_file)
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.debug("Error loading %s: %s", key, ex)
@@ -240,10 +258,18 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         *,
         atomic_writes: bool = False,
         encoder: type[JSONEncoder] | None = None,
+        journal: bool = False,
         minor_version: int = 1,
         read_only: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        When journal is True, async_delay_save_journal appends the changed
+        items to a journal file next to the data file instead of writing all
+        data. The journal is replayed on load and the data is written in full
+        on the first write after load, when the journal grows too large and at
+        the final write when Home Assistant stops.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -259,12 +285,25 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._read_only = read_only
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
+        self._journal = journal
+        self._journal_compacted = False
+        self._journal_size = 0
+        self._journal_generation = 0
+        # Set by async_delay_save_journal to compact the journal at the final
+        # write, with the data to write in full if nothing else is pending
+        self._journal_compact_at_final_write = False
+        self._journal_final_write_data: dict[str, Any] | None = None
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the journal path."""
+        return f"{self.path}.journal"
+
     def make_read_only(self) -> None:
         """Make the store read-only.
 
@@ -321,11 +360,15 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
             # We make a copy because code might assume it's safe to mutate loaded data
             # and we don't want that to mess with what we're trying to store.
-            data = deepcopy(data)
+            data = deepcopy(
+                {key: value for key, value in data.items() if key != "journal_func"}
+            )
         elif cache := self._manager.async_fetch(self.key):
             exists, data = cache
             if not exists:
                 return None
+            if self._journal:
+                await self.hass.async_add_executor_job(self._replay_journal, data)
         else:
             try:
                 data = await self.hass.async_add_executor_job(
@@ -388,6 +431,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if data == {}:
                 return None
 
+            if self._journal:
+                await self.hass.async_add_executor_job(self._replay_journal, data)
+
         # Add minor_version if not set
         if "minor_version" not in data:
             data["minor_version"] = 1
@@ -436,6 +482,30 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         await self._async_handle_write_data()
 
+    async def async_save_journal(
+        self,
+        data_func: Callable[[], _T],
+        journal_func: Callable[[], list[JournalRecord]],
+    ) -> None:
+        """Save the changed items to the journal.
+
+        Like async_delay_save_journal, but waits for the write. data_func is
+        only called when the data is written in full.
+        """
+        self._data = {
+            "version": self.version,
+            "minor_version": self.minor_version,
+            "key": self.key,
+            "data_func": data_func,
+            "journal_func": journal_func,
+        }
+
+        if self.hass.state is CoreState.stopping:
+            self._async_ensure_final_write_listener()
+            return
+
+        await self._async_handle_write_data()
+
     @callback
     def async_delay_save(
         self,
@@ -464,6 +534,27 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         # We use call_later directly here to avoid a circular import
         self._async_reschedule_delayed_write(next_when)
 
+    @callback
+    def async_delay_save_journal(
+        self,
+        data_func: Callable[[], _T],
+        journal_func: Callable[[], list[JournalRecord]],
+        delay: float = 0,
+    ) -> None:
+        """Save the changed items to the journal with an optional delay.
+
+        journal_func is called when the data is written and returns the
+        records of the items which changed since it was last called. The data
+        is written in full instead if this is not a journal store, no full
+        write happened since load or the journal grew too large. The journal
+        is compacted into the data file at the final write, so a release which
+        does not read the journal has all changes.
+        """
+        self.async_delay_save(data_func, delay)
+        if self._data is not None:
+            self._data["journal_func"] = journal_func
+            self._journal_compact_at_final_write = True
+
     @callback
     def _async_reschedule_delayed_write(self, when: float) -> None:
         """Reschedule a delayed write."""
@@ -518,6 +609,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if (final_write_data := self._journal_final_write_data) is not None:
+            if self._data is None:
+                self._data = final_write_data
+            # Compact the journal into the data file
+            self._data.pop("journal_func", None)
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -537,10 +633,49 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if self._read_only:
                 return
 
+            records: list[JournalRecord] | None = None
+            if (journal_func := data.pop("journal_func", None)) is not None:
+                records = journal_func()
+                if not self._journal_compacted or (
+                    self._journal_size + len(records) > JOURNAL_MAX_RECORDS
+                ):
+                    records = None
+                elif not records:
+                    return
+                else:
+                    data["journal"] = records
+                    data["journal_new"] = not self._journal_size
+            if self._journal:
+                generation = self._journal_generation
+                if records is None:
+                    generation += 1
+                data[JOURNAL_GENERATION] = generation
+
+            final_write_data: dict[str, Any] | None = None
+            if records is not None and self._journal_compact_at_final_write:
+                # Kept to write the data in full at the final write
+                final_write_data = {
+                    key: data[key]
+                    for key in ("version", "minor_version", "key", "data_func")
+                }
             try:
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
+                # Write all data next time as the changes are not in the journal
+                self._journal_compacted = False
+                return
+
+            if records is not None:
+                self._journal_size += len(records)
+                if final_write_data is not None:
+                    self._journal_final_write_data = final_write_data
+                    self._async_ensure_final_write_listener()
+            elif self._journal:
+                self._journal_compacted = True
+                self._journal_size = 0
+                self._journal_generation = generation
+                self._journal_final_write_data = None
 
     async def _async_write_data(self, path: str, data: dict) -> None:
         await self.hass.async_add_executor_job(self._write_data, self.path, data)
@@ -549,6 +684,31 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         """Write the data."""
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
+        if (records := data.get("journal")) is not None:
+            _LOGGER.debug(
+                "Appending %s records for %s to %s",
+                len(records),
+                self.key,
+                self.journal_path,
+            )
+            flags = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+            if data["journal_new"]:
+                # A journal left from an earlier generation is replaced
+                flags |= os.O_TRUNC
+                records = [{JOURNAL_GENERATION: data[JOURNAL_GENERATION]}, *records]
+            lines = self._journal_bytes(records)
+            try:
+                fd = os.open(
+                    self.journal_path, flags, 0o600 if self._private else 0o644
+                )
+                with os.fdopen(fd, "wb") as fdesc:
+                    fdesc.write(lines)
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+            except OSError as err:
+                raise WriteError(err) from err
+            return
+
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
@@ -560,6 +720,90 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             encoder=self._encoder,
             atomic_writes=self._atomic_writes,
         )
+        if self._journal:
+            # If this is not reached, the generation in the header of the
+            # journal no longer matches the data and it is not replayed
+            with suppress(FileNotFoundError):
+                os.unlink(self.journal_path)
+
+    def _journal_bytes(self, records: list[Any]) -> bytes:
+        """Encode journal records as JSON lines."""
+        # Same as save_json, only a custom encoder takes the slow path
+        encoder = self._encoder
+        custom_encoder = encoder is not None and encoder is not JSONEncoder
+        dump: Callable[[Any], Any] = (
+            json.dumps if custom_encoder else json_helper.json_dumps
+        )
+        try:
+            if custom_encoder:
+                return "".join(
+                    json.dumps(record, separators=(",", ":"), cls=encoder) + "\n"
+                    for record in records
+                ).encode()
+            return b"".join(
+                json_helper.json_bytes(record) + b"\n" for record in records
+            )
+        except TypeError as error:
+            formatted_data = json_util.format_unserializable_data(
+                json_helper.find_paths_unserializable_data(records, dump=dump)
+            )
+            msg = (
+                f"Failed to serialize to JSON: {self.journal_path}. "
+                f"Bad data at {formatted_data}"
+            )
+            _LOGGER.error(msg)
+            raise json_util.SerializationError(msg) from error
+
+    def _replay_journal(self, data: dict[str, Any]) -> None:
+        """Apply the records of the journal to loaded data.
+
+        Only a journal with the generation of the data is replayed, the data
+        already contains the records of older journals.
+        """
+        self._journal_generation = generation = data.get(JOURNAL_GENERATION, 0)
+        try:
+            with open(self.journal_path, "rb") as fdesc:
+                header, *lines = fdesc.read().splitlines()
+        except FileNotFoundError:
+            return
+        except ValueError:
+            # The journal is empty
+            return
+
+        try:
+            journal_generation = json_util.json_loads_object(header).get(
+                JOURNAL_GENERATION
+            )
+        except ValueError:
+            journal_generation = None
+        if journal_generation != generation:
+            _LOGGER.debug(
+                "Ignoring journal %s of generation %s, data is generation %s",
+                self.journal_path,
+                journal_generation,
+                generation,
+            )
+            return
+
+        records: list[Any] = []
+        for line in lines:
+            try:
+                records.append(json_util.json_loads(line))
+            except ValueError:
+                # The last record may be incomplete after an unclean shutdown
+                _LOGGER.warning(
+                    "Ignoring invalid record in journal %s", self.journal_path
+                )
+                break
+        _LOGGER.debug("Replaying %s journal records for %s", len(records), self.key)
+        self._apply_journal(data["data"], records)
+
+    def _apply_journal(self, data: Any, records: list[JournalRecord]) -> None:
+        """Apply journal records to loaded data.
+
+        Stores of data which is not a dict of lists of items override this.
+        """
+        apply_journal(data, records)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -573,3 +817,25 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal:
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(os.unlink, self.journal_path)
+
+
+def apply_journal(data: dict[str, Any], records: Iterable[JournalRecord]) -> None:
+    """Apply journal records to the lists of items in data.
+
+    Changed items keep their position, added items are appended.
+    """
+    collections: dict[str, dict[Any, Any]] = {}
+    for collection, id_key, item_id, item in records:
+        if (items := collections.get(collection)) is None:
+            items = collections[collection] = {
+                existing[id_key]: existing for existing in data.get(collection, ())
+            }
+        if item is None:
+            items.pop(item_id, None)
+        else:
+            items[item_id] = item
+    for collection, items in collections.items():
+        data[collection] = list(items.values())
@@ -5,7 +5,7 @@ from __future__ import annotations
 from collections import deque
 from collections.abc import Callable, Coroutine, Generator
 from contextlib import contextmanager
-from contextvars import ContextVar
+from contextvars import ContextVar, Token
 from functools import wraps
 from typing import Any
 
@@ -14,6 +14,11 @@ import homeassistant.util.dt as dt_util
 
 from .typing import TemplateVarsType
 
+TRACE_LEVEL_OFF = "off"
+TRACE_LEVEL_SUMMARY = "summary"
+TRACE_LEVEL_FULL = "full"
+TRACE_LEVELS = (TRACE_LEVEL_OFF, TRACE_LEVEL_SUMMARY, TRACE_LEVEL_FULL)
+
 
 class TraceElement:
     """Container for trace data."""
@@ -39,9 +44,13 @@ class TraceElement:
         self._result: dict[str, Any] | None = None
         self.reuse_by_child = False
         self._timestamp = dt_util.utcnow()
+        self._variables: dict[str, Any] = {}
+        self._last_variables: dict[str, Any] = {}
 
-        self._last_variables = variables_cv.get() or {}
-        self.update_variables(variables)
+        # Variables are only captured by full traces
+        if trace_level_cv.get() == TRACE_LEVEL_FULL:
+            self._last_variables = variables_cv.get() or {}
+            self.update_variables(variables)
 
     def __repr__(self) -> str:
         """Container for trace data."""
@@ -52,6 +61,11 @@ class TraceElement:
         self._child_key = child_key
         self._child_run_id = child_run_id
 
+    @property
+    def error(self) -> BaseException | None:
+        """Return the error of the traced step, if any."""
+        return self._error
+
     def set_error(self, ex: BaseException | None) -> None:
         """Set error."""
         self._error = ex
@@ -67,6 +81,8 @@ class TraceElement:
 
     def update_variables(self, variables: TemplateVarsType) -> None:
         """Update variables."""
+        if trace_level_cv.get() != TRACE_LEVEL_FULL:
+            return
         if variables is None:
             variables = {}
         last_variables = self._last_variables
@@ -110,6 +126,8 @@ trace_stack_cv: ContextVar[list[TraceElement] | None] = ContextVar(
 trace_path_stack_cv: ContextVar[list[str] | None] = ContextVar(
     "trace_path_stack_cv", default=None
 )
+# Level of detail of the current trace
+trace_level_cv: ContextVar[str] = ContextVar("trace_level_cv", default=TRACE_LEVEL_FULL)
 # Copy of last variables
 variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
 # (domain.item_id, Run ID)
@@ -132,6 +150,26 @@ def trace_id_get() -> tuple[str, str] | None:
     return trace_id_cv.get()
 
 
+def trace_level_set(level: str) -> Token[str]:
+    """Set the level of detail of the current trace."""
+    return trace_level_cv.set(level)
+
+
+def trace_level_reset(token: Token[str]) -> None:
+    """Restore the trace level which was active before trace_level_set."""
+    trace_level_cv.reset(token)
+
+
+def trace_level_get() -> str:
+    """Return the level of detail of the current trace."""
+    return trace_level_cv.get()
+
+
+def trace_recording() -> bool:
+    """Return True if trace elements are recorded in the current context."""
+    return trace_cv.get() is not None and trace_level_cv.get() != TRACE_LEVEL_OFF
+
+
 def trace_stack_push[_T](
     trace_stack_var: ContextVar[list[_T] | None], node: _T
 ) -> None:
@@ -183,6 +221,8 @@ def trace_append_element(
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
+    if trace_level_cv.get() == TRACE_LEVEL_OFF:
+        return
     if (trace := trace_cv.get()) is None:
         trace = {}
         trace_cv.set(trace)
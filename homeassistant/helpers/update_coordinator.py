@@ -4,12 +4,12 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Hashable
 from datetime import datetime, timedelta
 import logging
 from random import randint
 from time import monotonic
-from typing import Any, Generic, Protocol
+from typing import Any, Generic, Protocol, cast
 import urllib.error
 
 import aiohttp
@@ -30,6 +30,8 @@ from homeassistant.util.dt import utcnow
 from . import entity, event
 from .debounce import Debouncer
 from .frame import report
+from .poll_scheduler import async_get_poll_scheduler
+from .startup_trace import StartupPhases, async_trace_span
 from .typing import UNDEFINED, UndefinedType
 
 REQUEST_REFRESH_DEFAULT_COOLDOWN = 10
@@ -110,6 +112,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
         self._unsub_refresh: CALLBACK_TYPE | None = None
+        self._last_refresh_duration = 0.0
         self._unsub_shutdown: CALLBACK_TYPE | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
         self.last_update_success = True
@@ -230,17 +233,21 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         # than the debouncer cooldown, this would cause the debounce to never be called
         self._async_unsub_refresh()
 
-        # We use loop.call_at because DataUpdateCoordinator does
+        # We use the loop time because DataUpdateCoordinator does
         # not need an exact update interval which also avoids
-        # calling dt_util.utcnow() on every update.
+        # calling dt_util.utcnow() on every update. The poll scheduler
+        # may move the refresh earlier to spread out refreshes.
         hass = self.hass
         loop = hass.loop
 
-        next_refresh = (
-            int(loop.time()) + self._microsecond + self._update_interval_seconds
+        poll_scheduler = async_get_poll_scheduler(hass)
+        interval = poll_scheduler.async_adapt_interval(
+            self._update_interval_seconds, self._last_refresh_duration
         )
-        self._unsub_refresh = loop.call_at(
-            next_refresh, self.__wrap_handle_refresh_interval
+        self._unsub_refresh = poll_scheduler.async_call_at(
+            int(loop.time()) + self._microsecond + interval,
+            interval,
+            self.__wrap_handle_refresh_interval,
         ).cancel
 
     @callback
@@ -263,7 +270,13 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     async def _handle_refresh_interval(self, _now: datetime | None = None) -> None:
         """Handle a refresh interval occurrence."""
         self._unsub_refresh = None
-        await self._async_refresh(log_failures=True, scheduled=True)
+        if host_semaphore := async_get_poll_scheduler(self.hass).async_host_semaphore(
+            self.config_entry
+        ):
+            async with host_semaphore:
+                await self._async_refresh(log_failures=True, scheduled=True)
+        else:
+            await self._async_refresh(log_failures=True, scheduled=True)
 
     async def async_request_refresh(self) -> None:
         """Request a refresh.
@@ -305,12 +318,20 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 error_if_core=True,
                 error_if_integration=False,
             )
-        if await self.__wrap_async_setup():
-            await self._async_refresh(
-                log_failures=False, raise_on_auth_failed=True, raise_on_entry_error=True
-            )
-            if self.last_update_success:
-                return
+        with async_trace_span(
+            self.hass,
+            self.config_entry.domain if self.config_entry else self.name,
+            StartupPhases.FIRST_REFRESH,
+            self.config_entry.entry_id if self.config_entry else None,
+        ):
+            if await self.__wrap_async_setup():
+                await self._async_refresh(
+                    log_failures=False,
+                    raise_on_auth_failed=True,
+                    raise_on_entry_error=True,
+                )
+                if self.last_update_success:
+                    return
         ex = ConfigEntryNotReady()
         ex.__cause__ = self.last_exception
         raise ex
@@ -371,8 +392,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self._shutdown_requested or scheduled and self.hass.is_stopping:
             return
 
-        if log_timing := self.logger.isEnabledFor(logging.DEBUG):
-            start = monotonic()
+        start = monotonic()
 
         auth_failed = False
         previous_update_success = self.last_update_success
@@ -458,11 +478,12 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
                 self.logger.info("Fetching %s data recovered", self.name)
 
         finally:
-            if log_timing:
+            self._last_refresh_duration = monotonic() - start
+            if self.logger.isEnabledFor(logging.DEBUG):
                 self.logger.debug(
                     "Finished fetching %s data in %.3f seconds (success: %s)",
                     self.name,
-                    monotonic() - start,  # pylint: disable=possibly-used-before-assignment
+                    self._last_refresh_duration,
                     self.last_update_success,
                 )
             if not auth_failed and self._listeners and not self.hass.is_stopping:
@@ -529,6 +550,63 @@ class TimestampDataUpdateCoordinator(DataUpdateCoordinator[_DataT]):
             self.last_update_success_time = utcnow()
 
 
+class KeyedDataUpdateCoordinator[_KeyT: Hashable, _ValueT](
+    DataUpdateCoordinator[dict[_KeyT, _ValueT]]
+):
+    """DataUpdateCoordinator which only notifies listeners of changed keys.
+
+    The data is a dict, and the context a listener is added with is the key of
+    the data it depends on. When the data is updated, listeners are only called
+    if the value of their key changed, listeners without a context are always
+    called. All listeners are called when the update success changes.
+
+    Values are compared with the values of the previous update, so the update
+    method must return new values instead of modifying the previous ones.
+    """
+
+    _notified_data: dict[_KeyT, _ValueT] | None = None
+    _notified_success = False
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates.
+
+        The data may have been changed without notifying listeners while
+        there were none, the first listener starts from the current data.
+        """
+        if not self._listeners:
+            self._notified_data = self.data
+            self._notified_success = self.last_update_success
+        return super().async_add_listener(update_callback, context)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners of keys which changed."""
+        data = self.data
+        previous_data = self._notified_data
+        previous_success = self._notified_success
+        self._notified_data = data
+        self._notified_success = self.last_update_success
+        if (
+            data is None
+            or previous_data is None
+            or not self.last_update_success
+            or not previous_success
+        ):
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None:
+                update_callback()
+                continue
+            key = cast(_KeyT, context)
+            if data.get(key, UNDEFINED) != previous_data.get(key, UNDEFINED):
+                update_callback()
+
+
 class BaseCoordinatorEntity[
     _BaseDataUpdateCoordinatorT: BaseDataUpdateCoordinatorProtocol
 ](entity.Entity):
@@ -132,6 +132,9 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+# DATA_IMPORTED_MODULES is a dict used as an ordered set of the integration
+# modules imported while recording, see async_record_imported_modules
+DATA_IMPORTED_MODULES: HassKey[dict[str, None]] = HassKey("imported_modules")
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -644,6 +647,72 @@ def async_register_preload_platform(hass: HomeAssistant, platform_name: str) ->
         preload_platforms.append(platform_name)
 
 
+@callback
+def async_record_imported_modules(hass: HomeAssistant) -> None:
+    """Start recording the integration modules which are imported."""
+    hass.data[DATA_IMPORTED_MODULES] = {}
+
+
+@callback
+def async_stop_recording_imported_modules(hass: HomeAssistant) -> list[str]:
+    """Stop recording and return the imported integration modules in order."""
+    return list(hass.data.pop(DATA_IMPORTED_MODULES, ()))
+
+
+def _preload_modules(module_names: list[str]) -> None:
+    """Import modules, failures are ignored as they are imported again later.
+
+    This method is run in the executor.
+    """
+    for module_name in module_names:
+        if module_name in sys.modules:
+            continue
+        try:
+            importlib.import_module(module_name)
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Failed to preload module %s", module_name, exc_info=True)
+
+
+async def async_preload_modules(
+    hass: HomeAssistant,
+    integrations: Iterable[Integration],
+    module_names: Iterable[str],
+) -> None:
+    """Import the modules of integrations in the import executor.
+
+    Modules are only preloaded for the given integrations which allow being
+    imported in the executor. Imports are serialized in the import executor
+    to avoid import deadlocks, so each integration gets its own job and the
+    next job is only queued once it finished. The imports of the loader are
+    queued in between instead of waiting for all modules to be preloaded.
+    """
+    packages = {
+        integration.pkg_path: integration.domain
+        for integration in integrations
+        if integration.import_executor
+    }
+    domain_modules: dict[str, list[str]] = {}
+    for module_name in module_names:
+        if (domain := packages.get(module_name)) is None and (
+            domain := packages.get(module_name.rpartition(".")[0])
+        ) is None:
+            continue
+        domain_modules.setdefault(domain, []).append(module_name)
+    if not domain_modules:
+        return
+
+    if debug := _LOGGER.isEnabledFor(logging.DEBUG):
+        start = time.perf_counter()
+    for modules in domain_modules.values():
+        await hass.async_add_import_executor_job(_preload_modules, modules)
+    if debug:
+        _LOGGER.debug(
+            "Preloading modules of %s integrations took %.3f seconds",
+            len(domain_modules),
+            time.perf_counter() - start,
+        )
+
+
 class Integration:
     """An integration in Home Assistant."""
 
@@ -1081,6 +1150,9 @@ class Integration:
             )
             raise ImportError(f"Exception importing {self.pkg_path}") from err
 
+        if (imported := self.hass.data.get(DATA_IMPORTED_MODULES)) is not None:
+            imported[self.pkg_path] = None
+
         if preload_platforms:
             for platform_name in self.platforms_exists(self._platforms_to_preload):
                 with suppress(ImportError):
@@ -1289,6 +1361,9 @@ class Integration:
                 f"Exception importing {self.pkg_path}.{platform_name}"
             ) from err
 
+        if (imported := self.hass.data.get(DATA_IMPORTED_MODULES)) is not None:
+            imported[f"{self.pkg_path}.{platform_name}"] = None
+
         return cast(ModuleType, cache[full_name])
 
     def _import_platform(self, platform_name: str) -> ModuleType:
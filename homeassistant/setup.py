@@ -31,6 +31,7 @@ from .core import (
 from .exceptions import DependencyError, HomeAssistantError
 from .helpers import issue_registry as ir, singleton, translation
 from .helpers.issue_registry import IssueSeverity, async_create_issue
+from .helpers.startup_trace import StartupPhases, async_get_trace, async_trace_span
 from .helpers.typing import ConfigType
 from .util.async_ import create_eager_task
 from .util.hass_dict import HassKey
@@ -278,7 +279,8 @@ async def _async_setup_component(
     This method is a coroutine.
     """
     try:
-        integration = await loader.async_get_integration(hass, domain)
+        with async_trace_span(hass, domain, StartupPhases.MANIFEST):
+            integration = await loader.async_get_integration(hass, domain)
     except loader.IntegrationNotFound:
         _log_error_setup_error(hass, domain, None, "Integration not found.")
         if not hass.config.safe_mode and hass.config_entries.async_entries(domain):
@@ -317,8 +319,9 @@ async def _async_setup_component(
             translation.async_load_integrations(hass, integration_set), loop=hass.loop
         )
     # Validate all dependencies exist and there are no circular dependencies
-    if not await integration.resolve_dependencies():
-        return False
+    with async_trace_span(hass, domain, StartupPhases.MANIFEST):
+        if not await integration.resolve_dependencies():
+            return False
 
     # Process requirements as soon as possible, so we can import the component
     # without requiring imports to be in functions.
@@ -331,7 +334,8 @@ async def _async_setup_component(
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
     try:
-        component = await integration.async_get_component()
+        with async_trace_span(hass, domain, StartupPhases.IMPORT):
+            component = await integration.async_get_component()
     except ImportError as err:
         log_error(f"Unable to import component: {err}", err)
         return False
@@ -383,7 +387,10 @@ async def _async_setup_component(
 
     _LOGGER.info("Setting up %s", domain)
 
-    with async_start_setup(hass, integration=domain, phase=SetupPhases.SETUP):
+    with (
+        async_start_setup(hass, integration=domain, phase=SetupPhases.SETUP),
+        async_trace_span(hass, domain, StartupPhases.SETUP),
+    ):
         if hasattr(component, "PLATFORM_SCHEMA"):
             # Entity components have their own warning
             warn_task = None
@@ -568,15 +575,22 @@ async def async_process_deps_reqs(
     elif integration.domain in processed:
         return
 
-    if failed_deps := await _async_process_dependencies(hass, config, integration):
+    domain = integration.domain
+    if trace := async_get_trace(hass):
+        trace.async_add_dependencies(
+            domain, (*integration.dependencies, *integration.after_dependencies)
+        )
+
+    with async_trace_span(hass, domain, StartupPhases.DEPENDENCIES):
+        failed_deps = await _async_process_dependencies(hass, config, integration)
+    if failed_deps:
         raise DependencyError(failed_deps)
 
-    async with hass.timeout.async_freeze(integration.domain):
-        await requirements.async_get_integration_with_requirements(
-            hass, integration.domain
-        )
+    with async_trace_span(hass, domain, StartupPhases.REQUIREMENTS):
+        async with hass.timeout.async_freeze(domain):
+            await requirements.async_get_integration_with_requirements(hass, domain)
 
-    processed.add(integration.domain)
+    processed.add(domain)
 
 
 @core.callback
@@ -1411,6 +1411,9 @@ def mock_storage(data: dict[str, Any] | None = None) -> Generator[dict[str, Any]
         _LOGGER.debug("Writing data to %s: %s", store.key, data_to_write)
         raise_contains_mocks(data_to_write)
 
+        # Journal records are not kept, the written data is generated instead
+        for journal_key in ("journal", "journal_new", "journal_generation"):
+            data_to_write.pop(journal_key, None)
         if "data_func" in data_to_write:
             data_to_write["data"] = data_to_write.pop("data_func")()
 
@@ -1,10 +1,12 @@
 """The tests for the camera component."""
 
+import asyncio
 from collections.abc import Generator
 from http import HTTPStatus
 import io
 from types import ModuleType
-from unittest.mock import ANY, AsyncMock, Mock, PropertyMock, mock_open, patch
+from typing import Any
+from unittest.mock import ANY, AsyncMock, Mock, PropertyMock, call, mock_open, patch
 
 import pytest
 from syrupy.assertion import SnapshotAssertion
@@ -226,6 +228,91 @@ async def test_get_image_fails(hass: HomeAssistant) -> None:
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_shared_between_requests(hass: HomeAssistant) -> None:
+    """Test concurrent and recent requests share a fetched image."""
+    release = asyncio.Event()
+
+    async def _camera_image(*args: Any, **kwargs: Any) -> bytes:
+        await release.wait()
+        return b"Test"
+
+    demo_camera = camera.get_camera_from_entity_id(hass, "camera.demo_camera")
+    demo_camera._attr_frame_interval = 0
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=_camera_image,
+    ) as mock_camera_image:
+        tasks = [
+            hass.async_create_task(camera.async_get_image(hass, "camera.demo_camera"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        release.set()
+        images = await asyncio.gather(*tasks)
+        assert [image.content for image in images] == [b"Test"] * 3
+        assert mock_camera_image.call_count == 1
+
+        # The image expired after the frame interval
+        await camera.async_get_image(hass, "camera.demo_camera")
+        assert mock_camera_image.call_count == 2
+
+        # A recent image is reused, other sizes are fetched separately
+        for width, height in ((4, 3), (4, 3), (8, 6)):
+            image = await camera.async_get_image(
+                hass, "camera.demo_camera_png", width=width, height=height
+            )
+            assert image.content == b"Test"
+        assert mock_camera_image.call_count == 4
+        mock_camera_image.assert_called_with(width=8, height=6)
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_fetched_per_size(hass: HomeAssistant) -> None:
+    """Test sizes are passed to the camera and the kept sizes are bounded."""
+    with (
+        patch(
+            "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+            side_effect=lambda width=None, height=None: f"{width}x{height}".encode(),
+        ) as mock_camera_image,
+        patch(
+            "homeassistant.components.camera.scale_jpeg_camera_image",
+            side_effect=lambda image, width, height: image.content,
+        ) as mock_scale,
+        patch("homeassistant.components.camera.MAX_STILL_FETCHES", 2),
+    ):
+        for width, height in ((4, 3), (4, 3), (8, 6), (16, 12)):
+            image = await camera.async_get_image(
+                hass, "camera.demo_camera", width=width, height=height
+            )
+            assert image.content == f"{width}x{height}".encode()
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+        assert image.content == b"NonexNone"
+
+    assert mock_camera_image.mock_calls == [
+        call(width=4, height=3),
+        call(width=8, height=6),
+        call(width=16, height=12),
+        call(width=None, height=None),
+    ]
+    assert mock_scale.call_count == 3
+    demo_camera = camera.get_camera_from_entity_id(hass, "camera.demo_camera")
+    assert list(demo_camera._still_fetches) == [(16, 12), (None, None)]
+
+
+@pytest.mark.usefixtures("image_mock_url")
+async def test_get_image_failure_not_shared(hass: HomeAssistant) -> None:
+    """Test a failed fetch is not reused by the next request."""
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        side_effect=[None, b"Test"],
+    ):
+        with pytest.raises(HomeAssistantError):
+            await camera.async_get_image(hass, "camera.demo_camera")
+        image = await camera.async_get_image(hass, "camera.demo_camera")
+    assert image.content == b"Test"
+
+
 @pytest.mark.usefixtures("mock_camera")
 @pytest.mark.parametrize(
     ("filename_template", "expected_filename", "expected_issues"),
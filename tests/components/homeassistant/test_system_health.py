@@ -0,0 +1,26 @@
+"""Test Home Assistant system health."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.poll_scheduler import async_get_poll_scheduler
+from homeassistant.setup import async_setup_component
+
+from tests.common import get_system_health_info
+
+
+async def test_poll_scheduler_system_health(hass: HomeAssistant) -> None:
+    """Test the stats of the poll scheduler are included."""
+    assert await async_setup_component(hass, "homeassistant", {})
+    assert await async_setup_component(hass, "system_health", {})
+    await hass.async_block_till_done()
+
+    scheduler = async_get_poll_scheduler(hass)
+    scheduler.async_record_lag(0.5)
+    scheduler.async_record_lag(1.5)
+
+    info = await get_system_health_info(hass, "homeassistant")
+
+    assert info["polls"] == 2
+    assert info["scheduled_polls"] == 0
+    assert info["missed_poll_deadlines"] == 1
+    assert info["max_poll_lag"] == 1.5
+    assert info["stretched_poll_intervals"] == 0
@@ -3,11 +3,17 @@
 from http import HTTPStatus
 from pathlib import Path
 
+from aiohttp import hdrs
 from aiohttp.test_utils import TestClient
 import pytest
 
 from homeassistant.components.http import StaticPathConfig
-from homeassistant.components.http.static import CachingStaticResource
+from homeassistant.components.http.static import (
+    ASSET_CACHE,
+    CACHE_HEADER,
+    MAX_CACHED_ASSET_SIZE,
+    CachingStaticResource,
+)
 from homeassistant.const import EVENT_HOMEASSISTANT_START
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.http import KEY_ALLOW_CONFIGURED_CORS
@@ -63,3 +69,89 @@ async def test_async_register_static_paths(
     assert resp.status == HTTPStatus.OK
     resp = await client.get("/something_else/__init__.py")
     assert resp.status == HTTPStatus.OK
+
+
+async def test_static_resource_memory_cache(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test small files are served from memory with compression and ETags."""
+    app = hass.http.app
+    resource = CachingStaticResource("/static", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+    content = b"console.log('hello');\n" * 100
+    await hass.async_add_executor_job((tmp_path / "app.js").write_bytes, content)
+
+    resp = await mock_http_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "gzip, deflate"}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert resp.headers[hdrs.VARY] == hdrs.ACCEPT_ENCODING
+    assert resp.headers[hdrs.CACHE_CONTROL] == CACHE_HEADER
+    assert await resp.read() == content
+    etag = resp.headers[hdrs.ETAG]
+    assert tmp_path / "app.js" in ASSET_CACHE
+
+    resp = await mock_http_client.get(
+        "/static/app.js",
+        headers={hdrs.ACCEPT_ENCODING: "gzip", hdrs.IF_NONE_MATCH: etag},
+    )
+    assert resp.status == HTTPStatus.NOT_MODIFIED
+
+    # The uncompressed representation has its own ETag
+    resp = await mock_http_client.get(
+        "/static/app.js", headers={hdrs.ACCEPT_ENCODING: "", hdrs.IF_NONE_MATCH: etag}
+    )
+    assert resp.status == HTTPStatus.OK
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.read() == content
+
+    # Precompressed variants are preferred and changes are picked up
+    await hass.async_add_executor_job((tmp_path / "app.js").write_bytes, b"changed")
+    await hass.async_add_executor_job((tmp_path / "app.js.br").write_bytes, b"brotli")
+    resp = await mock_http_client.get(
+        "/static/app.js",
+        headers={hdrs.ACCEPT_ENCODING: "gzip, br"},
+        auto_decompress=False,
+    )
+    assert resp.status == HTTPStatus.OK
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "br"
+    assert resp.headers[hdrs.ETAG] != etag
+    assert await resp.read() == b"brotli"
+
+    # Codings refused with q=0 are skipped and the client preference wins
+    await hass.async_add_executor_job((tmp_path / "app.js").write_bytes, content)
+    for accept_encoding, expected in (
+        ("br;q=0, gzip", "gzip"),
+        ("gzip;q=0.5, br;q=0.2", "gzip"),
+        ("gzip;q=0, br;q=0", None),
+        ("*;q=0.1, br;q=0", "gzip"),
+        ("identity", None),
+    ):
+        resp = await mock_http_client.get(
+            "/static/app.js",
+            headers={hdrs.ACCEPT_ENCODING: accept_encoding},
+            auto_decompress=False,
+        )
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers.get(hdrs.CONTENT_ENCODING) == expected
+
+
+async def test_static_resource_large_file(
+    hass: HomeAssistant, mock_http_client: TestClient, tmp_path: Path
+) -> None:
+    """Test large files are not kept in memory."""
+    app = hass.http.app
+    resource = CachingStaticResource("/static", tmp_path)
+    app.router.register_resource(resource)
+    app[KEY_ALLOW_CONFIGURED_CORS](resource)
+    content = b"x" * (MAX_CACHED_ASSET_SIZE + 1)
+    await hass.async_add_executor_job((tmp_path / "large.bin").write_bytes, content)
+
+    for _ in range(2):
+        resp = await mock_http_client.get("/static/large.bin")
+        assert resp.status == HTTPStatus.OK
+        assert resp.headers[hdrs.CACHE_CONTROL] == CACHE_HEADER
+        assert await resp.read() == content
+    assert not ASSET_CACHE[tmp_path / "large.bin"].bodies
@@ -13,7 +13,11 @@ import paho.mqtt.client as paho_mqtt
 import pytest
 
 from homeassistant.components import mqtt
-from homeassistant.components.mqtt.client import RECONNECT_INTERVAL_SECONDS
+from homeassistant.components.mqtt.client import (
+    RECONNECT_INTERVAL_SECONDS,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.const import SUPPORTED_COMPONENTS
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -633,6 +637,49 @@ async def test_subscribe_topic_sys_root_and_wildcard_subtree_topic(
     assert recorded_calls[0].payload == "test-payload"
 
 
+@pytest.mark.parametrize(
+    ("topic", "matching_filters"),
+    [
+        ("a", {"#", "+", "a/#"}),
+        ("a/b", {"#", "+/b", "+/+", "a/#", "a/+", "a/b", "a/b/#"}),
+        ("a/b/c", {"#", "+/+/c", "a/#", "a/b/#"}),
+        ("b/b", {"#", "+/b", "+/+"}),
+        ("$SYS/b", {"$SYS/#", "$SYS/+"}),
+        ("a//c", {"#", "+/+/c", "a/#"}),
+    ],
+)
+def test_subscription_trie(topic: str, matching_filters: set[str]) -> None:
+    """Test the subscription trie matches topics like the MQTT specification."""
+    trie = SubscriptionTrie()
+    subscriptions = {
+        topic_filter: Subscription(topic_filter, False, Mock())
+        for topic_filter in (
+            "#",
+            "+",
+            "+/b",
+            "+/+",
+            "+/+/c",
+            "a/#",
+            "a/+",
+            "a/b",
+            "a/b/#",
+            "$SYS/#",
+            "$SYS/+",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    assert {sub.topic for sub in trie.matches(topic)} == matching_filters
+
+    for subscription in subscriptions.values():
+        trie.remove(subscription)
+    assert trie.matches(topic) == []
+    assert not trie._root.children
+    with pytest.raises(KeyError):
+        trie.remove(subscriptions["a/+"])
+
+
 async def test_subscribe_special_characters(
     hass: HomeAssistant,
     mqtt_mock_entry: MqttMockHAClientGenerator,
@@ -1249,6 +1296,101 @@ async def test_publish_error(
         assert "Failed to connect to MQTT server: Out of memory." in caplog.text
 
 
+@patch("homeassistant.components.mqtt.client.MAX_INFLIGHT_PUBLISHES", 2)
+async def test_publish_pipelined(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+) -> None:
+    """Test publishes do not wait for an ACK within the in-flight window."""
+    mqtt_mock = await mqtt_mock_entry()
+    await hass.async_block_till_done()
+    mids = iter(range(1000, 1010))
+    mqtt_client_mock.publish.reset_mock()
+    mqtt_client_mock.publish.side_effect = lambda *args: Mock(mid=next(mids), rc=0)
+
+    await mqtt.async_publish(hass, "test-topic", "one", qos=1)
+    await mqtt.async_publish(hass, "test-topic", "two", qos=1)
+    assert mqtt_client_mock.publish.call_count == 2
+
+    # The window is full, the next publish waits for an ACK
+    publish_task = hass.async_create_task(
+        mqtt.async_publish(hass, "test-topic", "three", qos=1)
+    )
+    await asyncio.sleep(0)
+    assert not publish_task.done()
+    assert mqtt_client_mock.publish.call_count == 2
+    stats = mqtt_mock().async_get_publish_stats()
+    assert stats["in_flight"] == 2
+    assert stats["queued"] == 1
+
+    mqtt_client_mock.on_publish(0, 0, 1000)
+    await publish_task
+    assert mqtt_client_mock.publish.call_count == 3
+
+    mqtt_client_mock.on_publish(0, 0, 1001)
+    mqtt_client_mock.on_publish(0, 0, 1002)
+    await hass.async_block_till_done()
+    stats = mqtt_mock().async_get_publish_stats()
+    assert stats["published"] == 3
+    assert stats["acked"] == 3
+    assert stats["in_flight"] == 0
+    assert stats["queued"] == 0
+    assert stats["max_queued"] == 1
+
+
+@patch("homeassistant.components.mqtt.client.MAX_INFLIGHT_PUBLISHES", 2)
+async def test_publish_invalid_releases_window(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+) -> None:
+    """Test a publish rejected by the client does not keep its window slot."""
+    mqtt_mock = await mqtt_mock_entry()
+    await hass.async_block_till_done()
+    mqtt_client_mock.publish.side_effect = ValueError(
+        "Publish topic cannot contain wildcards."
+    )
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            await mqtt.async_publish(hass, "test-topic/#", "one", qos=1)
+
+    mqtt_client_mock.publish.side_effect = lambda *args: Mock(mid=1000, rc=0)
+    async with asyncio.timeout(1):
+        await mqtt.async_publish(hass, "test-topic", "two", qos=1)
+    stats = mqtt_mock().async_get_publish_stats()
+    assert stats["published"] == 1
+    assert stats["in_flight"] == 1
+
+
+async def test_publish_cancelled_on_disconnect(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test publishes waiting for an ACK are cancelled on a disconnect."""
+    mqtt_mock = await mqtt_mock_entry()
+    await hass.async_block_till_done()
+    mids = iter(range(1000, 1010))
+    mqtt_client_mock.publish.side_effect = lambda *args: Mock(mid=next(mids), rc=0)
+
+    await mqtt.async_publish(hass, "test-topic", "one", qos=1)
+    await mqtt.async_publish(hass, "test-topic", "two", qos=1)
+    assert mqtt_mock().async_get_publish_stats()["in_flight"] == 2
+
+    mqtt_client_mock.on_disconnect(None, None, 0)
+    await hass.async_block_till_done()
+    stats = mqtt_mock().async_get_publish_stats()
+    assert stats["in_flight"] == 0
+    assert stats["timeouts"] == 0
+
+    # The timeout timers were cancelled as well
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=30))
+    await hass.async_block_till_done()
+    assert "No ACK from MQTT server" not in caplog.text
+
+
 async def test_subscribe_error(
     hass: HomeAssistant,
     setup_with_birth_msg_client_mock: MqttMockPahoClient,
@@ -1384,6 +1526,8 @@ async def test_handle_mqtt_timeout_on_callback(
 
         # Now call we publish without simulating and ACK callback
         await mqtt.async_publish(hass, "no_callback/test-topic", "test-payload")
+        # The publish does not wait for the ACK, wait for the timeout instead
+        await asyncio.sleep(0.3)
         await hass.async_block_till_done()
         # There is no ACK so we should see a timeout in the log after publishing
         assert len(mock_client.publish.mock_calls) == 1
@@ -39,6 +39,17 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [],
         "mqtt_config": default_config,
+        "publish_stats": {
+            "published": 0,
+            "acked": 0,
+            "timeouts": 0,
+            "in_flight": 0,
+            "queued": 0,
+            "max_queued": 0,
+            "average_latency": 0.0,
+            "max_latency": 0.0,
+        },
+        "subscription_stats": ANY,
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
 
@@ -124,6 +135,8 @@ async def test_entry_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": default_config,
+        "publish_stats": ANY,
+        "subscription_stats": ANY,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -133,6 +146,8 @@ async def test_entry_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": default_config,
+        "publish_stats": ANY,
+        "subscription_stats": ANY,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -253,6 +268,8 @@ async def test_redact_diagnostics(
         "connected": True,
         "devices": [expected_device],
         "mqtt_config": expected_config,
+        "publish_stats": ANY,
+        "subscription_stats": ANY,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -262,6 +279,8 @@ async def test_redact_diagnostics(
         "connected": True,
         "device": expected_device,
         "mqtt_config": expected_config,
+        "publish_stats": ANY,
+        "subscription_stats": ANY,
         "mqtt_debug_info": expected_debug_info,
     }
 
@@ -288,5 +307,7 @@ async def test_redact_diagnostics(
             "entities": [],
         },
         "mqtt_config": expected_config,
+        "publish_stats": ANY,
+        "subscription_stats": ANY,
         "mqtt_debug_info": {"entities": [], "triggers": []},
     }
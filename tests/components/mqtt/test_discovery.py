@@ -40,6 +40,7 @@ from homeassistant.helpers.dispatcher import (
     async_dispatcher_connect,
     async_dispatcher_send,
 )
+from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.service_info.mqtt import MqttServiceInfo
 from homeassistant.setup import async_setup_component
 from homeassistant.util.signal_type import SignalTypeFormat
@@ -670,6 +671,59 @@ async def test_rapid_rediscover(
     assert events[4].data["old_state"] is None
 
 
+async def test_discovered_entities_added_in_bulk(
+    hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
+) -> None:
+    """Test entities discovered by a burst of messages are added together."""
+    with patch.object(
+        EntityPlatform,
+        "_async_schedule_add_entities_for_entry",
+        autospec=True,
+        side_effect=EntityPlatform._async_schedule_add_entities_for_entry,
+    ) as mock_add_entities:
+        await mqtt_mock_entry()
+        # Discover the first entities to set up the platforms
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/binary_sensor/bla/config",
+            '{ "name": "Beer", "state_topic": "test-topic" }',
+        )
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/sensor/bla/config",
+            '{ "name": "Milk", "state_topic": "test-topic" }',
+        )
+        await hass.async_block_till_done()
+        mock_add_entities.reset_mock()
+
+        for idx in range(3):
+            async_fire_mqtt_message(
+                hass,
+                f"homeassistant/binary_sensor/bla{idx}/config",
+                f'{{ "name": "Beer{idx}", "state_topic": "test-topic" }}',
+            )
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/sensor/bla0/config",
+            '{ "name": "Milk0", "state_topic": "test-topic" }',
+        )
+        # The burst continues in a later event loop iteration
+        await asyncio.sleep(0)
+        async_fire_mqtt_message(
+            hass,
+            "homeassistant/binary_sensor/bla3/config",
+            '{ "name": "Beer3", "state_topic": "test-topic" }',
+        )
+        await hass.async_block_till_done()
+
+    assert hass.states.get("binary_sensor.beer0") is not None
+    assert hass.states.get("binary_sensor.beer3") is not None
+    assert hass.states.get("sensor.milk0") is not None
+    assert sorted(
+        len(add_call.args[1]) for add_call in mock_add_entities.mock_calls
+    ) == [1, 4]
+
+
 async def test_rapid_rediscover_unique(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
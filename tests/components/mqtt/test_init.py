@@ -214,6 +214,64 @@ async def test_value_template_value(hass: HomeAssistant) -> None:
         assert template_state_calls.call_count == 1
 
 
+@pytest.mark.parametrize(
+    ("value_template", "payload", "fast_path"),
+    [
+        ("{{ value_json.temperature }}", '{"temperature": 21.5}', True),
+        ("{{value_json['temperature']}}", '{"temperature": 21}', True),
+        ('{{ value_json["state"] }}', b'{"state": " ON "}', True),
+        ("{{ value_json.temperature }}", '{"other": 21}', False),
+        ("{{ value_json.temperature }}", '{"temperature": null}', False),
+        ("{{ value_json.temperature }}", '{"temperature": [1, 2]}', False),
+        ("{{ value_json.temperature }}", "not json", False),
+        ("{{ value_json.temperature }}", "[1, 2]", False),
+        ("{{ value_json.temperature | int }}", '{"temperature": 21.5}', False),
+    ],
+)
+async def test_value_template_json_key(
+    hass: HomeAssistant, value_template: str, payload: str, fast_path: bool
+) -> None:
+    """Test templates getting a key of a JSON payload render without Jinja."""
+    tpl = template.Template(value_template, hass=hass)
+    expected = template.Template(
+        value_template, hass=hass
+    ).async_render_with_possible_json_value(payload, "default")
+
+    val_tpl = mqtt.MqttValueTemplate(tpl)
+    with patch.object(
+        template.Template,
+        "async_render_with_possible_json_value",
+        autospec=True,
+        side_effect=template.Template.async_render_with_possible_json_value,
+    ) as render:
+        assert val_tpl.async_render_with_possible_json_value(payload, "default") == (
+            expected
+        )
+    assert render.called is not fast_path
+
+
+async def test_value_template_json_key_dict_attribute(hass: HomeAssistant) -> None:
+    """Test templates getting an attribute of a dict are rendered by Jinja."""
+    tpl = template.Template("{{ value_json.items }}", hass=hass)
+    val_tpl = mqtt.MqttValueTemplate(tpl)
+    assert val_tpl.async_render_with_possible_json_value('{"items": 1}').startswith(
+        "<built-in method items"
+    )
+
+
+async def test_receive_message_payload_json() -> None:
+    """Test the decoded JSON payload of a message is shared."""
+    msg = ReceiveMessage("topic", '{"state": "ON"}', 0, False, "topic", 0)
+    assert msg.payload_json == {"state": "ON"}
+    assert msg.payload_json is msg.payload_json
+    other = ReceiveMessage("topic", msg.payload, 0, False, "topic/#", 0)
+    assert other.payload_json is msg.payload_json
+
+    msg = ReceiveMessage("topic", "ON", 0, False, "topic", 0)
+    with pytest.raises(ValueError):
+        msg.payload_json  # noqa: B018
+
+
 async def test_value_template_fails(hass: HomeAssistant) -> None:
     """Test the rendering of MQTT value template fails."""
     entity = MockEntity(entity_id="sensor.test")
@@ -1118,6 +1176,46 @@ async def test_mqtt_ws_subscription_not_admin(
     assert response["error"]["message"] == "Unauthorized"
 
 
+async def test_mqtt_ws_subscription_stats(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    recorded_calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test the MQTT subscription statistics websocket command."""
+    await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "stats/chatty", record_calls)
+    await mqtt.async_subscribe(hass, "stats/+/quiet", record_calls)
+    for _ in range(3):
+        async_fire_mqtt_message(hass, "stats/chatty", "12345")
+    async_fire_mqtt_message(hass, "stats/1/quiet", "1")
+    await hass.async_block_till_done()
+    assert len(recorded_calls) == 4
+
+    client = await hass_ws_client(hass)
+    await client.send_json(
+        {"id": 5, "type": "mqtt/subscription_stats", "limit": 2, "reset": True}
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    chatty, quiet = response["result"]
+    assert chatty["topic"] == "stats/chatty"
+    assert chatty["callback"].endswith("record_calls")
+    assert chatty["entity_id"] is None
+    assert chatty["messages"] == 3
+    assert chatty["bytes_per_second"] > 0
+    assert chatty["callback_time"] >= 0
+    assert quiet["topic"] == "stats/+/quiet"
+    assert quiet["messages"] == 1
+
+    # The statistics were reset
+    await client.send_json({"id": 6, "type": "mqtt/subscription_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert all(stats["messages"] == 0 for stats in response["result"])
+
+
 async def test_dump_service(
     hass: HomeAssistant, mqtt_mock_entry: MqttMockHAClientGenerator
 ) -> None:
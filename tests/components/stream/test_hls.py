@@ -432,6 +432,49 @@ async def test_hls_max_segments(
     await stream.stop()
 
 
+async def test_hls_memory_budget(
+    hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
+) -> None:
+    """Test old segments are dropped when the segments exceed the memory budget."""
+    stream = create_stream(hass, STREAM_SOURCE, {}, dynamic_stream_settings())
+    stream_worker_sync.pause()
+    hls = stream.add_provider(HLS_PROVIDER)
+
+    hls_client = await hls_stream(stream)
+
+    with patch.object(hls.stream_settings, "hls_memory_budget", 2 * len(FAKE_PAYLOAD)):
+        for sequence in range(MAX_SEGMENTS):
+            segment = Segment(sequence=sequence, duration=SEGMENT_DURATION)
+            segment.init = INIT_BYTES
+            segment.parts = [
+                Part(
+                    duration=SEGMENT_DURATION / 2,
+                    has_keyframe=True,
+                    data=FAKE_PAYLOAD,
+                ),
+                Part(
+                    duration=SEGMENT_DURATION / 2,
+                    has_keyframe=False,
+                    data=FAKE_PAYLOAD,
+                ),
+            ]
+            hls.put(segment)
+            await hass.async_block_till_done()
+
+    # The segments in the playlist are kept
+    assert hls.sequences == list(
+        range(MAX_SEGMENTS - NUM_PLAYLIST_SEGMENTS - 1, MAX_SEGMENTS)
+    )
+
+    # The parts of a segment are served together
+    segment_response = await hls_client.get(f"/segment/{MAX_SEGMENTS - 1}.m4s")
+    assert segment_response.status == HTTPStatus.OK
+    assert await segment_response.read() == FAKE_PAYLOAD * 2
+
+    stream_worker_sync.resume()
+    await stream.stop()
+
+
 async def test_hls_playlist_view_discontinuity(
     hass: HomeAssistant, setup_component, hls_stream, stream_worker_sync
 ) -> None:
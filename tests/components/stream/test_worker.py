@@ -26,6 +26,7 @@ import av
 import numpy as np
 import pytest
 
+from homeassistant.components import camera
 from homeassistant.components.stream import KeyFrameConverter, Stream, create_stream
 from homeassistant.components.stream.const import (
     ATTR_SETTINGS,
@@ -114,6 +115,8 @@ class FakeAvInputStream:
         class FakeCodecContext:
             name = "h264"
             extradata = None
+            width = 480
+            height = 320
 
         self.codec_context = FakeCodecContext()
 
@@ -1028,6 +1031,112 @@ async def test_get_image(hass: HomeAssistant, h264_video, filename) -> None:
     await stream.stop()
 
 
+async def test_get_image_cached_per_keyframe(hass: HomeAssistant, h264_video) -> None:
+    """Test images are generated once per keyframe and size."""
+    await async_setup_component(hass, "stream", {"stream": {}})
+
+    # Since libjpeg-turbo is not installed on the CI runner, we use a mock
+    with patch(
+        "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+    ) as mock_turbo_jpeg_singleton:
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        keyframe_converter = KeyFrameConverter(
+            hass, hass.data[DOMAIN][ATTR_SETTINGS], dynamic_stream_settings()
+        )
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+
+    container = av.open(h264_video)
+    video_stream = container.streams.video[0]
+    keyframes = [
+        packet for packet in container.demux(video_stream) if packet.is_keyframe
+    ]
+    keyframe_converter.create_codec_context(video_stream.codec_context)
+    keyframe_converter.stash_keyframe_packet(keyframes[0])
+
+    assert await keyframe_converter.async_get_image() == EMPTY_8_6_JPEG
+    assert await keyframe_converter.async_get_image() == EMPTY_8_6_JPEG
+    assert encode.call_count == 1
+    assert encode.call_args[0][0].shape == (320, 480, 3)
+
+    # A smaller image is scaled, h264 can't be decoded at a reduced resolution
+    # so it shares the full resolution codec context
+    assert await keyframe_converter.async_get_image(width=120, height=80)
+    assert await keyframe_converter.async_get_image(width=120, height=80)
+    assert encode.call_count == 2
+    assert encode.call_args[0][0].shape == (80, 120, 3)
+    assert set(keyframe_converter._codec_contexts) == {0}
+    assert keyframe_converter._get_lowres(120, 80) == 0
+
+    # Decoders which support it decode at a reduced resolution
+    keyframe_converter._codec_name = "mjpeg"
+    assert keyframe_converter._get_lowres(120, 80) == 2
+    assert keyframe_converter._get_lowres(60, 40) == 3
+    assert keyframe_converter._get_lowres(480, 320) == 0
+    keyframe_converter._codec_name = "h264"
+
+    # The next keyframe is decoded again
+    keyframe_converter.stash_keyframe_packet(keyframes[1])
+    assert await keyframe_converter.async_get_image() == EMPTY_8_6_JPEG
+    assert encode.call_count == 3
+
+    container.close()
+
+
+async def test_camera_get_image_scaled_decodes_with_lowres(
+    hass: HomeAssistant,
+) -> None:
+    """Test a scaled camera still from the stream is decoded at a lower resolution."""
+    await async_setup_component(hass, "homeassistant", {})
+    await async_setup_component(hass, "stream", {"stream": {}})
+    await async_setup_component(hass, "camera", {"camera": {"platform": "demo"}})
+    await hass.async_block_till_done()
+
+    encoder = av.CodecContext.create("mjpeg", "w")
+    encoder.width = 480
+    encoder.height = 320
+    encoder.pix_fmt = "yuvj420p"
+    encoder.time_base = fractions.Fraction(1, 24)
+    frame = av.VideoFrame.from_ndarray(
+        np.zeros((320, 480, 3), dtype=np.uint8), format="rgb24"
+    ).reformat(format="yuvj420p")
+    packets = encoder.encode(frame) + encoder.encode(None)
+
+    with (
+        patch(
+            "homeassistant.components.demo.camera.DemoCamera.stream_source",
+            return_value="rtsp://some_source",
+        ),
+        patch(
+            "homeassistant.components.demo.camera.DemoCamera.use_stream_for_stills",
+            return_value=True,
+        ),
+        patch(
+            "homeassistant.components.camera.img_util.TurboJPEGSingleton"
+        ) as mock_turbo_jpeg_singleton,
+        patch.object(Stream, "start"),
+        patch(
+            "homeassistant.components.camera.scale_jpeg_camera_image",
+            side_effect=lambda image, width, height: image.content,
+        ),
+    ):
+        mock_turbo_jpeg_singleton.instance.return_value = mock_turbo_jpeg()
+        demo_camera = camera.get_camera_from_entity_id(hass, "camera.demo_camera")
+        stream = await demo_camera.async_create_stream()
+        keyframe_converter = stream._keyframe_converter
+        keyframe_converter.create_codec_context(encoder)
+        keyframe_converter.stash_keyframe_packet(packets[0])
+
+        image = await camera.async_get_image(
+            hass, "camera.demo_camera", width=120, height=80
+        )
+
+    assert image.content == EMPTY_8_6_JPEG
+    assert set(keyframe_converter._codec_contexts) == {2}
+    encode = mock_turbo_jpeg_singleton.instance.return_value.encode
+    assert encode.call_args[0][0].shape == (80, 120, 3)
+    encoder.close()
+
+
 async def test_worker_disable_ll_hls(hass: HomeAssistant) -> None:
     """Test that the worker disables ll-hls for hls inputs."""
     stream_settings = StreamSettings(
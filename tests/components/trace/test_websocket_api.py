@@ -44,6 +44,7 @@ async def _setup_automation_or_script(
     configs: list[dict[str, Any]],
     script_config: dict[str, Any] | None = None,
     stored_traces: int | None = None,
+    trace_config: dict[str, Any] | None = None,
 ) -> None:
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -67,6 +68,10 @@ async def _setup_automation_or_script(
                 config["trace"] = {}
                 config["trace"]["stored_traces"] = stored_traces
 
+    if trace_config is not None:
+        for config in configs.values() if domain == "script" else configs:
+            config["trace"] = {**config.get("trace", {}), **trace_config}
+
     assert await async_setup_component(hass, domain, {domain: configs})
 
 
@@ -788,6 +793,146 @@ async def test_trace_no_traces(
     assert len(_find_traces(response["result"], domain, "sun")) == 0
 
 
+@pytest.mark.parametrize(
+    ("domain", "prefix"), [("automation", "action"), ("script", "sequence")]
+)
+@pytest.mark.parametrize(
+    ("level", "num_traces", "has_variables"),
+    [("off", 0, False), ("summary", 1, False), ("full", 1, True)],
+)
+async def test_trace_level(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    prefix: str,
+    level: str,
+    num_traces: int,
+    has_variables: bool,
+) -> None:
+    """Test the level of detail of stored traces can be configured."""
+    msg_id = 1
+
+    def next_id():
+        nonlocal msg_id
+        msg_id += 1
+        return msg_id
+
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": [
+            {"variables": {"brightness": 100}},
+            {"event": "some_event"},
+        ],
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config={"level": level}
+    )
+
+    client = await hass_ws_client()
+
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    traces = _find_traces(response["result"], domain, "sun")
+    assert len(traces) == num_traces
+    if not num_traces:
+        return
+
+    await client.send_json(
+        {
+            "id": next_id(),
+            "type": "trace/get",
+            "domain": domain,
+            "item_id": "sun",
+            "run_id": traces[0]["run_id"],
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    trace = response["result"]
+    assert trace["last_step"] == f"{prefix}/1"
+    assert set(trace["trace"]) >= {f"{prefix}/0", f"{prefix}/1"}
+    assert ("changed_variables" in trace["trace"][f"{prefix}/0"][0]) is has_variables
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "random_value"),
+    [({"error_only": True}, 0.0), ({"sample_rate": 0.5}, 0.5)],
+)
+async def test_trace_stored_on_error_only(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain: str,
+    trace_config: dict[str, Any],
+    random_value: float,
+) -> None:
+    """Test runs which are not sampled or error_only are only stored if they fail."""
+    await async_setup_component(hass, "homeassistant", {})
+    msg_id = 1
+
+    def next_id():
+        nonlocal msg_id
+        msg_id += 1
+        return msg_id
+
+    sun_config = {
+        "id": "sun",
+        "triggers": {"platform": "event", "event_type": "test_event"},
+        "actions": {"service": "test.automation"},
+    }
+    moon_config = {
+        "id": "moon",
+        "triggers": {"platform": "event", "event_type": "test_event2"},
+        "actions": {"event": "another_event"},
+    }
+    star_config = {
+        "id": "star",
+        "triggers": {"platform": "event", "event_type": "test_event3"},
+        "actions": {"stop": "Failed", "error": True},
+    }
+    cloud_config = {
+        "id": "cloud",
+        "triggers": {"platform": "event", "event_type": "test_event4"},
+        "actions": {"condition": "template", "value_template": "{{ false }}"},
+    }
+    await _setup_automation_or_script(
+        hass,
+        domain,
+        [sun_config, moon_config, star_config, cloud_config],
+        trace_config=trace_config,
+    )
+
+    client = await hass_ws_client()
+
+    with patch(
+        "homeassistant.components.trace.util.random.random", return_value=random_value
+    ):
+        await _run_automation_or_script(hass, domain, sun_config, "test_event")
+        await _run_automation_or_script(hass, domain, moon_config, "test_event2")
+        await _run_automation_or_script(hass, domain, cloud_config, "test_event4")
+        await _run_automation_or_script(hass, domain, star_config, "test_event3")
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": next_id(), "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert _find_traces(response["result"], domain, "moon") == []
+    # A failing condition action aborts the run without an error
+    assert _find_traces(response["result"], domain, "cloud") == []
+    traces = _find_traces(response["result"], domain, "sun")
+    assert len(traces) == 1
+    assert traces[0]["error"] == "Action test.automation not found"
+    assert traces[0]["script_execution"] == "error"
+    traces = _find_traces(response["result"], domain, "star")
+    assert len(traces) == 1
+    assert traces[0]["script_execution"] == "aborted"
+
+
 @pytest.mark.parametrize(
     ("domain", "prefix", "trigger", "last_step", "script_execution"),
     [
@@ -25,6 +25,11 @@ from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.startup_trace import (
+    StartupPhases,
+    StartupSpan,
+    async_start_trace,
+)
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
 from homeassistant.util.json import json_loads
@@ -2563,6 +2568,35 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_startup_trace(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test getting the startup trace."""
+    await websocket_client.send_json({"id": 7, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_NOT_FOUND
+
+    trace = async_start_trace(hass)
+    trace.spans.append(
+        StartupSpan("august", StartupPhases.SETUP, trace.started, trace.started + 1.5)
+    )
+    trace.async_finish()
+
+    await websocket_client.send_json({"id": 8, "type": "integration/startup_trace"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["critical_path"] == [
+        {"domain": "august", "start": 0.0, "end": 1.5, "phases": {"setup": 1.5}}
+    ]
+    assert [event["name"] for event in msg["result"]["trace"]["traceEvents"]] == [
+        "process_name",
+        "thread_name",
+        "august setup",
+        "started",
+    ]
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     [
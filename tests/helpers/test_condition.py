@@ -1679,6 +1679,138 @@ async def test_numeric_state_multiple_entities(hass: HomeAssistant) -> None:
     assert not test(hass)
 
 
+async def test_numeric_and_state_conditions_compiled(hass: HomeAssistant) -> None:
+    """Test numeric_state and state conditions are compiled."""
+    config = {
+        "condition": "and",
+        "conditions": [
+            {
+                "condition": "numeric_state",
+                "entity_id": ["sensor.temperature_1", "sensor.temperature_2"],
+                "above": 10,
+                "below": 50,
+            },
+            {
+                "condition": "or",
+                "conditions": [
+                    {
+                        "condition": "state",
+                        "entity_id": ["sensor.mode_1", "sensor.mode_2"],
+                        "state": ["heat", "auto"],
+                        "match": "any",
+                    },
+                    {
+                        "condition": "state",
+                        "entity_id": "sensor.override",
+                        "state": "on",
+                    },
+                ],
+            },
+        ],
+    }
+    config = cv.CONDITION_SCHEMA(config)
+    config = await condition.async_validate_condition_config(hass, config)
+    test = await condition.async_from_config(hass, config)
+
+    hass.states.async_set("sensor.temperature_1", 20)
+    hass.states.async_set("sensor.temperature_2", 49)
+    hass.states.async_set("sensor.mode_1", "off")
+    hass.states.async_set("sensor.mode_2", "auto")
+    hass.states.async_set("sensor.override", "off")
+
+    with (
+        patch(
+            "homeassistant.helpers.condition.async_numeric_state",
+            wraps=condition.async_numeric_state,
+        ) as mock_numeric_state,
+        patch(
+            "homeassistant.helpers.condition.state", wraps=condition.state
+        ) as mock_state,
+    ):
+        token = trace.trace_level_set(trace.TRACE_LEVEL_OFF)
+        try:
+            assert test(hass)
+            hass.states.async_set("sensor.temperature_2", 50)
+            assert not test(hass)
+            hass.states.async_set("sensor.temperature_2", "unavailable")
+            assert not test(hass)
+            hass.states.async_set("sensor.temperature_2", 30)
+            hass.states.async_set("sensor.mode_2", "off")
+            assert not test(hass)
+            hass.states.async_set("sensor.override", "on")
+            assert test(hass)
+        finally:
+            trace.trace_level_reset(token)
+        assert trace.trace_get(clear=False) == {}
+
+        # The same trace as the checker's is recorded
+        hass.states.async_set("sensor.temperature_2", 50)
+        assert not test(hass)
+        assert_condition_trace(
+            {
+                "": [{"result": {"result": False}}],
+                "conditions/0": [{"result": {"result": False}}],
+                "conditions/0/entity_id/0": [{"result": {"result": True, "state": 20}}],
+                "conditions/0/entity_id/1": [
+                    {
+                        "result": {
+                            "result": False,
+                            "state": 50,
+                            "wanted_state_below": 50,
+                        }
+                    }
+                ],
+            }
+        )
+        hass.states.async_set("sensor.temperature_2", 30)
+        assert test(hass)
+        assert_condition_trace(
+            {
+                "": [{"result": {"result": True}}],
+                "conditions/0": [{"result": {"result": True}}],
+                "conditions/0/entity_id/0": [{"result": {"result": True, "state": 20}}],
+                "conditions/0/entity_id/1": [{"result": {"result": True, "state": 30}}],
+                "conditions/1": [{"result": {"result": True}}],
+                "conditions/1/conditions/0": [{"result": {"result": False}}],
+                "conditions/1/conditions/0/entity_id/0": [
+                    {
+                        "result": {
+                            "result": False,
+                            "state": "off",
+                            "wanted_state": "auto",
+                        }
+                    }
+                ],
+                "conditions/1/conditions/0/entity_id/1": [
+                    {
+                        "result": {
+                            "result": False,
+                            "state": "off",
+                            "wanted_state": "auto",
+                        }
+                    }
+                ],
+                "conditions/1/conditions/1": [{"result": {"result": True}}],
+                "conditions/1/conditions/1/entity_id/0": [
+                    {"result": {"result": True, "state": "on", "wanted_state": "on"}}
+                ],
+            }
+        )
+
+    # The checkers were not used
+    mock_numeric_state.assert_not_called()
+    mock_state.assert_not_called()
+
+    # Non numeric states and unknown entities fall back to the checker
+    hass.states.async_set("sensor.temperature_2", "warm")
+    with pytest.raises(ConditionError, match="cannot be processed as a number"):
+        test(hass)
+    hass.states.async_set("sensor.temperature_2", 30)
+    hass.states.async_remove("sensor.override")
+    with pytest.raises(ConditionError, match="unknown entity sensor.override"):
+        test(hass)
+
+
 async def test_numeric_state_attribute(hass: HomeAssistant) -> None:
     """Test with numeric state attribute in condition."""
     config = {
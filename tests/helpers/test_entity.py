@@ -2622,6 +2622,114 @@ async def test_get_hassjob_type(hass: HomeAssistant) -> None:
     assert ent_1.get_hassjob_type("update_callback") is HassJobType.Callback
 
 
+async def test_cache_calculated_state(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test the calculated state is reused until a cached property changes."""
+
+    class CachedStateEntity(entity.Entity):
+        """Entity which only changes its state by setting _attr_ properties."""
+
+        _cache_calculated_state = True
+        _attr_unique_id = "very_unique"
+        _attr_extra_state_attributes = {"level": 1}
+
+    ent = CachedStateEntity()
+    ent.entity_id = "test.cached"
+    ent._attr_state = "on"
+    platform = MockEntityPlatform(hass, domain="test")
+    await platform.async_add_entities([ent])
+    state = hass.states.get("test.cached")
+    assert state.state == "on"
+    assert state.attributes == {"level": 1}
+
+    with patch.object(
+        entity.Entity,
+        "_Entity__async_calculate_state",
+        autospec=True,
+        side_effect=entity.Entity._Entity__async_calculate_state,
+    ) as mock_calculate_state:
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 0
+        assert hass.states.get("test.cached") is state
+
+        # Setting the same value does not invalidate the calculated state
+        ent._attr_state = "on"
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 0
+
+        ent._attr_state = "off"
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 1
+        state = hass.states.get("test.cached")
+        assert state.state == "off"
+        assert state.attributes == {"level": 1}
+
+        entity_registry.async_update_entity("test.cached", name="Renamed")
+        await hass.async_block_till_done()
+        assert mock_calculate_state.call_count == 2
+        state = hass.states.get("test.cached")
+        assert state.attributes == {"level": 1, "friendly_name": "Renamed"}
+
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 2
+        assert hass.states.get("test.cached") is state
+
+
+async def test_cache_calculated_state_invalidated(hass: HomeAssistant) -> None:
+    """Test changed _attr_ properties and availability invalidate the state."""
+
+    class CachedStateEntity(entity.Entity):
+        """Entity with an availability computed in a property."""
+
+        _cache_calculated_state = True
+        _attr_should_poll = False
+        online = True
+
+        @property
+        def available(self) -> bool:
+            """Return if the entity is available."""
+            return self.online
+
+    ent = CachedStateEntity()
+    ent.entity_id = "test.cached"
+    ent._attr_state = "on"
+    ent._attr_extra_state_attributes = {"level": 1}
+    platform = MockEntityPlatform(hass, domain="test")
+    await platform.async_add_entities([ent])
+
+    with patch.object(
+        entity.Entity,
+        "_Entity__async_calculate_state",
+        autospec=True,
+        side_effect=entity.Entity._Entity__async_calculate_state,
+    ) as mock_calculate_state:
+        ent._attr_extra_state_attributes = {"level": 2}
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 1
+        assert hass.states.get("test.cached").attributes == {"level": 2}
+
+        # Setting the same mutable object again after changing it in place
+        ent._attr_extra_state_attributes["level"] = 3
+        ent._attr_extra_state_attributes = ent._attr_extra_state_attributes
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 2
+        assert hass.states.get("test.cached").attributes == {"level": 3}
+
+        del ent._attr_extra_state_attributes
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 3
+        assert hass.states.get("test.cached").attributes == {}
+
+        ent.online = False
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 4
+        assert hass.states.get("test.cached").state == STATE_UNAVAILABLE
+
+        ent.async_write_ha_state()
+        assert mock_calculate_state.call_count == 4
+
+
 async def test_async_write_ha_state_thread_safety(hass: HomeAssistant) -> None:
     """Test async_write_ha_state thread safety."""
     hass.config.debug = True
@@ -37,6 +37,7 @@ from homeassistant.helpers.entity_component import (
     EntityComponent,
 )
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.poll_scheduler import PollScheduler
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 import homeassistant.util.dt as dt_util
 
@@ -236,7 +237,7 @@ async def test_set_scan_interval_via_platform(hass: HomeAssistant) -> None:
 
     component = EntityComponent(_LOGGER, DOMAIN, hass)
 
-    with patch.object(hass.loop, "call_later") as mock_track:
+    with patch.object(PollScheduler, "async_call_later") as mock_track:
         await component.async_setup({DOMAIN: {"platform": "platform"}})
 
         await hass.async_block_till_done()
@@ -390,6 +391,45 @@ async def test_parallel_updates_async_platform_with_constant(
     assert handle._update_in_sequence is False
 
 
+async def test_parallel_service_calls_platform_with_constant(
+    hass: HomeAssistant,
+) -> None:
+    """Test platform can set parallel_service_calls limit."""
+    platform = MockPlatform()
+    platform.PARALLEL_SERVICE_CALLS = 5
+
+    mock_platform(hass, "platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    assert handle.parallel_service_calls is not None
+    assert handle.parallel_service_calls._value == 5
+
+
+async def test_service_call_timeout_platform_with_constant(
+    hass: HomeAssistant,
+) -> None:
+    """Test platform can set a service call timeout."""
+    platform = MockPlatform()
+    platform.SERVICE_CALL_TIMEOUT = 30
+
+    mock_platform(hass, "platform.test_domain", platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+    component._platforms = {}
+
+    await component.async_setup({DOMAIN: {"platform": "platform"}})
+    await hass.async_block_till_done()
+
+    handle = list(component._platforms.values())[-1]
+    assert handle.service_call_timeout == 30
+
+
 async def test_parallel_updates_sync_platform(hass: HomeAssistant) -> None:
     """Test sync platform parallel_updates default set to 1."""
     platform = MockPlatform()
@@ -1194,6 +1234,63 @@ async def test_device_info_called(
     assert device.via_device_id == via.id
 
 
+async def test_add_entities_same_device_info(
+    hass: HomeAssistant, device_registry: dr.DeviceRegistry
+) -> None:
+    """Test entities with the same device info are added in chunks."""
+    config_entry = MockConfigEntry(entry_id="super-mock-id")
+    config_entry.add_to_hass(hass)
+    device_info: DeviceInfo = {
+        "identifiers": {("hue", "1234")},
+        "name": "test-name",
+    }
+
+    async def async_setup_entry(
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Mock setup entry method."""
+        async_add_entities(
+            [
+                MockEntity(unique_id=f"qwer{idx}", device_info=dict(device_info))
+                for idx in range(5)
+            ]
+            + [
+                MockEntity(
+                    unique_id="asdf",
+                    device_info={**device_info, "sw_version": "test-sw"},
+                )
+            ]
+        )
+
+    platform = MockPlatform(async_setup_entry=async_setup_entry)
+    entity_platform = MockEntityPlatform(
+        hass, platform_name=config_entry.domain, platform=platform
+    )
+
+    with (
+        patch.object(
+            device_registry,
+            "async_get_or_create",
+            wraps=device_registry.async_get_or_create,
+        ) as mock_get_or_create,
+        patch("homeassistant.helpers.entity_platform.ADD_ENTITIES_CHUNK_SIZE", 2),
+    ):
+        assert await entity_platform.async_setup_entry(config_entry)
+        await hass.async_block_till_done()
+
+    assert len(hass.states.async_entity_ids()) == 6
+    # Only changed device info is merged into the device registry again
+    assert len(mock_get_or_create.mock_calls) == 2
+    device = device_registry.async_get_device(identifiers={("hue", "1234")})
+    assert device.sw_version == "test-sw"
+    assert all(
+        entity.device_entry.id == device.id
+        for entity in entity_platform.entities.values()
+    )
+
+
 async def test_device_info_not_overrides(
     hass: HomeAssistant, device_registry: dr.DeviceRegistry
 ) -> None:
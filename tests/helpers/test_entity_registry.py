@@ -458,6 +458,25 @@ async def test_filter_on_load(
     assert entry_disabled_user.disabled_by is er.RegistryEntryDisabler.USER
 
 
+async def test_journal_records(entity_registry: er.EntityRegistry) -> None:
+    """Test only changed entries are saved to the journal."""
+    entry1 = entity_registry.async_get_or_create("light", "hue", "1234")
+    entry2 = entity_registry.async_get_or_create("light", "hue", "5678")
+    entity_registry.async_get_or_create("light", "hue", "ABCD")
+    entity_registry._journal_records()
+
+    entry1 = entity_registry.async_update_entity(entry1.entity_id, name="Renamed")
+    entity_registry.async_remove(entry2.entity_id)
+    deleted_entry2 = entity_registry.deleted_entities[("light", "hue", "5678")]
+
+    assert entity_registry._journal_records() == [
+        ("entities", "id", entry1.id, entry1.as_storage_fragment),
+        ("entities", "id", entry2.id, None),
+        ("deleted_entities", "id", entry2.id, deleted_entry2.as_storage_fragment),
+    ]
+    assert entity_registry._journal_records() == []
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_load_bad_data(
     hass: HomeAssistant,
@@ -0,0 +1,97 @@
+"""Tests for the poll scheduler helper."""
+
+from datetime import timedelta
+from unittest.mock import Mock
+
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import poll_scheduler
+import homeassistant.util.dt as dt_util
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+
+async def test_spread_polls(hass: HomeAssistant) -> None:
+    """Test polls due in the same second are spread out earlier."""
+    scheduler = poll_scheduler.async_get_poll_scheduler(hass)
+    when = int(hass.loop.time()) + 30.5
+    target = Mock()
+
+    polls = [scheduler.async_call_at(when, 30, target) for _ in range(8)]
+
+    buckets = [int(poll.when) for poll in polls]
+    assert buckets[:4] == [int(when)] * 4
+    assert buckets[4:] == [int(when) - 1, int(when) - 2, int(when) - 3, int(when) - 4]
+    assert all(poll.when <= when for poll in polls)
+    assert scheduler.async_get_stats()["scheduled"] == 8
+
+    for poll in polls:
+        poll.cancel()
+    assert scheduler.async_get_stats()["scheduled"] == 0
+
+    # Polls are not moved earlier than half of their interval
+    polls = [scheduler.async_call_at(when, 2, target) for _ in range(6)]
+    assert [int(poll.when) for poll in polls] == [int(when)] * 4 + [int(when) - 1] * 2
+    for poll in polls:
+        poll.cancel()
+
+
+async def test_scheduled_poll_runs(hass: HomeAssistant) -> None:
+    """Test a scheduled poll runs its target."""
+    scheduler = poll_scheduler.async_get_poll_scheduler(hass)
+    target = Mock()
+
+    scheduler.async_call_later(10, target)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=5))
+    assert not target.called
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    assert target.called
+    stats = scheduler.async_get_stats()
+    assert stats["polls"] == 1
+    assert stats["scheduled"] == 0
+    assert stats["missed_deadlines"] == 0
+
+
+async def test_missed_deadlines(hass: HomeAssistant) -> None:
+    """Test polls which start late are counted."""
+    scheduler = poll_scheduler.async_get_poll_scheduler(hass)
+
+    scheduler.async_record_lag(0.2)
+    scheduler.async_record_lag(2.5)
+    scheduler.async_record_missed_deadline()
+    assert scheduler.async_get_stats() == {
+        "polls": 2,
+        "scheduled": 0,
+        "missed_deadlines": 2,
+        "max_lag": 2.5,
+        "stretched_intervals": 0,
+    }
+
+
+async def test_adapt_interval(hass: HomeAssistant) -> None:
+    """Test intervals are stretched after polls which take long."""
+    scheduler = poll_scheduler.async_get_poll_scheduler(hass)
+
+    assert scheduler.async_adapt_interval(30, 0) == 30
+    assert scheduler.async_adapt_interval(30, 15) == 30
+    assert scheduler.async_adapt_interval(30, 20) == 40
+    assert scheduler.async_adapt_interval(30, 45) == 60
+    assert scheduler.stretched_intervals == 2
+
+
+async def test_host_semaphore(hass: HomeAssistant) -> None:
+    """Test polls of the same integration and host share a semaphore."""
+    scheduler = poll_scheduler.async_get_poll_scheduler(hass)
+    entry_1 = MockConfigEntry(domain="test", data={CONF_HOST: "192.168.1.2"})
+    entry_2 = MockConfigEntry(domain="test", data={CONF_HOST: "192.168.1.2"})
+    entry_3 = MockConfigEntry(domain="test", data={CONF_HOST: "192.168.1.3"})
+    entry_4 = MockConfigEntry(domain="other", data={CONF_HOST: "192.168.1.2"})
+
+    semaphore = scheduler.async_host_semaphore(entry_1)
+    assert semaphore is not None
+    assert scheduler.async_host_semaphore(entry_2) is semaphore
+    assert scheduler.async_host_semaphore(entry_3) is not semaphore
+    assert scheduler.async_host_semaphore(entry_4) is not semaphore
+    assert scheduler.async_host_semaphore(MockConfigEntry(data={})) is None
+    assert scheduler.async_host_semaphore(None) is None
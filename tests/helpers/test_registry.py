@@ -1,5 +1,6 @@
 """Tests for the registry."""
 
+from dataclasses import dataclass, field
 from typing import Any
 
 from freezegun.api import FrozenDateTimeFactory
@@ -7,7 +8,15 @@ import pytest
 
 from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import storage
-from homeassistant.helpers.registry import SAVE_DELAY, SAVE_DELAY_LONG, BaseRegistry
+from homeassistant.helpers.registry import (
+    SAVE_DELAY,
+    SAVE_DELAY_LONG,
+    BaseRegistry,
+    BaseRegistryItems,
+    index_items,
+    index_value,
+    index_values,
+)
 
 from tests.common import async_fire_time_changed
 
@@ -27,6 +36,33 @@ class SampleRegistry(BaseRegistry):
         return {}
 
 
+@dataclass(frozen=True)
+class SampleEntry:
+    """Entry of a sample registry."""
+
+    area_id: str | None = None
+    labels: set[str] = field(default_factory=set)
+    categories: dict[str, str] = field(default_factory=dict)
+
+
+class SampleRegistryItems(BaseRegistryItems[SampleEntry]):
+    """Sample registry items with declared indexes."""
+
+    _indexed_values = {
+        "area_id": index_value("area_id"),
+        "categories": index_items("categories"),
+        "labels": index_values("labels"),
+    }
+
+    def _index_entry(self, key: str, entry: SampleEntry) -> None:
+        """Index an entry."""
+
+    def _unindex_entry(
+        self, key: str, replacement_entry: SampleEntry | None = None
+    ) -> None:
+        """Unindex an entry."""
+
+
 @pytest.mark.parametrize(
     "long_delay_state",
     [
@@ -69,3 +105,51 @@ async def test_async_schedule_save(
     async_fire_time_changed(hass)
     await hass.async_block_till_done()
     assert registry.save_calls == 2
+
+
+def test_registry_items_indexes() -> None:
+    """Test declared indexes are maintained."""
+    items = SampleRegistryItems()
+    entry_1 = SampleEntry(area_id="kitchen", labels={"a", "b"})
+    entry_2 = SampleEntry(area_id="kitchen", categories={"scope": "id"})
+    items["1"] = entry_1
+    items["2"] = entry_2
+    items["3"] = SampleEntry()
+
+    assert items.get_entries_for_index("area_id", "kitchen") == [entry_1, entry_2]
+    assert items.get_entries_for_index("area_id", None) == []
+    assert items.get_entries_for_index("labels", "a") == [entry_1]
+    assert items.get_entries_for_index("categories", ("scope", "id")) == [entry_2]
+    assert list(items.get_keys_for_index("labels", "b")) == ["1"]
+    assert set(items.get_index_values("area_id")) == {"kitchen"}
+
+    entry_1 = items["1"] = SampleEntry(area_id="garage", labels={"b"})
+    assert items.get_entries_for_index("area_id", "kitchen") == [entry_2]
+    assert items.get_entries_for_index("area_id", "garage") == [entry_1]
+    assert items.get_entries_for_index("labels", "a") == []
+    assert set(items.get_index_values("labels")) == {"b"}
+
+    del items["1"]
+    del items["2"]
+    assert set(items.get_index_values("area_id")) == set()
+    assert set(items.get_index_values("labels")) == set()
+    assert set(items.get_index_values("categories")) == set()
+
+    # Attributes which are not mappings are not indexed by index_items
+    entry_4 = items["4"] = SampleEntry(categories={"scope", "id"})  # type: ignore[arg-type]
+    assert set(items.get_index_values("categories")) == set()
+    assert items["4"] is entry_4
+
+
+def test_registry_items_index_failure() -> None:
+    """Test the indexes are unchanged when getting the values to index fails."""
+    items = SampleRegistryItems()
+    entry = items["1"] = SampleEntry(area_id="kitchen", labels={"a"})
+
+    with pytest.raises(TypeError):
+        items["1"] = SampleEntry(area_id="garage", labels=None)  # type: ignore[arg-type]
+
+    assert items["1"] is entry
+    assert items.get_entries_for_index("area_id", "kitchen") == [entry]
+    assert items.get_entries_for_index("labels", "a") == [entry]
+    assert set(items.get_index_values("area_id")) == {"kitchen"}
@@ -1,11 +1,13 @@
 """The tests for the Restore component."""
 
-from collections.abc import Coroutine
+from collections.abc import Callable, Coroutine, Generator
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 import logging
 from typing import Any
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.const import EVENT_HOMEASSISTANT_START, EVENT_HOMEASSISTANT_STOP
@@ -17,7 +19,9 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.reload import async_get_platform_without_config_entry
 from homeassistant.helpers.restore_state import (
     DATA_RESTORE_STATE,
+    STATE_FULL_DUMP_INTERVAL,
     STORAGE_KEY,
+    RestoredExtraData,
     RestoreEntity,
     RestoreStateData,
     StoredState,
@@ -42,6 +46,24 @@ DOMAIN = "test_domain"
 PLATFORM = "test_platform"
 
 
+@contextmanager
+def patch_save() -> Generator[AsyncMock]:
+    """Patch saving the restore states in full and to the journal.
+
+    The returned mock is called with all stored states either way.
+    """
+    with patch("homeassistant.helpers.restore_state.Store.async_save") as mock_save:
+
+        async def _save_journal(data_func: Callable[[], Any], *_: Any) -> None:
+            await mock_save(data_func())
+
+        with patch(
+            "homeassistant.helpers.restore_state.Store.async_save_journal",
+            side_effect=_save_journal,
+        ):
+            yield mock_save
+
+
 async def test_caching_data(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     now = dt_util.utcnow()
@@ -63,7 +85,7 @@ async def test_caching_data(hass: HomeAssistant) -> None:
             "homeassistant.helpers.restore_state.Store.async_load",
             side_effect=HomeAssistantError,
         ),
-        patch("homeassistant.helpers.restore_state.Store.async_save"),
+        patch_save(),
     ):
         # Failure to load should not be treated as fatal
         await async_load(hass)
@@ -72,9 +94,7 @@ async def test_caching_data(hass: HomeAssistant) -> None:
     assert data.last_states == {}
 
     # Mock that only b1 is present this run
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         await async_load(hass)
         await hass.async_block_till_done()
 
@@ -115,9 +135,7 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
     await data.store.async_save([])
 
     # Emulate a fresh load
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         hass.data.pop(DATA_RESTORE_STATE)
         await async_load(hass)
         data = async_get(hass)
@@ -131,25 +149,19 @@ async def test_periodic_write(hass: HomeAssistant) -> None:
 
     assert mock_write_data.called
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=15))
         await hass.async_block_till_done()
 
     assert mock_write_data.called
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
 
     assert mock_write_data.called
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
         await hass.async_block_till_done()
 
@@ -163,9 +175,7 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     await data.store.async_save([])
 
     # Emulate a fresh load
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         hass.data.pop(DATA_RESTORE_STATE)
         await async_load(hass)
         data = async_get(hass)
@@ -180,34 +190,26 @@ async def test_save_persistent_states(hass: HomeAssistant) -> None:
     # Startup Save
     assert mock_write_data.called
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=10))
         await hass.async_block_till_done()
 
     # Not quite the first interval
     assert not mock_write_data.called
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         await RestoreStateData.async_save_persistent_states(hass)
         await hass.async_block_till_done()
 
     assert mock_write_data.called
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=20))
         await hass.async_block_till_done()
     # Verify still saving
     assert mock_write_data.called
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
         await hass.async_block_till_done()
     # Verify normal shutdown
@@ -244,9 +246,7 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
     hass.states.async_set("input_boolean.b1", "on")
 
     # Mock that only b1 is present this run
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         state = await entity.async_get_last_state()
         await hass.async_block_till_done()
 
@@ -259,9 +259,7 @@ async def test_hass_starting(hass: HomeAssistant) -> None:
     assert not mock_write_data.called
 
     # Finish hass startup
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         hass.bus.async_fire(EVENT_HOMEASSISTANT_START)
         await hass.async_block_till_done()
 
@@ -307,9 +305,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     for state in states:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         await data.async_dump_states()
 
     assert mock_write_data.called
@@ -341,9 +337,7 @@ async def test_dump_data(hass: HomeAssistant) -> None:
     for state in states:
         hass.states.async_set(state.entity_id, state.state, state.attributes)
 
-    with patch(
-        "homeassistant.helpers.restore_state.Store.async_save"
-    ) as mock_write_data:
+    with patch_save() as mock_write_data:
         await data.async_dump_states()
 
     assert mock_write_data.called
@@ -391,6 +385,156 @@ async def test_dump_error(hass: HomeAssistant) -> None:
     assert mock_write_data.called
 
 
+async def test_dump_changed_states(
+    hass: HomeAssistant, freezer: FrozenDateTimeFactory
+) -> None:
+    """Test only changed states are saved to the journal between full dumps."""
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    for entity_id in ("input_boolean.b0", "input_boolean.b1", "input_boolean.b2"):
+        entity = RestoreEntity()
+        entity.hass = hass
+        entity.entity_id = entity_id
+        await platform.async_add_entities([entity])
+
+    data = async_get(hass)
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+    assert len(mock_write_data.mock_calls[0].args[0]) == 3
+
+    hass.states.async_set("input_boolean.b1", "on")
+    await entity.async_remove()
+    with (
+        patch(
+            "homeassistant.helpers.restore_state.Store.async_save_journal"
+        ) as mock_write_journal,
+        patch(
+            "homeassistant.helpers.restore_state.StoredState.as_dict",
+            autospec=True,
+            side_effect=StoredState.as_dict,
+        ) as mock_as_dict,
+    ):
+        await data.async_dump_states()
+        data_func, journal_func = mock_write_journal.mock_calls[0].args
+        records = journal_func()
+        # Only the changed states are serialized for the journal
+        assert mock_as_dict.call_count == 2
+        assert len(data_func()) == 3
+    assert [record[2] for record in records] == [
+        "input_boolean.b1",
+        "input_boolean.b2",
+    ]
+    assert json_round_trip(records[0][3])["state"]["state"] == "on"
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save_journal"
+    ) as mock_write_journal:
+        await data.async_dump_states()
+    assert mock_write_journal.mock_calls[0].args[1]() == []
+
+    freezer.tick(STATE_FULL_DUMP_INTERVAL)
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+    assert len(mock_write_data.mock_calls[0].args[0]) == 3
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states(full=True)
+    assert len(mock_write_data.mock_calls[0].args[0]) == 3
+
+
+async def test_dump_changed_extra_data(hass: HomeAssistant) -> None:
+    """Test changed extra data is journaled and stopping writes the journal."""
+
+    class ExtraDataEntity(RestoreEntity):
+        """Entity with extra data to restore."""
+
+        value = 1
+
+        @property
+        def extra_restore_state_data(self) -> RestoredExtraData:
+            """Return the extra data to restore."""
+            return RestoredExtraData({"value": self.value})
+
+    platform = MockEntityPlatform(hass, domain="input_boolean")
+    entity = ExtraDataEntity()
+    entity.hass = hass
+    entity.entity_id = "input_boolean.b0"
+    await platform.async_add_entities([entity])
+
+    data = async_get(hass)
+    with patch("homeassistant.helpers.restore_state.Store.async_save"):
+        await data.async_dump_states()
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save_journal"
+    ) as mock_write_journal:
+        await data.async_dump_states()
+        assert mock_write_journal.mock_calls[0].args[1]() == []
+
+        # The extra data changes without a state change
+        entity.value = 2
+        await data.async_dump_states()
+        records = mock_write_journal.mock_calls[1].args[1]()
+    assert [record[2] for record in records] == ["input_boolean.b0"]
+    assert records[0][3]["extra_data"] == {"value": 2}
+
+    with (
+        patch(
+            "homeassistant.helpers.restore_state.Store.async_save"
+        ) as mock_write_data,
+        patch(
+            "homeassistant.helpers.restore_state.Store.async_save_journal"
+        ) as mock_write_journal,
+    ):
+        data.async_setup_dump()
+        await hass.async_block_till_done()
+        entity.value = 3
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+        await hass.async_block_till_done()
+        records = mock_write_journal.mock_calls[-1].args[1]()
+
+    # Stopping only writes the changes to the journal
+    assert not mock_write_data.called
+    assert mock_write_journal.call_count == 2
+    assert records[0][3]["extra_data"] == {"value": 3}
+
+
+def test_restore_state_store_apply_journal(hass: HomeAssistant) -> None:
+    """Test journal records of states are applied to the loaded states."""
+    stored = [
+        {"state": {"entity_id": "input_boolean.b0", "state": "on"}},
+        {"state": {"entity_id": "input_boolean.b1", "state": "on"}},
+    ]
+    async_get(hass).store._apply_journal(
+        stored,
+        [
+            (
+                "states",
+                "entity_id",
+                "input_boolean.b0",
+                {"state": {"entity_id": "input_boolean.b0", "state": "off"}},
+            ),
+            ("states", "entity_id", "input_boolean.b1", None),
+            (
+                "states",
+                "entity_id",
+                "input_boolean.b2",
+                {"state": {"entity_id": "input_boolean.b2", "state": "on"}},
+            ),
+        ],
+    )
+    assert stored == [
+        {"state": {"entity_id": "input_boolean.b0", "state": "off"}},
+        {"state": {"entity_id": "input_boolean.b2", "state": "on"}},
+    ]
+
+
 async def test_load_error(hass: HomeAssistant) -> None:
     """Test that we cache data."""
     entity = RestoreEntity()
@@ -38,6 +38,7 @@ from homeassistant.helpers import (
     device_registry as dr,
     entity_registry as er,
     script,
+    service,
     template,
     trace,
 )
@@ -333,6 +334,110 @@ async def test_calling_service_template(hass: HomeAssistant) -> None:
     )
 
 
+async def test_calling_service_static_call_prepared_once(
+    hass: HomeAssistant, entity_registry: er.EntityRegistry
+) -> None:
+    """Test static service calls are prepared once and track entity ID changes."""
+    calls = async_mock_service(hass, "test", "script")
+    entry = entity_registry.async_get_or_create("light", "hue", "1234")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "action": "test.script",
+            "target": {"entity_id": entry.id},
+            "data": {"hello": "world"},
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch(
+        "homeassistant.helpers.script.service.async_prepare_call_from_config",
+        wraps=service.async_prepare_call_from_config,
+    ) as mock_prepare:
+        await script_obj.async_run(context=Context())
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+        assert len(mock_prepare.mock_calls) == 1
+
+        entity_registry.async_update_entity(
+            entry.entity_id, new_entity_id="light.renamed"
+        )
+        await hass.async_block_till_done()
+        await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+        assert len(mock_prepare.mock_calls) == 2
+
+    assert len(calls) == 3
+    assert [call.data for call in calls] == [
+        {"hello": "world", "entity_id": ["light.hue_1234"]},
+        {"hello": "world", "entity_id": ["light.hue_1234"]},
+        {"hello": "world", "entity_id": ["light.renamed"]},
+    ]
+
+
+async def test_calling_service_static_call_nested_data_copied(
+    hass: HomeAssistant,
+) -> None:
+    """Test nested data of static service calls is not shared between runs."""
+    calls: list[ServiceCall] = []
+
+    @callback
+    def mock_service(call: ServiceCall) -> None:
+        calls.append(call)
+        call.data["options"]["brightness"].append(0)
+        call.data["entity_id"].append("light.added")
+
+    hass.services.async_register("test", "script", mock_service)
+
+    sequence = cv.SCRIPT_SCHEMA(
+        {
+            "action": "test.script",
+            "target": {"entity_id": ["light.kitchen"]},
+            "data": {"options": {"brightness": [255]}},
+        }
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(context=Context())
+    await script_obj.async_run(context=Context())
+    await hass.async_block_till_done()
+
+    assert len(calls) == 2
+    assert [call.data for call in calls] == [
+        {
+            "options": {"brightness": [255, 0]},
+            "entity_id": ["light.kitchen", "light.added"],
+        },
+        {
+            "options": {"brightness": [255, 0]},
+            "entity_id": ["light.kitchen", "light.added"],
+        },
+    ]
+    assert calls[0].data["options"] is not calls[1].data["options"]
+
+
+async def test_calling_service_template_not_prepared_once(
+    hass: HomeAssistant,
+) -> None:
+    """Test service calls with templates are prepared on every run."""
+    calls = async_mock_service(hass, "test", "script")
+
+    sequence = cv.SCRIPT_SCHEMA(
+        {"action": "test.script", "data": {"hello": "{{ greeting }}"}}
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    await script_obj.async_run(
+        MappingProxyType({"greeting": "world"}), context=Context()
+    )
+    await script_obj.async_run(
+        MappingProxyType({"greeting": "moon"}), context=Context()
+    )
+    await hass.async_block_till_done()
+
+    assert [call.data["hello"] for call in calls] == ["world", "moon"]
+
+
 async def test_calling_service_response_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -4,6 +4,7 @@ import asyncio
 from collections.abc import Iterable
 from copy import deepcopy
 import io
+import logging
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -741,6 +742,46 @@ async def test_extract_entity_ids_from_floor(hass: HomeAssistant) -> None:
     )
 
 
+async def test_extract_entity_ids_from_area_cached(
+    hass: HomeAssistant,
+    area_registry: ar.AreaRegistry,
+    entity_registry: er.EntityRegistry,
+) -> None:
+    """Test resolved areas are cached until a registry is updated."""
+    area = area_registry.async_create("Kitchen")
+    entity_registry.async_get_or_create(
+        "light", "test", "1", suggested_object_id="ceiling"
+    )
+    entity_registry.async_update_entity("light.ceiling", area_id=area.id)
+    call = ServiceCall("light", "turn_on", {"area_id": area.id})
+
+    selected = service.async_extract_referenced_entity_ids(hass, call)
+    assert selected.indirectly_referenced == {"light.ceiling"}
+    # Modifying the returned selection does not modify the cache
+    selected.indirectly_referenced.add("light.other")
+
+    with patch(
+        "homeassistant.helpers.service._async_resolve_registry_targets",
+        wraps=service._async_resolve_registry_targets,
+    ) as mock_resolve:
+        selected = service.async_extract_referenced_entity_ids(hass, call)
+        assert selected.indirectly_referenced == {"light.ceiling"}
+        assert mock_resolve.call_count == 0
+
+        entity_registry.async_get_or_create(
+            "light", "test", "2", suggested_object_id="counter"
+        )
+        entity_registry.async_update_entity("light.counter", area_id=area.id)
+        selected = service.async_extract_referenced_entity_ids(hass, call)
+        assert selected.indirectly_referenced == {"light.ceiling", "light.counter"}
+        assert mock_resolve.call_count == 1
+
+        area_registry.async_delete(area.id)
+        selected = service.async_extract_referenced_entity_ids(hass, call)
+        assert selected.missing_areas == {area.id}
+        assert mock_resolve.call_count == 2
+
+
 @pytest.mark.usefixtures("label_mock")
 async def test_extract_entity_ids_from_labels(hass: HomeAssistant) -> None:
     """Test extract_entity_ids method with labels."""
@@ -1316,6 +1357,99 @@ async def test_call_with_both_required_features(
     ]
 
 
+async def test_call_limited_by_parallel_service_calls(
+    hass: HomeAssistant, mock_entities, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test the platform limits the number of entities called at the same time."""
+    platform = Mock(
+        parallel_service_calls=asyncio.Semaphore(2), service_call_timeout=None
+    )
+    for entity in mock_entities.values():
+        entity.platform = platform
+
+    running = 0
+    max_running = 0
+
+    async def handle_service(entity: MockEntity, call: ServiceCall) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0)
+        running -= 1
+
+    caplog.set_level(logging.DEBUG, logger="homeassistant.helpers.service")
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        HassJob(handle_service),
+        ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
+    )
+
+    assert max_running == 2
+    assert "Service call test_domain.test_service took" in caplog.text
+    assert "for 4 entities: light." in caplog.text
+
+
+async def test_call_timeout(
+    hass: HomeAssistant, mock_entities, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test slow entities are reported when the platform sets a timeout."""
+    platform = Mock(parallel_service_calls=None, service_call_timeout=0.01)
+    for entity in mock_entities.values():
+        entity.platform = platform
+    called = []
+
+    async def handle_service(entity: MockEntity, call: ServiceCall) -> None:
+        if entity.entity_id == "light.bedroom":
+            await asyncio.sleep(1)
+        called.append(entity.entity_id)
+
+    with pytest.raises(
+        exceptions.HomeAssistantError,
+        match="Timeout after 0.01 seconds calling service for light.bedroom",
+    ):
+        await service.entity_service_call(
+            hass,
+            mock_entities,
+            HassJob(handle_service),
+            ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
+        )
+
+    assert called == ["light.kitchen", "light.living_room", "light.bathroom"]
+    assert (
+        "Entity light.bedroom did not handle the service call within 0.01 seconds"
+        in caplog.text
+    )
+
+    # A single entity is limited as well
+    with pytest.raises(exceptions.HomeAssistantError, match="light.bedroom"):
+        await service.entity_service_call(
+            hass,
+            mock_entities,
+            HassJob(handle_service),
+            ServiceCall("test_domain", "test_service", {"entity_id": "light.bedroom"}),
+        )
+
+    # Waiting for PARALLEL_UPDATES does not count toward the timeout
+    platform.service_call_timeout = 0.05
+    parallel_updates = asyncio.Semaphore(1)
+    for entity in mock_entities.values():
+        entity.parallel_updates = parallel_updates
+    called.clear()
+
+    async def handle_service_slowly(entity: MockEntity, call: ServiceCall) -> None:
+        await asyncio.sleep(0.02)
+        called.append(entity.entity_id)
+
+    await service.entity_service_call(
+        hass,
+        mock_entities,
+        HassJob(handle_service_slowly),
+        ServiceCall("test_domain", "test_service", {"entity_id": "all"}),
+    )
+    assert len(called) == 4
+
+
 async def test_call_with_one_of_required_features(
     hass: HomeAssistant, mock_entities
 ) -> None:
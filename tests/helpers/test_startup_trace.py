@@ -0,0 +1,105 @@
+"""Tests for the startup trace helper."""
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import startup_trace
+from homeassistant.helpers.startup_trace import StartupPhases, StartupSpan, StartupTrace
+from homeassistant.setup import async_setup_component
+
+from tests.common import MockModule, mock_integration
+
+
+def test_critical_path_and_chrome_trace() -> None:
+    """Test the critical path follows the dependencies which finished last."""
+    trace = StartupTrace()
+    trace.started = 100.0
+    trace.spans = [
+        StartupSpan("http", StartupPhases.IMPORT, 100.0, 100.5),
+        StartupSpan("http", StartupPhases.SETUP, 100.5, 102.0),
+        StartupSpan("auth", StartupPhases.SETUP, 100.0, 101.0),
+        StartupSpan("api", StartupPhases.DEPENDENCIES, 100.1, 102.0),
+        StartupSpan("api", StartupPhases.SETUP, 102.0, 102.5),
+        StartupSpan("hue", StartupPhases.CONFIG_ENTRY_SETUP, 101.0, 104.0, "entry1"),
+        StartupSpan("hue", StartupPhases.CONFIG_ENTRY_SETUP, 101.0, 103.0, "entry2"),
+    ]
+    trace.dependencies = {"api": {"http", "auth"}, "http": {"not_loaded"}}
+
+    assert trace.async_critical_path() == [
+        {
+            "domain": "hue",
+            "start": 1.0,
+            "end": 4.0,
+            "phases": {"config_entry_setup": 3.0},
+        },
+    ]
+
+    trace.dependencies["hue"] = {"api"}
+    trace.async_finish()
+    trace.finished = 104.5
+    trace.async_add_dependencies("hue", {"auth"})
+    assert trace.dependencies["hue"] == {"api"}
+    assert [item["domain"] for item in trace.async_critical_path()] == [
+        "http",
+        "api",
+        "hue",
+    ]
+    assert trace.async_critical_path()[0]["phases"] == {"import": 0.5, "setup": 1.5}
+
+    events = trace.async_chrome_trace()["traceEvents"]
+    assert events[0]["ph"] == "M"
+    assert {event["args"]["name"] for event in events[1:] if event["ph"] == "M"} == {
+        "http",
+        "auth",
+        "api",
+        "hue",
+    }
+    spans = [event for event in events if event["ph"] == "X"]
+    assert len(spans) == 7
+    assert spans[0] == {
+        "name": "http import",
+        "cat": "import",
+        "ph": "X",
+        "pid": 1,
+        "tid": 1,
+        "ts": 0,
+        "dur": 500000,
+    }
+    assert [
+        event["args"] for event in spans if event["name"] == "hue config_entry_setup"
+    ] == [{"group": "entry1"}, {"group": "entry2"}]
+    assert events[-1] == {
+        "name": "started",
+        "ph": "i",
+        "s": "g",
+        "pid": 1,
+        "ts": 4500000,
+    }
+
+
+async def test_setup_is_traced(hass: HomeAssistant) -> None:
+    """Test the phases of the integration setups are recorded."""
+    assert startup_trace.async_get_trace(hass) is None
+    trace = startup_trace.async_start_trace(hass)
+    mock_integration(hass, MockModule("comp_dep"))
+    mock_integration(hass, MockModule("comp", dependencies=["comp_dep"]))
+
+    assert await async_setup_component(hass, "comp", {})
+
+    assert startup_trace.async_get_trace(hass) is trace
+    assert trace.dependencies["comp"] == {"comp_dep"}
+    assert {span.phase for span in trace.spans if span.integration == "comp"} == {
+        StartupPhases.MANIFEST,
+        StartupPhases.DEPENDENCIES,
+        StartupPhases.REQUIREMENTS,
+        StartupPhases.IMPORT,
+        StartupPhases.SETUP,
+    }
+    assert [item["domain"] for item in trace.async_critical_path()] == [
+        "comp_dep",
+        "comp",
+    ]
+
+    trace.async_finish()
+    spans = len(trace.spans)
+    mock_integration(hass, MockModule("comp_later"))
+    assert await async_setup_component(hass, "comp_later", {})
+    assert len(trace.spans) == spans
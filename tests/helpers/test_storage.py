@@ -19,9 +19,9 @@ from homeassistant.const import (
 )
 from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import issue_registry as ir, storage
+from homeassistant.helpers import issue_registry as ir, json as json_helper, storage
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.color import RGBColor
 
 from tests.common import (
@@ -1046,6 +1046,38 @@ async def test_store_manager_caching(
         await hass.async_stop(force=True)
 
 
+async def test_store_manager_large_files_not_preloaded(
+    tmpdir: py.path.local,
+) -> None:
+    """Test store manager only parses large files when their store loads."""
+    loop = asyncio.get_running_loop()
+
+    def _setup_mock_storage():
+        config_dir = tmpdir.mkdir("temp_config")
+        tmp_storage = config_dir.mkdir(".storage")
+        tmp_storage.join("small").write_binary(
+            json_bytes({"data": {"small": "small"}, "version": 1})
+        )
+        tmp_storage.join("large").write_binary(
+            json_bytes({"data": {"large": "large" * 100}, "version": 1})
+        )
+        return config_dir
+
+    config_dir = await loop.run_in_executor(None, _setup_mock_storage)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store_manager = storage.get_internal_store_manager(hass)
+        await store_manager.async_initialize()
+        with patch.object(storage, "PRELOAD_MAX_SIZE", 100):
+            await store_manager.async_preload(["small", "large"])
+
+        assert "small" in store_manager._data_preload
+        assert "large" not in store_manager._data_preload
+        store = storage.Store(hass, 1, "large")
+        assert await store.async_load() == {"large": "large" * 100}
+        await hass.async_stop(force=True)
+
+
 async def test_store_manager_sub_dirs(tmpdir: py.path.local) -> None:
     """Test store manager ignores subdirs."""
     loop = asyncio.get_running_loop()
@@ -1180,3 +1212,220 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_journal(tmpdir: py.path.local) -> None:
+    """Test changed items are appended to the journal and replayed on load."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        items = {"1": {"id": "1", "name": "one"}, "2": {"id": "2", "name": "two"}}
+        records: list[storage.JournalRecord] = []
+
+        def data_func() -> dict[str, Any]:
+            return {"items": list(items.values())}
+
+        def journal_func() -> list[storage.JournalRecord]:
+            changed = records.copy()
+            records.clear()
+            return changed
+
+        async def delay_save() -> None:
+            store.async_delay_save_journal(data_func, journal_func, 0)
+            await asyncio.sleep(0)
+            await hass.async_block_till_done()
+
+        def read_files() -> tuple[str, str | None]:
+            with open(store.path, encoding="utf-8") as data_file:
+                data = data_file.read()
+            if not os.path.exists(store.journal_path):
+                return (data, None)
+            with open(store.journal_path, encoding="utf-8") as journal_file:
+                return (data, journal_file.read())
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await store.async_load() is None
+
+        # The first write after load writes all data
+        records.append(("items", "id", "1", items["1"]))
+        await delay_save()
+        data, journal = await hass.async_add_executor_job(read_files)
+        assert journal is None
+
+        items["2"] = item_2 = {"id": "2", "name": "deux"}
+        items["3"] = {"id": "3", "name": "three"}
+        del items["1"]
+        records.extend(
+            [
+                ("items", "id", "2", item_2),
+                ("items", "id", "3", items["3"]),
+                ("items", "id", "1", None),
+            ]
+        )
+        await delay_save()
+        assert await hass.async_add_executor_job(read_files) == (
+            data,
+            '{"journal_generation":1}\n'
+            '["items","id","2",{"id":"2","name":"deux"}]\n'
+            '["items","id","3",{"id":"3","name":"three"}]\n'
+            '["items","id","1",null]\n',
+        )
+
+        # Nothing is written when nothing changed
+        await delay_save()
+        assert (await hass.async_add_executor_job(read_files))[0] == data
+
+        # An incomplete record is ignored
+        def write_incomplete_record() -> None:
+            with open(store.journal_path, "a", encoding="utf-8") as journal_file:
+                journal_file.write('["items","id","4",{"id"')
+
+        await hass.async_add_executor_job(write_incomplete_record)
+        new_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await new_store.async_load() == {
+            "items": [{"id": "2", "name": "deux"}, {"id": "3", "name": "three"}]
+        }
+
+        # Writing all data removes the journal
+        with patch.object(storage, "JOURNAL_MAX_RECORDS", 0):
+            records.append(("items", "id", "2", item_2))
+            await delay_save()
+        data, journal = await hass.async_add_executor_job(read_files)
+        assert journal is None
+        assert json.loads(data)["data"] == data_func()
+        assert json.loads(data)["journal_generation"] == 2
+
+        # The journal is compacted into the data at the final write
+        items["4"] = {"id": "4", "name": "four"}
+        records.append(("items", "id", "4", items["4"]))
+        await delay_save()
+        assert (await hass.async_add_executor_job(read_files))[1] is not None
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        data, journal = await hass.async_add_executor_job(read_files)
+        assert journal is None
+        assert json.loads(data)["data"] == data_func()
+        assert json.loads(data)["journal_generation"] == 3
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_crash_before_unlink(tmpdir: py.path.local) -> None:
+    """Test a journal left behind by a crash after a full write is not replayed."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        items = {"1": {"id": "1", "name": "one"}}
+        records: list[storage.JournalRecord] = []
+
+        def data_func() -> dict[str, Any]:
+            return {"items": list(items.values())}
+
+        def journal_func() -> list[storage.JournalRecord]:
+            changed = records.copy()
+            records.clear()
+            return changed
+
+        async def delay_save() -> None:
+            store.async_delay_save_journal(data_func, journal_func, 0)
+            await asyncio.sleep(0)
+            await hass.async_block_till_done()
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_load()
+        await delay_save()
+
+        items["2"] = {"id": "2", "name": "two"}
+        records.append(("items", "id", "2", items["2"]))
+        await delay_save()
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        # Crash between the full write and the removal of the journal
+        items["2"] = {"id": "2", "name": "deux"}
+        del items["1"]
+        with (
+            patch.object(storage, "JOURNAL_MAX_RECORDS", 0),
+            patch("homeassistant.helpers.storage.os.unlink"),
+        ):
+            records.append(("items", "id", "2", items["2"]))
+            records.append(("items", "id", "1", None))
+            await delay_save()
+        assert await hass.async_add_executor_job(os.path.exists, store.journal_path)
+
+        new_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await new_store.async_load() == {"items": [{"id": "2", "name": "deux"}]}
+
+        # The first append of the new generation replaces the stale journal
+        await new_store.async_save(data_func())
+        items["3"] = {"id": "3", "name": "three"}
+        records.append(("items", "id", "3", items["3"]))
+        store = new_store
+        await delay_save()
+        final_store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        assert await final_store.async_load() == data_func()
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_replayed_on_preloaded_data(tmpdir: py.path.local) -> None:
+    """Test the journal is replayed on data from the preload cache."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        await store.async_load()
+        await store.async_save_journal(lambda: {"items": [{"id": "1"}]}, list)
+        await store.async_save_journal(
+            lambda: {"items": []}, lambda: [("items", "id", "2", {"id": "2"})]
+        )
+        await hass.async_stop(force=True)
+
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        manager = storage.get_internal_store_manager(hass)
+        await manager.async_initialize()
+        await manager.async_preload([MOCK_KEY])
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, journal=True)
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json"
+        ) as mock_load_json:
+            assert await store.async_load() == {"items": [{"id": "1"}, {"id": "2"}]}
+        assert not mock_load_json.called
+
+        await hass.async_stop(force=True)
+
+
+async def test_journal_serialization_error(tmpdir: py.path.local) -> None:
+    """Test journal records are encoded with the encoder of the store."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(
+            hass, MOCK_VERSION, MOCK_KEY, encoder=json_helper.JSONEncoder, journal=True
+        )
+        assert store._journal_bytes([("items", "id", "1", {"id": "1"})]) == (
+            b'["items","id","1",{"id":"1"}]\n'
+        )
+        with pytest.raises(json_util.SerializationError):
+            store._journal_bytes([("items", "id", "1", {"id": object()})])
+
+        await hass.async_stop(force=True)
+
+
+def test_apply_journal() -> None:
+    """Test applying journal records keeps the position of changed items."""
+    data = {"items": [{"id": "1"}, {"id": "2"}, {"id": "3"}], "other": []}
+    storage.apply_journal(
+        data,
+        [
+            ("items", "id", "2", {"id": "2", "changed": True}),
+            ("items", "id", "1", None),
+            ("items", "id", "4", {"id": "4"}),
+            ("items", "id", "5", None),
+            ("new", "key", "a", {"key": "a"}),
+        ],
+    )
+    assert data == {
+        "items": [{"id": "2", "changed": True}, {"id": "3"}, {"id": "4"}],
+        "other": [],
+        "new": [{"key": "a"}],
+    }
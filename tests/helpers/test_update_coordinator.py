@@ -898,3 +898,73 @@ async def test_config_entry(hass: HomeAssistant) -> None:
         hass, _LOGGER, name="test", config_entry=another_entry
     )
     assert crd.config_entry is another_entry
+
+
+async def test_keyed_coordinator_only_updates_changed_keys(
+    hass: HomeAssistant,
+) -> None:
+    """Test keyed coordinator only calls listeners of keys which changed."""
+    mocked_data: dict[str, int] = {"a": 1, "b": 1}
+    mocked_exception: Exception | None = None
+
+    async def refresh() -> dict[str, int]:
+        if mocked_exception is not None:
+            raise mocked_exception
+        return dict(mocked_data)
+
+    crd = update_coordinator.KeyedDataUpdateCoordinator[str, int](
+        hass, _LOGGER, name="test", update_method=refresh
+    )
+    listener_a = Mock()
+    listener_b = Mock()
+    listener_c = Mock()
+    listener_all = Mock()
+    remove_callbacks = [
+        crd.async_add_listener(listener_a, "a"),
+        crd.async_add_listener(listener_b, "b"),
+        crd.async_add_listener(listener_c, "c"),
+        crd.async_add_listener(listener_all),
+    ]
+    listeners = (listener_a, listener_b, listener_c, listener_all)
+
+    # All listeners are called on the first update
+    await crd.async_refresh()
+    assert all(listener.call_count == 1 for listener in listeners)
+
+    mocked_data = {"a": 2, "b": 1}
+    await crd.async_refresh()
+    assert listener_a.call_count == 2
+    assert listener_b.call_count == 1
+    assert listener_c.call_count == 1
+    assert listener_all.call_count == 2
+
+    # Added and removed keys are changes
+    mocked_data = {"a": 2, "c": 1}
+    await crd.async_refresh()
+    assert listener_a.call_count == 2
+    assert listener_b.call_count == 2
+    assert listener_c.call_count == 2
+    assert listener_all.call_count == 3
+
+    # All listeners are called when the update fails and recovers
+    mocked_exception = aiohttp.ClientError("Client Failure")
+    await crd.async_refresh()
+    assert all(listener.call_count == 3 for listener in listeners[:3])
+    mocked_exception = None
+    await crd.async_refresh()
+    assert all(listener.call_count == 4 for listener in listeners[:3])
+
+    crd.async_set_updated_data({"a": 3, "c": 1})
+    assert listener_a.call_count == 5
+    assert listener_b.call_count == 4
+    assert listener_c.call_count == 4
+
+    for remove_callback in remove_callbacks:
+        remove_callback()
+
+    # The data changed without listeners, a new listener starts from it
+    crd.data = {"a": 4, "c": 1}
+    remove_listener = crd.async_add_listener(listener_a, "a")
+    crd.async_set_updated_data({"a": 3, "c": 1})
+    assert listener_a.call_count == 6
+    remove_listener()
@@ -31,6 +31,7 @@ from .common import (
     MockConfigEntry,
     MockModule,
     MockPlatform,
+    async_fire_time_changed,
     get_test_config_dir,
     mock_config_flow,
     mock_integration,
@@ -553,6 +554,37 @@ async def test_setup_after_deps_not_trigger_load(hass: HomeAssistant) -> None:
     assert "second_dep" in hass.config.components
 
 
+@pytest.mark.parametrize("load_registries", [False])
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_imported_modules_preloaded(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test modules imported during the last startup are preloaded and saved."""
+    hass_storage[bootstrap.IMPORTED_MODULES_STORAGE_KEY] = {
+        "version": bootstrap.IMPORTED_MODULES_STORAGE_VERSION,
+        "key": bootstrap.IMPORTED_MODULES_STORAGE_KEY,
+        "data": ["custom_components.test_package_loaded_executor.light"],
+    }
+
+    with patch("homeassistant.loader.async_preload_modules") as mock_preload:
+        await bootstrap._async_set_up_integrations(
+            hass, {"test_package_loaded_executor": {}}
+        )
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert "test_package_loaded_executor" in hass.config.components
+    _, integrations, module_names = mock_preload.mock_calls[0].args
+    assert "test_package_loaded_executor" in {
+        integration.domain for integration in integrations
+    }
+    assert module_names == ["custom_components.test_package_loaded_executor.light"]
+    assert (
+        "custom_components.test_package_loaded_executor"
+        in hass_storage[bootstrap.IMPORTED_MODULES_STORAGE_KEY]["data"]
+    )
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_after_deps_not_present(hass: HomeAssistant) -> None:
     """Test after_dependencies when referenced integration doesn't exist."""
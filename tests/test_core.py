@@ -1388,6 +1388,14 @@ def test_state_object_id() -> None:
     assert state.object_id == "hello"
 
 
+def test_state_numeric_state() -> None:
+    """Test numeric state."""
+    assert ha.State("sensor.hello", "21.5").numeric_state == 21.5
+    assert ha.State("sensor.hello", "-3").numeric_state == -3
+    assert ha.State("sensor.hello", "world").numeric_state is None
+    assert ha.State("sensor.hello", "unavailable").numeric_state is None
+
+
 def test_state_name_if_no_friendly_name_attr() -> None:
     """Test if there is no friendly name."""
     state = ha.State("domain.hello_world", "world")
@@ -2025,3 +2025,81 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_record_imported_modules(hass: HomeAssistant) -> None:
+    """Test the imported integration modules are recorded in order."""
+    integration = await loader.async_get_integration(
+        hass, "test_package_loaded_executor"
+    )
+    loader.async_record_imported_modules(hass)
+
+    await integration.async_get_component()
+    await integration.async_get_platform("light")
+
+    modules = loader.async_stop_recording_imported_modules(hass)
+    assert modules[0] == "custom_components.test_package_loaded_executor"
+    assert modules[-1] == "custom_components.test_package_loaded_executor.light"
+    assert loader.async_stop_recording_imported_modules(hass) == []
+
+    await integration.async_get_platform("switch")
+    assert loader.DATA_IMPORTED_MODULES not in hass.data
+
+
+async def test_preload_modules(hass: HomeAssistant) -> None:
+    """Test modules of integrations are preloaded in import executor jobs."""
+    integrations = [
+        loader.Integration(
+            hass,
+            f"homeassistant.components.{domain}",
+            None,
+            {"domain": domain, "import_executor": domain != "loop"},
+        )
+        for domain in ("one", "two", "loop", "three", "four", "five")
+    ]
+    with (
+        patch("homeassistant.loader._preload_modules") as mock_preload,
+        patch.object(
+            hass,
+            "async_add_import_executor_job",
+            wraps=hass.async_add_import_executor_job,
+        ) as mock_import_executor_job,
+    ):
+        await loader.async_preload_modules(
+            hass,
+            integrations,
+            [
+                "homeassistant.components.one",
+                "homeassistant.components.two",
+                "homeassistant.components.one.light",
+                "homeassistant.components.loop",
+                "homeassistant.components.removed",
+                "homeassistant.components.three",
+                "homeassistant.components.four",
+                "homeassistant.components.five.sensor",
+            ],
+        )
+
+    assert [call.args[0] for call in mock_preload.mock_calls] == [
+        ["homeassistant.components.one", "homeassistant.components.one.light"],
+        ["homeassistant.components.two"],
+        ["homeassistant.components.three"],
+        ["homeassistant.components.four"],
+        ["homeassistant.components.five.sensor"],
+    ]
+    assert mock_import_executor_job.call_count == 5
+
+
+def test_preload_modules_ignores_errors() -> None:
+    """Test failing to preload a module does not stop preloading."""
+    with patch(
+        "homeassistant.loader.importlib.import_module",
+        side_effect=[ImportError, None],
+    ) as mock_import:
+        loader._preload_modules(["does_not_exist", "sys", "also_loaded"])
+
+    assert [call.args[0] for call in mock_import.mock_calls] == [
+        "does_not_exist",
+        "also_loaded",
+    ]